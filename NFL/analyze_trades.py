@@ -16,65 +16,14 @@ from functools import lru_cache
 
 from common.fantasy_utils import (
     POSITION_WEIGHTS,
-    load_rankings,
-    load_rosters,
+    LeagueData,
+    get_league_data,
     get_player_score,
     select_starters,
-    calculate_team_power,
-    get_waiver_players
+    calculate_team_power
 )
 
 
-def player_would_start(player_name: str, roster: List[Dict], rankings: Dict[str, int], 
-                       waiver_players: Dict[str, List[Dict]] = None) -> bool:
-    """
-    Check if a player would make the starting lineup on a given roster.
-    Returns True if the player would be in the optimal starting 10.
-    """
-    starters, _ = select_starters(roster, rankings, waiver_players)
-    starter_names = {s['name'] for s in starters}
-    return player_name in starter_names
-
-
-def simulate_trade(team1_roster: List[Dict], team2_roster: List[Dict], 
-                   team1_gives: List[str], team2_gives: List[str],
-                   rankings: Dict[str, int], waiver_players: Dict[str, List[Dict]] = None) -> Tuple[float, float]:
-    """
-    Simulate a trade and return new power scores for both teams.
-    Returns (team1_new_power, team2_new_power)
-    
-    Optimized to avoid unnecessary deep copies - uses shallow references since
-    player dicts are not modified during power calculation.
-    """
-    # Create roster lookups for fast access
-    team1_dict = {p['name']: p for p in team1_roster}
-    team2_dict = {p['name']: p for p in team2_roster}
-    
-    # Build new rosters efficiently
-    team1_gives_set = set(team1_gives)
-    team2_gives_set = set(team2_gives)
-    
-    team1_new = [p for p in team1_roster if p['name'] not in team1_gives_set]
-    team2_new = [p for p in team2_roster if p['name'] not in team2_gives_set]
-    
-    # Add players being received (no need to deepcopy since we don't modify)
-    for player_name in team2_gives:
-        player = team2_dict.get(player_name)
-        if player:
-            team1_new.append(player)
-    
-    for player_name in team1_gives:
-        player = team1_dict.get(player_name)
-        if player:
-            team2_new.append(player)
-    
-    # Calculate new power scores
-    team1_power = calculate_team_power(team1_new, rankings, waiver_players)
-    team2_power = calculate_team_power(team2_new, rankings, waiver_players)
-    
-    return team1_power, team2_power
-
-
 def get_tradeable_players(roster: List[Dict], rankings: Dict[str, int], waiver_players: Dict[str, List[Dict]] = None) -> List[Dict]:
     """
     Get players that are reasonable to trade.
@@ -271,28 +220,36 @@ def check_position_downgrade(team_gives: List[str], other_gives: List[str],
     return True
 
 
-def find_trades_for_team(team_name: str, rosters: Dict[str, List[Dict]], rankings: Dict[str, int], waiver_players: Dict[str, List[Dict]]) -> List[Dict]:
+def find_trades_for_team(team_name: str, rosters: Dict[str, List[Dict]], rankings: Dict[str, int], waiver_players: Dict[str, List[Dict]],
+                         league: LeagueData = None) -> List[Dict]:
     """
     Find all beneficial trades for a specific team.
     Returns list of trade scenarios with power improvements.
     
+    rosters and rankings must come from league (by default the shared
+    get_league_data() snapshot), whose player ids the lineup states use.
+    
     Optimized version with:
     - Pre-computed starter sets to avoid repeated select_starters calls
     - Early termination for obviously bad trades
     - Reduced nested loop iterations
+    - Lineups after a trade evaluated incrementally from each team's
+      LineupState instead of rebuilding rosters and re-selecting starters
     """
+    if league is None:
+        league = get_league_data()
+    ids, names = league.ids, league.names
+    lineup_states = league.lineup_states(waiver_players)
+    
     team_roster = rosters[team_name]
-    team_current_power = calculate_team_power(team_roster, rankings, waiver_players)
+    team_state = lineup_states[team_name]
+    team_current_power = team_state.power
     
     all_trades = []
     seen_trades = set()  # Track unique trades to avoid duplicates
     
     # Pre-compute current starters for team (avoid recalculating)
-    team_starters, _ = select_starters(team_roster, rankings, waiver_players)
-    team_starter_names = {s['name'] for s in team_starters}
-    
-    # Convert rosters to dicts for O(1) player lookups
-    team_roster_dict = {p['name']: p for p in team_roster}
+    team_starter_names = {names[i] for _, i in team_state.lineup}
     
     # Pre-calculate tradeable players and their starter status
     team_tradeable = get_tradeable_players(team_roster, rankings, waiver_players)
@@ -304,17 +261,16 @@ def find_trades_for_team(team_name: str, rosters: Dict[str, List[Dict]], ranking
         if other_team_name == team_name:
             continue
         
-        other_team_current_power = calculate_team_power(other_team_roster, rankings, waiver_players)
+        other_state = lineup_states[other_team_name]
+        other_team_current_power = other_state.power
         
         # Pre-compute starters for other team
-        other_starters, _ = select_starters(other_team_roster, rankings, waiver_players)
-        other_starter_names = {s['name'] for s in other_starters}
+        other_starter_names = {names[i] for _, i in other_state.lineup}
         
         # Get tradeable players (excludes backup K/DST)
         other_tradeable = get_tradeable_players(other_team_roster, rankings, waiver_players)
         
         # Convert to dicts for faster lookups
-        other_roster_dict = {p['name']: p for p in other_team_roster}
         other_tradeable_dict = {p['name']: p for p in other_tradeable}
         other_tradeable_names = [p['name'] for p in other_tradeable]
         
@@ -407,25 +363,19 @@ def find_trades_for_team(team_name: str, rosters: Dict[str, List[Dict]], ranking
                     if not other_gives_would_start and not team_gives_would_start:
                         continue
                     
-                    # Filter to only players that would actually start (optimized check)
-                    team_new_roster_temp = [p for p in team_roster if p['name'] not in team_gives]
-                    for player_name in other_gives:
-                        player = other_roster_dict.get(player_name)
-                        if player:
-                            team_new_roster_temp.append(player)
-                    
+                    # Filter to only players that would actually start, from the
+                    # lineups each team would field after the full trade
+                    team_gives_ids = [ids[p] for p in team_gives]
+                    other_gives_ids = [ids[p] for p in other_gives]
+                    team_new_lineup, team_new_power = team_state.evaluate(team_gives_ids, other_gives_ids)
+                    team_new_starters = {i for _, i in team_new_lineup}
                     other_gives_filtered = tuple(sorted([p for p in other_gives 
-                                              if player_would_start(p, team_new_roster_temp, rankings, waiver_players)]))
-                    
-                    # Check other team's potential received players - build roster efficiently
-                    other_new_roster_temp = [p for p in other_team_roster if p['name'] not in other_gives]
-                    for player_name in team_gives:
-                        player = team_roster_dict.get(player_name)
-                        if player:
-                            other_new_roster_temp.append(player)
+                                              if ids[p] in team_new_starters]))
                     
+                    other_new_lineup, other_new_power = other_state.evaluate(other_gives_ids, team_gives_ids)
+                    other_new_starters = {i for _, i in other_new_lineup}
                     team_gives_filtered = tuple(sorted([p for p in team_gives 
-                                               if player_would_start(p, other_new_roster_temp, rankings, waiver_players)]))
+                                               if ids[p] in other_new_starters]))
                     
                     # Skip trade if either side is receiving only non-starters
                     if not other_gives_filtered or not team_gives_filtered:
@@ -455,12 +405,14 @@ def find_trades_for_team(team_name: str, rosters: Dict[str, List[Dict]], ranking
                         continue
                     seen_trades.add(trade_key)
                     
-                    # Simulate the trade with filtered player lists
-                    team_new_power, other_new_power = simulate_trade(
-                        team_roster, other_team_roster,
-                        list(team_gives_filtered), list(other_gives_filtered),
-                        rankings, waiver_players
-                    )
+                    # Simulate the trade with filtered player lists; if nobody was
+                    # filtered out, the powers of the full trade above stand
+                    if (len(team_gives_filtered) < len(team_gives) or
+                            len(other_gives_filtered) < len(other_gives)):
+                        team_filtered_ids = [ids[p] for p in team_gives_filtered]
+                        other_filtered_ids = [ids[p] for p in other_gives_filtered]
+                        _, team_new_power = team_state.evaluate(team_filtered_ids, other_filtered_ids)
+                        _, other_new_power = other_state.evaluate(other_filtered_ids, team_filtered_ids)
                     
                     # Check if both teams improve
                     team_improvement = team_new_power - team_current_power
@@ -524,7 +476,8 @@ def find_trades_for_team(team_name: str, rosters: Dict[str, List[Dict]], ranking
     return all_trades
 
 
-def find_all_trades(rosters: Dict[str, List[Dict]], rankings: Dict[str, int], waiver_players: Dict[str, List[Dict]]) -> Dict[str, List[Dict]]:
+def find_all_trades(rosters: Dict[str, List[Dict]], rankings: Dict[str, int], waiver_players: Dict[str, List[Dict]],
+                    league: LeagueData = None) -> Dict[str, List[Dict]]:
     """
     Find all beneficial trades for all teams.
     Returns dict of team_name -> list of top 5 trades.
@@ -533,7 +486,7 @@ def find_all_trades(rosters: Dict[str, List[Dict]], rankings: Dict[str, int], wa
     
     for team_name in rosters.keys():
         print(f"Analyzing trades for {team_name}...")
-        trades = find_trades_for_team(team_name, rosters, rankings, waiver_players)
+        trades = find_trades_for_team(team_name, rosters, rankings, waiver_players, league)
         all_team_trades[team_name] = trades[:5]  # Top 5 trades per team
         print(f"  Found {len(trades)} total trades, keeping top 5")
     
@@ -593,9 +546,14 @@ def main(team_name: str = "Dad Bod"):
     print("="*100)
     print("Finding win-win trades (3 or fewer players)...\n")
     
-    # Load data
-    rankings = load_rankings()
-    rosters = load_rosters()
+    # Load data once into the shared league snapshot
+    try:
+        league = get_league_data()
+    except FileNotFoundError as e:
+        print(f"Error: {e.filename} not found")
+        league = None
+    rankings = league.rankings_dict() if league else {}
+    rosters = league.rosters_dict() if league else {}
     
     if not rankings or not rosters:
         print("Error: Could not load required data files")
@@ -611,14 +569,14 @@ def main(team_name: str = "Dad Bod"):
     print(f"Loaded rosters for {len(rosters)} teams")
     
     # Get waiver wire players
-    waiver_players = get_waiver_players(rosters, rankings)
+    waiver_players = league.waiver_players()
     print(f"Found {sum(len(players) for players in waiver_players.values())} waiver wire players\n")
     
     # Analyze trades for specified team
     # To analyze trades for all teams, call find_all_trades() instead
     all_trades = {}
     print(f"Analyzing trades for {team_name}...")
-    trades = find_trades_for_team(team_name, rosters, rankings, waiver_players)
+    trades = find_trades_for_team(team_name, rosters, rankings, waiver_players, league)
     
     # Calculate max power for normalization (to scale to 100)
     all_team_powers = []
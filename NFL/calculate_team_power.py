@@ -17,10 +17,8 @@ from pathlib import Path
 from typing import Dict, List
 
 from common.fantasy_utils import (
-    load_rankings,
-    load_rosters,
-    select_starters,
-    get_waiver_players
+    get_league_data,
+    select_starters
 )
 
 
@@ -96,16 +94,21 @@ def main():
     print("NFL Fantasy Team Power Calculator")
     print("="*80)
     
-    # Load data
-    rankings = load_rankings()
-    rosters = load_rosters()
+    # Load data once into the shared league snapshot
+    try:
+        league = get_league_data()
+    except FileNotFoundError as e:
+        print(f"Error: {e.filename} not found")
+        league = None
+    rankings = league.rankings_dict() if league else {}
+    rosters = league.rosters_dict() if league else {}
     
     if not rankings or not rosters:
         print("Error: Could not load required data files")
         return
     
     # Get waiver wire players
-    waiver_players = get_waiver_players(rosters, rankings)
+    waiver_players = league.waiver_players()
     print(f"Found {sum(len(players) for players in waiver_players.values())} waiver wire players")
     
     # Calculate team power
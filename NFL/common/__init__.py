@@ -4,9 +4,19 @@ Common utilities for NFL fantasy football analysis.
 
 from .fantasy_utils import (
     POSITION_WEIGHTS,
+    RankingsData,
+    get_rankings_data,
+    LeagueData,
+    get_league_data,
     load_rankings,
     load_rosters,
     get_player_score,
+    get_score_table,
+    LINEUP_SLOTS,
+    WAIVER_FILL_POSITIONS,
+    position_buckets,
+    optimal_lineup,
+    LineupState,
     select_starters,
     calculate_team_power,
     get_waiver_players
@@ -14,9 +24,19 @@ from .fantasy_utils import (
 
 __all__ = [
     'POSITION_WEIGHTS',
+    'RankingsData',
+    'get_rankings_data',
+    'LeagueData',
+    'get_league_data',
     'load_rankings',
     'load_rosters',
     'get_player_score',
+    'get_score_table',
+    'LINEUP_SLOTS',
+    'WAIVER_FILL_POSITIONS',
+    'position_buckets',
+    'optimal_lineup',
+    'LineupState',
     'select_starters',
     'calculate_team_power',
     'get_waiver_players'
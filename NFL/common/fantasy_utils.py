@@ -4,8 +4,11 @@ Shared across multiple NFL analysis scripts.
 """
 
 import csv
+import os
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, List, Tuple
+from types import MappingProxyType
+from typing import Dict, Iterable, List, Mapping, Sequence, Tuple
 
 
 # Position weights based on importance
@@ -33,44 +36,32 @@ POSITION_DECAY_RATES = {
 # This ensures DST/K score relative to other DST/K, not the entire player pool
 _POSITION_RANK_OFFSETS = None
 
+# Row of each position in the precomputed score table
+POSITION_CODES = {position: code for code, position in enumerate(POSITION_WEIGHTS)}
+
+# Ranks covered by the score table (999 stands for unranked players);
+# higher ranks and unknown positions fall back to the score formula
+SCORE_TABLE_RANKS = 1000
+
+# Precomputed scores by [position code][rank], and the weights, decay rates
+# and rankings file state they were built from
+_SCORE_TABLE = None
+_SCORE_TABLE_KEY = None
+
 
 def _calculate_position_offsets(filename='nfl_rankings.csv') -> Dict[str, int]:
     """
     Calculate position-specific rank offsets based on the first occurrence of each position.
     This allows positions to score relative to other players at their position.
     QB, TE, DST, and K use offsets; RB and WR use absolute ranks for overall comparison.
+    The offsets are read from the shared rankings parse.
     """
-    script_dir = Path(__file__).parent.parent
-    rankings_file = script_dir / 'Data' / filename
-    
-    offsets = {}
-    first_rank_by_position = {}
-    
     try:
-        with open(rankings_file, 'r', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                position = row['position']
-                rank = int(row['rank'])
-                
-                # Track the first (lowest) rank for each position
-                if position not in first_rank_by_position:
-                    first_rank_by_position[position] = rank
-        
-        # Apply offsets to DST and K - these positions score relative to their position
-        # QB, RB, WR, and TE use absolute ranks to maintain cross-position comparison
-        for position, first_rank in first_rank_by_position.items():
-            if position in ['DST', 'K']:
-                offsets[position] = first_rank - 1
-            else:
-                offsets[position] = 0
-    
+        return dict(get_rankings_data(filename).position_offsets)
     except Exception as e:
         print(f"Error calculating position offsets: {e}")
         # Return default offsets if file can't be read
         return {'QB': 0, 'RB': 0, 'WR': 0, 'TE': 0, 'DST': 0, 'K': 0}
-    
-    return offsets
 
 
 def get_position_rank_offsets() -> Dict[str, int]:
@@ -81,86 +72,374 @@ def get_position_rank_offsets() -> Dict[str, int]:
     return _POSITION_RANK_OFFSETS
 
 
+# Rankings file whose state keys the score table
+_RANKINGS_PATH = str(Path(__file__).parent.parent / 'Data' / 'nfl_rankings.csv')
+
+
+def _rankings_file_state() -> Tuple[int, int]:
+    """Get the modification time and size of the rankings file, or None if missing."""
+    try:
+        stat = os.stat(_RANKINGS_PATH)
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+def get_score_table(check_file: bool = True) -> List[List[float]]:
+    """
+    Get the precomputed player score of every (position code, rank) pair.
+    
+    Row POSITION_CODES[position] holds get_player_score(rank, position) for
+    ranks 0 to SCORE_TABLE_RANKS - 1, so a score lookup is one index. The
+    table is rebuilt when POSITION_WEIGHTS or POSITION_DECAY_RATES differ
+    from the values it was built from, and the position offsets are
+    recalculated with it when the rankings file's mtime or size changes.
+    These checks run here, not on every get_player_score call: the file
+    whenever rankings or waiver players are loaded, the weights also once
+    per select_starters call.
+    
+    Args:
+        check_file: Also check the rankings file (one stat call).
+    """
+    global _SCORE_TABLE, _SCORE_TABLE_KEY, _POSITION_RANK_OFFSETS
+    if _SCORE_TABLE_KEY is not None and not check_file:
+        file_state = _SCORE_TABLE_KEY[2]
+    else:
+        file_state = _rankings_file_state()
+    if (_SCORE_TABLE_KEY is not None and _SCORE_TABLE_KEY[2] == file_state and
+            _SCORE_TABLE_KEY[0] == POSITION_WEIGHTS and
+            _SCORE_TABLE_KEY[1] == POSITION_DECAY_RATES):
+        return _SCORE_TABLE
+    
+    if _SCORE_TABLE_KEY is None or _SCORE_TABLE_KEY[2] != file_state:
+        _POSITION_RANK_OFFSETS = _calculate_position_offsets()
+    offsets = _POSITION_RANK_OFFSETS
+    _SCORE_TABLE = [[_calculate_player_score(rank, position, offsets)
+                     for rank in range(SCORE_TABLE_RANKS)]
+                    for position in POSITION_CODES]
+    _SCORE_TABLE_KEY = (dict(POSITION_WEIGHTS), dict(POSITION_DECAY_RATES), file_state)
+    return _SCORE_TABLE
+
+
 def load_rankings(filename='nfl_rankings.csv') -> Dict[str, int]:
     """Load player rankings from CSV. Returns dict of player_name -> rank."""
-    # Look for file in parent directory's Data folder (NFL/Data/)
-    script_dir = Path(__file__).parent.parent
-    rankings_file = script_dir / 'Data' / filename
-    
-    rankings = {}
+    # Rankings are parsed once and shared (NFL/Data/)
     try:
-        with open(rankings_file, 'r', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                name = row['name']
-                rank = int(row['rank'])
-                rankings[name] = rank
-        
-        return rankings
-    
-    except FileNotFoundError:
-        print(f"Error: {rankings_file} not found")
+        rankings = get_rankings_data(filename).rankings_dict()
+    except FileNotFoundError as e:
+        print(f"Error: {e.filename} not found")
         return {}
     except Exception as e:
         print(f"Error loading rankings: {e}")
         return {}
+    
+    get_score_table()
+    return rankings
 
 
 def load_rosters(filename='league_rosters.csv') -> Dict[str, List[Dict]]:
     """Load team rosters from CSV. Returns dict of team_name -> list of players."""
-    # Look for file in parent directory's Data folder (NFL/Data/)
-    script_dir = Path(__file__).parent.parent
-    rosters_file = script_dir / 'Data' / filename
-    
-    rosters = {}
+    # Rosters are parsed once into the shared league snapshot (NFL/Data/)
     try:
-        with open(rosters_file, 'r', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                team = row['team']
-                player = row['player']
-                position = row['position']
-                
-                if team not in rosters:
-                    rosters[team] = []
-                
-                rosters[team].append({
-                    'name': player,
-                    'position': position
-                })
-        
-        return rosters
-    
-    except FileNotFoundError:
-        print(f"Error: {rosters_file} not found")
+        return get_league_data(rosters_filename=filename).rosters_dict()
+    except FileNotFoundError as e:
+        print(f"Error: {e.filename} not found")
         return {}
     except Exception as e:
         print(f"Error loading rosters: {e}")
         return {}
 
 
-def get_player_score(rank: int, position: str) -> float:
+@dataclass(frozen=True)
+class RankingsData:
     """
-    Calculate player score based on rank and position weight.
-    Lower rank = higher score (rank 1 is best).
-    Uses exponential decay to emphasize elite players over average ones.
+    Immutable parse of the rankings CSV file.
     
-    Score formula:
-    - Base score uses exponential decay: 500 * (DECAY_RATE ^ adjusted_rank)
-    - For DST/K, we normalize their ranks (subtract position offset) so they score
-      relative to other DST/K, not the entire player pool
-    - This heavily rewards elite players (rank 1-20) vs average (rank 100+)
-    - Then multiply by position weight
+    Players are in file order; names, positions and ranks are tuples
+    indexed alike. Use get_rankings_data() to share one parse.
+    """
+    names: Tuple[str, ...]
+    positions: Tuple[str, ...]
+    ranks: Tuple[int, ...]
+    position_offsets: Mapping[str, int]
+    
+    @classmethod
+    def load(cls, rankings_file: str) -> 'RankingsData':
+        """
+        Parse the rankings CSV file.
+        
+        Raises:
+            FileNotFoundError: If the file is missing.
+        """
+        names = []
+        positions = []
+        ranks = []
+        first_rank_by_position = {}
+        with open(rankings_file, 'r', encoding='utf-8') as f:
+            for row in csv.DictReader(f):
+                position = row['position']
+                rank = int(row['rank'])
+                names.append(row['name'])
+                positions.append(position)
+                ranks.append(rank)
+                
+                # Track the first (lowest) rank for each position
+                if position not in first_rank_by_position:
+                    first_rank_by_position[position] = rank
+        
+        # DST and K score relative to their position; QB, RB, WR and TE use
+        # absolute ranks to maintain cross-position comparison
+        offsets = {position: first_rank - 1 if position in ['DST', 'K'] else 0
+                   for position, first_rank in first_rank_by_position.items()}
+        return cls(
+            names=tuple(names),
+            positions=tuple(positions),
+            ranks=tuple(ranks),
+            position_offsets=MappingProxyType(offsets)
+        )
+    
+    def rankings_dict(self) -> Dict[str, int]:
+        """Get player_name -> rank, as load_rankings returns."""
+        return dict(zip(self.names, self.ranks))
+
+
+def _file_state(path: str) -> Tuple[int, int]:
+    """Get the modification time and size of a file."""
+    stat = os.stat(path)
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+# Rankings parses by path, with the file state they were read at
+_RANKINGS_DATA = {}
+
+
+def get_rankings_data(rankings_filename='nfl_rankings.csv') -> RankingsData:
+    """
+    Get the shared RankingsData parse of a rankings file in NFL/Data/.
     
-    The exponential decay already captures player quality differences.
-    No additional slot multipliers needed - rank determines value.
+    The file is parsed on first use and again only when its mtime or size
+    changes. It does not depend on the rosters file.
+    
+    Raises:
+        FileNotFoundError: If the file is missing.
+    """
+    path = str(Path(__file__).parent.parent / 'Data' / rankings_filename)
+    state = _file_state(path)
+    cached = _RANKINGS_DATA.get(path)
+    if cached is not None and cached[0] == state:
+        return cached[1]
+    data = RankingsData.load(path)
+    _RANKINGS_DATA[path] = (state, data)
+    return data
+
+
+@dataclass(frozen=True)
+class LeagueData:
     """
+    Immutable snapshot of the player rankings and league rosters.
+    
+    Players are numbered by integer id: ranked players in rankings-file
+    order, then rostered players missing from the rankings (rank 0).
+    Per-player data is stored in tuples indexed by id. Each roster is a
+    tuple of ids plus a bitset with bit `id` set for each member, so
+    membership tests and roster unions are integer operations. A rostered
+    player takes the position from the rosters file, as load_rosters
+    returns it; the rankings keep their own positions for waiver players.
+    
+    Use get_league_data() to share one snapshot between scripts instead of
+    reading the CSV files again.
+    """
+    names: Tuple[str, ...]
+    positions: Tuple[str, ...]
+    position_codes: Tuple[int, ...]  # POSITION_CODES value, -1 if unknown
+    ranks: Tuple[int, ...]           # 0 if unranked
+    ids: Mapping[str, int]
+    ranked_count: int                # ids below this come from the rankings file
+    position_offsets: Mapping[str, int]
+    rankings: RankingsData
+    teams: Tuple[str, ...]
+    rosters: Tuple[Tuple[int, ...], ...]
+    roster_masks: Tuple[int, ...]
+    rostered_mask: int
+    
+    @classmethod
+    def load(cls, rankings_file: str, rosters_file: str) -> 'LeagueData':
+        """
+        Parse the rankings and rosters CSV files into a snapshot.
+        
+        Raises:
+            FileNotFoundError: If either file is missing.
+        """
+        return cls.from_rankings(RankingsData.load(rankings_file), rosters_file)
+    
+    @classmethod
+    def from_rankings(cls, rankings: RankingsData, rosters_file: str) -> 'LeagueData':
+        """
+        Parse the rosters CSV file into a snapshot over parsed rankings.
+        
+        Raises:
+            FileNotFoundError: If the rosters file is missing.
+        """
+        names = list(rankings.names)
+        positions = list(rankings.positions)
+        ranks = list(rankings.ranks)
+        ids = {name: player_id for player_id, name in enumerate(names)}
+        ranked_count = len(names)
+        
+        rosters = {}
+        with open(rosters_file, 'r', encoding='utf-8') as f:
+            for row in csv.DictReader(f):
+                name = row['player']
+                if name not in ids:
+                    ids[name] = len(names)
+                    names.append(name)
+                    positions.append(row['position'])
+                    ranks.append(0)
+                else:
+                    positions[ids[name]] = row['position']
+                rosters.setdefault(row['team'], []).append(ids[name])
+        
+        masks = []
+        for members in rosters.values():
+            mask = 0
+            for player_id in members:
+                mask |= 1 << player_id
+            masks.append(mask)
+        rostered_mask = 0
+        for mask in masks:
+            rostered_mask |= mask
+        
+        return cls(
+            names=tuple(names),
+            positions=tuple(positions),
+            position_codes=tuple(POSITION_CODES.get(p, -1) for p in positions),
+            ranks=tuple(ranks),
+            ids=MappingProxyType(ids),
+            ranked_count=ranked_count,
+            position_offsets=rankings.position_offsets,
+            rankings=rankings,
+            teams=tuple(rosters),
+            rosters=tuple(tuple(members) for members in rosters.values()),
+            roster_masks=tuple(masks),
+            rostered_mask=rostered_mask
+        )
+    
+    def rankings_dict(self) -> Dict[str, int]:
+        """Get player_name -> rank for the ranked players, as load_rankings returns."""
+        return {self.names[i]: self.ranks[i] for i in range(self.ranked_count)}
+    
+    def rosters_dict(self) -> Dict[str, List[Dict]]:
+        """Get team_name -> list of new player dicts, as load_rosters returns."""
+        return {team: [{'name': self.names[i], 'position': self.positions[i]}
+                       for i in members]
+                for team, members in zip(self.teams, self.rosters)}
+    
+    def waiver_players(self, rostered_mask: int = None) -> Dict[str, List[Dict]]:
+        """
+        Get the ranked players not on any roster, as get_waiver_players returns.
+        
+        Args:
+            rostered_mask: Bitset of rostered player ids; defaults to the
+                           rosters of the snapshot.
+        
+        Returns:
+            Dict of position -> list of available players, best first.
+        """
+        if rostered_mask is None:
+            rostered_mask = self.rostered_mask
+        return _group_waiver_players(
+            self.rankings, (player_id for player_id in range(self.ranked_count)
+                            if not rostered_mask >> player_id & 1))
+    
+    def lineup_states(self, waiver_players: Dict[str, List[Dict]] = None) -> Dict[str, 'LineupState']:
+        """
+        Build each team's LineupState over the snapshot's player ids.
+        
+        The states match select_starters for each roster, so
+        LineupState.evaluate gives the lineup and power of a traded roster
+        without rebuilding it.
+        
+        Args:
+            waiver_players: As for select_starters; the best DST and K fill
+                            empty slots.
+        
+        Returns:
+            Dict of team_name -> LineupState.
+        """
+        scores = [get_player_score(rank, position)
+                  for rank, position in zip(self.ranks, self.positions)]
+        waiver_ids = {position: self.ids[waiver_players[position][0]['name']]
+                      for position in WAIVER_FILL_POSITIONS
+                      if waiver_players and waiver_players.get(position)}
+        return {team: LineupState(members, self.positions, scores, waiver_ids)
+                for team, members in zip(self.teams, self.rosters)}
+
+
+# Snapshots by (rankings filename, rosters path), with the rosters file state
+# they were read at
+_LEAGUE_DATA = {}
+
+
+def _group_waiver_players(rankings: RankingsData,
+                          player_ids: Iterable[int]) -> Dict[str, List[Dict]]:
+    """
+    Group ranked players by their rankings position, best score first.
+    
+    Args:
+        rankings: Parsed rankings file.
+        player_ids: Indices into the rankings of the available players.
+    
+    Returns:
+        Dict of position -> list of player dicts, as get_waiver_players returns.
+    """
+    waiver_players = {}
+    for player_id in player_ids:
+        position = rankings.positions[player_id]
+        rank = rankings.ranks[player_id]
+        waiver_players.setdefault(position, []).append({
+            'name': rankings.names[player_id],
+            'position': position,
+            'rank': rank,
+            'score': get_player_score(rank, position)
+        })
+    
+    # Sort each position by score (highest first)
+    for position in waiver_players:
+        waiver_players[position].sort(key=lambda p: p['score'], reverse=True)
+    return waiver_players
+
+
+def get_league_data(rankings_filename='nfl_rankings.csv',
+                    rosters_filename='league_rosters.csv') -> LeagueData:
+    """
+    Get the shared LeagueData snapshot of the files in NFL/Data/.
+    
+    The rankings come from get_rankings_data(); the rosters are parsed on
+    first use and again only when the rosters file or the rankings parse
+    changes.
+    
+    Raises:
+        FileNotFoundError: If either file is missing.
+    """
+    rankings = get_rankings_data(rankings_filename)
+    path = str(Path(__file__).parent.parent / 'Data' / rosters_filename)
+    state = _file_state(path)
+    key = (rankings_filename, path)
+    cached = _LEAGUE_DATA.get(key)
+    if cached is not None and cached[0] == state and cached[1].rankings is rankings:
+        return cached[1]
+    data = LeagueData.from_rankings(rankings, path)
+    _LEAGUE_DATA[key] = (state, data)
+    return data
+
+
+def _calculate_player_score(rank: int, position: str, offsets: Dict[str, int]) -> float:
+    """Evaluate the score formula of get_player_score with the given rank offsets."""
     if rank == 0:
         return 0.0
     
     # Normalize rank for DST/K positions that start much later in overall rankings
     # This prevents the decay function from crushing their scores
-    offsets = get_position_rank_offsets()
     offset = offsets.get(position, 0)
     adjusted_rank = rank - offset
     
@@ -176,143 +455,325 @@ def get_player_score(rank: int, position: str) -> float:
     return score
 
 
+def get_player_score(rank: int, position: str) -> float:
+    """
+    Calculate player score based on rank and position weight.
+    Lower rank = higher score (rank 1 is best).
+    Uses exponential decay to emphasize elite players over average ones.
+    
+    Score formula:
+    - Base score uses exponential decay: 500 * (DECAY_RATE ^ adjusted_rank)
+    - For DST/K, we normalize their ranks (subtract position offset) so they score
+      relative to other DST/K, not the entire player pool
+    - This heavily rewards elite players (rank 1-20) vs average (rank 100+)
+    - Then multiply by position weight
+    
+    The exponential decay already captures player quality differences.
+    No additional slot multipliers needed - rank determines value.
+    
+    Scores are read from the precomputed table of get_score_table().
+    """
+    table = _SCORE_TABLE if _SCORE_TABLE is not None else get_score_table()
+    code = POSITION_CODES.get(position)
+    if code is not None and 0 <= rank < SCORE_TABLE_RANKS:
+        return table[code][rank]
+    return _calculate_player_score(rank, position, get_position_rank_offsets())
+
+
+# Starting lineup slots in fill order, with the positions each one accepts:
+# 1 QB, 2 RB, 2 WR, 1 TE, 1 W/R flex, 1 R/W/T flex, 1 DST, 1 K
+LINEUP_SLOTS = (
+    ('QB1', ('QB',)),
+    ('RB1', ('RB',)),
+    ('RB2', ('RB',)),
+    ('WR1', ('WR',)),
+    ('WR2', ('WR',)),
+    ('TE1', ('TE',)),
+    ('FLEX1', ('WR', 'RB')),
+    ('FLEX2', ('RB', 'WR', 'TE')),
+    ('DST', ('DST',)),
+    ('K', ('K',)),
+)
+
+# Positions filled with the best waiver player when a roster has nobody there
+WAIVER_FILL_POSITIONS = ('DST', 'K')
+
+# Single-position slots of each position, and the flex slots (those
+# accepting more than one position) as (slot, accepted positions)
+_POSITION_SLOTS = {position: [slot for slot, accepts in LINEUP_SLOTS if accepts == (position,)]
+                   for position in dict.fromkeys(accepts[0] for _, accepts in LINEUP_SLOTS
+                                                 if len(accepts) == 1)}
+_FLEX_SLOTS = [(slot, accepts) for slot, accepts in LINEUP_SLOTS if len(accepts) > 1]
+
+# Position -> [(taken, taken | slot bit, slot)]: DP transitions over bitmasks
+# of taken flex slots, one per flex slot the position may fill
+_FLEX_TRANSITIONS = {
+    position: sorted((taken, taken | 1 << k, slot)
+                     for taken in range(1 << len(_FLEX_SLOTS))
+                     for k, (slot, accepts) in enumerate(_FLEX_SLOTS)
+                     if position in accepts and not taken >> k & 1)
+    for position in dict.fromkeys(p for _, accepts in _FLEX_SLOTS for p in accepts)
+}
+
+# Position -> number of flex slots it may fill
+_FLEX_CAPACITY = {position: sum(position in accepts for _, accepts in _FLEX_SLOTS)
+                  for position in _FLEX_TRANSITIONS}
+
+# Positions that can start, flex positions first (equal-scored flex
+# candidates are considered in this order)
+_LINEUP_POSITIONS = tuple(dict.fromkeys(list(_FLEX_CAPACITY) + list(_POSITION_SLOTS)))
+
+# Position -> how many of its best players a lineup can ever use: its
+# single-position slots plus the flex slots it may fill
+_LINEUP_DEPTH = {position: len(_POSITION_SLOTS.get(position, ())) + _FLEX_CAPACITY.get(position, 0)
+                 for position in _LINEUP_POSITIONS}
+
+
+def position_buckets(player_ids: Iterable[int], positions: Sequence[str],
+                     scores: Sequence[float]) -> Dict[str, List[int]]:
+    """
+    Group player ids by position, each group sorted by score (highest first).
+    Players with equal scores keep the order of player_ids.
+    """
+    buckets = {}
+    for player_id in player_ids:
+        buckets.setdefault(positions[player_id], []).append(player_id)
+    for bucket in buckets.values():
+        bucket.sort(key=scores.__getitem__, reverse=True)
+    return buckets
+
+
+def _fill_position(position: str, bucket: Sequence[int],
+                   waiver_id: int = None) -> Tuple[List[Tuple[str, int]], List[int]]:
+    """
+    Fill a position's single-position slots from its sorted bucket.
+    
+    Returns the (slot, player_id) assignments, with waiver_id in the first
+    slot left empty, and the position's flex candidates: as many leftovers
+    as it has flex slots, since more could never start.
+    
+    Like the original select_starters, the k-th slot of a position (from 0)
+    is only filled while the position has more than 2k players, so a
+    second RB/WR slot needs at least three players and the second of
+    exactly two goes to the flex candidates.
+    """
+    slots = _POSITION_SLOTS.get(position, ())
+    used = sum(1 for k in range(len(slots)) if k < len(bucket) - k)
+    assigned = list(zip(slots, bucket[:used]))
+    if waiver_id is not None and len(assigned) < len(slots):
+        assigned.append((slots[len(assigned)], waiver_id))
+    return assigned, list(bucket[used:used + _FLEX_CAPACITY.get(position, 0)])
+
+
+def _fill_flex(candidates: List[int], scores: Sequence[float],
+               positions: Sequence[str]) -> Tuple[Tuple[str, int], ...]:
+    """Assign flex candidates to the flex slots for the highest total (see optimal_lineup)."""
+    candidates.sort(key=scores.__getitem__, reverse=True)
+    
+    # totals[taken] is the best score of the flex slots in bitmask taken,
+    # picks[taken] the (slot, player_id) pairs reaching it. Each candidate
+    # extends the states from before it; only strict improvements replace
+    # an entry, so ties go to the better (or earlier) candidate in the
+    # earlier slot
+    totals = [None] * (1 << len(_FLEX_SLOTS))
+    picks = [()] * len(totals)
+    totals[0] = 0.0
+    for player_id in candidates:
+        score = scores[player_id]
+        previous = totals[:]
+        previous_picks = picks[:]
+        for taken, target, slot in _FLEX_TRANSITIONS[positions[player_id]]:
+            total = previous[taken]
+            if total is not None:
+                total += score
+                if totals[target] is None or total > totals[target]:
+                    totals[target] = total
+                    picks[target] = previous_picks[taken] + ((slot, player_id),)
+    best = 0
+    for taken, total in enumerate(totals):
+        if total is not None and (total > totals[best] or
+                                  total == totals[best] and len(picks[taken]) > len(picks[best])):
+            best = taken
+    return picks[best]
+
+
+def _combine_fills(fills: Iterable[Tuple[List[Tuple[str, int]], List[int]]],
+                   scores: Sequence[float],
+                   positions: Sequence[str]) -> Tuple[List[Tuple[str, int]], float]:
+    """Fill the flex slots from per-position fills and total the lineup."""
+    filled = {}
+    candidates = []
+    for assigned, position_candidates in fills:
+        filled.update(assigned)
+        candidates.extend(position_candidates)
+    filled.update(_fill_flex(candidates, scores, positions))
+    
+    # Sum in slot order so the total does not depend on the fill order
+    lineup = [(slot, filled[slot]) for slot, _ in LINEUP_SLOTS if slot in filled]
+    total = 0.0
+    for _, player_id in lineup:
+        total += scores[player_id]
+    return lineup, total
+
+
+def optimal_lineup(buckets: Mapping[str, Sequence[int]], scores: Sequence[float],
+                   positions: Sequence[str],
+                   waiver_ids: Mapping[str, int] = None) -> Tuple[List[Tuple[str, int]], float]:
+    """
+    Fill LINEUP_SLOTS with the highest-scoring lineup. Pure: nothing passed
+    in is modified.
+    
+    The single-position slots take the best players of their position in
+    one pass over the position buckets. The flex slots are then filled by
+    a DP over which flex slots are taken: a position that may fill c flex
+    slots only has its best c leftovers as candidates, and each candidate,
+    best first, either sits or takes a free slot it is eligible for.
+    Keeping the best total for every set of taken slots makes the result
+    optimal for any flex layout, not just ones where filling flex slots
+    greedily happens to work.
+    
+    Args:
+        buckets: Position -> player ids sorted by score, from position_buckets.
+        scores: Score of each player id.
+        positions: Position of each player id.
+        waiver_ids: Position -> id of the best waiver player, used to fill
+                    the WAIVER_FILL_POSITIONS when a bucket runs out.
+    
+    Returns:
+        Tuple of ([(slot, player_id)] in LINEUP_SLOTS order, total score).
+    """
+    fills = [_fill_position(position, buckets.get(position, ()),
+                            _waiver_id(waiver_ids, position))
+             for position in _LINEUP_POSITIONS]
+    return _combine_fills(fills, scores, positions)
+
+
+def _waiver_id(waiver_ids: Mapping[str, int], position: str) -> int:
+    """Get the waiver player id that may fill a position, or None."""
+    if waiver_ids and position in WAIVER_FILL_POSITIONS:
+        return waiver_ids.get(position)
+    return None
+
+
+class LineupState:
+    """
+    A roster's optimal lineup, kept as per-position sorted player ids and
+    per-position slot fills so trades can be evaluated without rebuilding
+    the roster.
+    
+    evaluate() re-fills only the positions a trade changes, from the first
+    _LINEUP_DEPTH ids of each, then redoes the constant-size flex DP. A
+    k-player trade costs O(k) however long the roster is. The state itself
+    is never modified.
+    """
+    
+    def __init__(self, player_ids: Iterable[int], positions: Sequence[str],
+                 scores: Sequence[float], waiver_ids: Mapping[str, int] = None):
+        """
+        Sort the roster into position buckets and fill its lineup.
+        
+        Args:
+            player_ids: Ids of the rostered players, in roster order.
+            positions: Position of every player id.
+            scores: Score of every player id.
+            waiver_ids: As for optimal_lineup.
+        """
+        self.positions = positions
+        self.scores = scores
+        self.waiver_ids = {position: _waiver_id(waiver_ids, position)
+                           for position in _LINEUP_POSITIONS}
+        self.buckets = position_buckets(player_ids, positions, scores)
+        self.fills = {position: _fill_position(position, self.buckets.get(position, ()),
+                                               self.waiver_ids[position])
+                      for position in _LINEUP_POSITIONS}
+        self.lineup, self.power = _combine_fills(self.fills.values(), scores, positions)
+    
+    def evaluate(self, removed: Iterable[int] = (),
+                 added: Iterable[int] = ()) -> Tuple[List[Tuple[str, int]], float]:
+        """
+        Get the lineup and power after removing and adding players.
+        
+        The result equals optimal_lineup over the roster with removed taken
+        out and added appended in the given order, as select_starters
+        would compute for that roster.
+        
+        Args:
+            removed: Ids of rostered players leaving the roster.
+            added: Ids of players joining the roster.
+        
+        Returns:
+            Tuple of ([(slot, player_id)] in LINEUP_SLOTS order, total score).
+        """
+        removed = set(removed)
+        added = list(added)
+        touched = {self.positions[i] for i in removed}
+        touched.update(self.positions[i] for i in added)
+        touched.intersection_update(_LINEUP_DEPTH)
+        if not touched:
+            return self.lineup, self.power
+        
+        fills = dict(self.fills)
+        for position in touched:
+            fills[position] = _fill_position(position, self._merge(position, removed, added),
+                                             self.waiver_ids[position])
+        return _combine_fills(fills.values(), self.scores, self.positions)
+    
+    def _merge(self, position: str, removed: set, added: List[int]) -> List[int]:
+        """
+        Get the first _LINEUP_DEPTH ids of a position's bucket after a trade.
+        
+        Rostered players come before added players with the same score,
+        matching the stable sort of position_buckets.
+        """
+        depth = _LINEUP_DEPTH[position]
+        bucket = self.buckets.get(position, ())
+        kept = [i for i in bucket[:depth + len(removed)] if i not in removed]
+        kept.extend(i for i in added if self.positions[i] == position)
+        if len(kept) > 1:
+            kept.sort(key=self.scores.__getitem__, reverse=True)
+        return kept[:depth]
+
+
 def select_starters(roster: List[Dict], rankings: Dict[str, int], waiver_players: Dict[str, List[Dict]] = None) -> Tuple[List[Dict], float]:
     """
     Select the best starters from a roster based on league positions.
-    If waiver_players provided, fills empty positions with best available free agents.
+    If waiver_players provided, fills empty DST/K slots with the best available free agents.
     Returns list of selected starters and total team power score.
     
     League positions: 1 QB, 2 RB, 2 WR, 1 TE, 1 W/R flex, 1 R/W/T flex, 1 DST, 1 K
     
-    Now applies starter slot multipliers to differentiate elite starters from depth.
+    The roster is not modified: each starter is a new dict with the player's
+    fields plus 'rank', 'base_score', 'slot' and 'score'. The lineup itself
+    comes from optimal_lineup, with roster indices as player ids.
     """
-    # Add rankings to each player (base score without slot multiplier)
-    for player in roster:
-        player['rank'] = rankings.get(player['name'], 0)
-        player['base_score'] = get_player_score(player['rank'], player['position'])
-    
-    # Sort players by base score (highest first)
-    sorted_roster = sorted(roster, key=lambda p: p['base_score'], reverse=True)
-    
-    # Group players by position
-    by_position = {}
-    for player in sorted_roster:
-        pos = player['position']
-        if pos not in by_position:
-            by_position[pos] = []
-        by_position[pos].append(player)
+    # Rebuild the score table if the weights changed
+    get_score_table(check_file=False)
     
-    starters = []
-    total_score = 0.0
-    
-    # Select QB
-    if 'QB' in by_position and by_position['QB']:
-        qb = by_position['QB'][0]
-        qb['slot'] = 'QB1'
-        qb['score'] = get_player_score(qb['rank'], qb['position'])
-        starters.append(qb)
-        total_score += qb['score']
-        by_position['QB'].pop(0)
-    
-    # Select 2 RBs
-    if 'RB' in by_position:
-        for i, slot in enumerate(['RB1', 'RB2']):
-            if i < len(by_position['RB']):
-                rb = by_position['RB'][0]
-                rb['slot'] = slot
-                rb['score'] = get_player_score(rb['rank'], rb['position'])
-                starters.append(rb)
-                total_score += rb['score']
-                by_position['RB'].pop(0)
-    
-    # Select 2 WRs
-    if 'WR' in by_position:
-        for i, slot in enumerate(['WR1', 'WR2']):
-            if i < len(by_position['WR']):
-                wr = by_position['WR'][0]
-                wr['slot'] = slot
-                wr['score'] = get_player_score(wr['rank'], wr['position'])
-                starters.append(wr)
-                total_score += wr['score']
-                by_position['WR'].pop(0)
-    
-    # Select 1 TE
-    if 'TE' in by_position and by_position['TE']:
-        te = by_position['TE'][0]
-        te['slot'] = 'TE1'
-        te['score'] = get_player_score(te['rank'], te['position'])
-        starters.append(te)
-        total_score += te['score']
-        by_position['TE'].pop(0)
-    
-    # Select W/R flex (best remaining WR or RB)
-    flex_wr_candidates = []
-    if 'WR' in by_position:
-        flex_wr_candidates.extend(by_position['WR'])
-    if 'RB' in by_position:
-        flex_wr_candidates.extend(by_position['RB'])
-    
-    if flex_wr_candidates:
-        flex_wr_candidates.sort(key=lambda p: p['base_score'], reverse=True)
-        flex_wr = flex_wr_candidates[0]
-        flex_wr['slot'] = 'FLEX1'
-        flex_wr['score'] = get_player_score(flex_wr['rank'], flex_wr['position'])
-        starters.append(flex_wr)
-        total_score += flex_wr['score']
-        
-        # Remove from original position list
-        if flex_wr in by_position.get('WR', []):
-            by_position['WR'].remove(flex_wr)
-        elif flex_wr in by_position.get('RB', []):
-            by_position['RB'].remove(flex_wr)
-    
-    # Select R/W/T flex (best remaining RB, WR, or TE)
-    flex_flex_candidates = []
-    if 'RB' in by_position:
-        flex_flex_candidates.extend(by_position['RB'])
-    if 'WR' in by_position:
-        flex_flex_candidates.extend(by_position['WR'])
-    if 'TE' in by_position:
-        flex_flex_candidates.extend(by_position['TE'])
-    
-    if flex_flex_candidates:
-        flex_flex_candidates.sort(key=lambda p: p['base_score'], reverse=True)
-        flex_flex = flex_flex_candidates[0]
-        flex_flex['slot'] = 'FLEX2'
-        flex_flex['score'] = get_player_score(flex_flex['rank'], flex_flex['position'])
-        starters.append(flex_flex)
-        total_score += flex_flex['score']
-    
-    # Select DST
-    if 'DST' in by_position and by_position['DST']:
-        dst = by_position['DST'][0]
-        dst['slot'] = 'DST'
-        dst['score'] = get_player_score(dst['rank'], dst['position'])
-        starters.append(dst)
-        total_score += dst['score']
-    elif waiver_players and 'DST' in waiver_players and waiver_players['DST']:
-        # Fill with best waiver DST
-        dst = waiver_players['DST'][0].copy()
-        dst['slot'] = 'DST'
-        dst['score'] = get_player_score(dst['rank'], dst['position'])
-        starters.append(dst)
-        total_score += dst['score']
-    
-    # Select K
-    if 'K' in by_position and by_position['K']:
-        k = by_position['K'][0]
-        k['slot'] = 'K'
-        k['score'] = get_player_score(k['rank'], k['position'])
-        starters.append(k)
-        total_score += k['score']
-    elif waiver_players and 'K' in waiver_players and waiver_players['K']:
-        # Fill with best waiver K
-        k = waiver_players['K'][0].copy()
-        k['slot'] = 'K'
-        k['score'] = get_player_score(k['rank'], k['position'])
-        starters.append(k)
-        total_score += k['score']
+    positions = [player['position'] for player in roster]
+    ranks = [rankings.get(player['name'], 0) for player in roster]
+    scores = [get_player_score(rank, position) for rank, position in zip(ranks, positions)]
+    
+    # Best waiver players get the ids after the roster's
+    waiver_ids = {}
+    for position in WAIVER_FILL_POSITIONS:
+        if waiver_players and waiver_players.get(position):
+            waiver = waiver_players[position][0]
+            waiver_ids[position] = len(positions)
+            positions.append(position)
+            scores.append(get_player_score(waiver['rank'], waiver['position']))
+    
+    buckets = position_buckets(range(len(roster)), positions, scores)
+    lineup, total_score = optimal_lineup(buckets, scores, positions, waiver_ids)
     
+    starters = []
+    for slot, player_id in lineup:
+        score = scores[player_id]
+        if player_id < len(roster):
+            starters.append({**roster[player_id], 'rank': ranks[player_id],
+                             'base_score': score, 'slot': slot, 'score': score})
+        else:
+            starters.append({**waiver_players[positions[player_id]][0],
+                             'slot': slot, 'score': score})
     return starters, total_score
 
 
@@ -336,36 +797,15 @@ def get_waiver_players(rosters: Dict[str, List[Dict]], rankings: Dict[str, int])
         for player in roster:
             rostered_names.add(player['name'])
     
-    # Look for rankings file in parent directory's Data folder (NFL/Data/)
-    script_dir = Path(__file__).parent.parent
-    rankings_file = script_dir / 'Data' / 'nfl_rankings.csv'
-    
-    waiver_players = {}
+    # Ranked players come from the shared rankings parse (NFL/Data/); the
+    # rosters file is not needed
     try:
-        with open(rankings_file, 'r', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                name = row['name']
-                if name not in rostered_names:
-                    position = row['position']
-                    rank = int(row['rank'])
-                    
-                    if position not in waiver_players:
-                        waiver_players[position] = []
-                    
-                    waiver_players[position].append({
-                        'name': name,
-                        'position': position,
-                        'rank': rank,
-                        'score': get_player_score(rank, position)
-                    })
-        
-        # Sort each position by score (highest first)
-        for position in waiver_players:
-            waiver_players[position].sort(key=lambda p: p['score'], reverse=True)
-    
+        rankings_data = get_rankings_data()
     except Exception as e:
         print(f"Error loading waiver players: {e}")
         return {}
+    get_score_table()
     
-    return waiver_players
+    return _group_waiver_players(
+        rankings_data, (player_id for player_id, name in enumerate(rankings_data.names)
+                        if name not in rostered_names))
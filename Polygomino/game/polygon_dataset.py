@@ -0,0 +1,265 @@
+"""
+Polygon dataset loading, eagerly or lazily through an offset index.
+
+The lazy backend scans the JSON file once for the byte range of every
+entry in its "polygons" array and stores the ranges in a sidecar index
+file, so later runs start without reading the dataset at all. Polygons
+are parsed on demand and kept in a small LRU cache.
+"""
+
+import json
+import os
+import re
+import sys
+import threading
+from collections import OrderedDict
+from typing import Iterator
+
+# Add parent directory to path for geometry imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from geometry import Polygon, Point
+
+
+# Suffix of the sidecar offset index written next to a dataset
+INDEX_SUFFIX = '.idx'
+
+# Number of parsed polygons kept in memory by LazyPolygonDataset
+DATASET_CACHE_SIZE = 64
+
+# JSON whitespace between tokens
+_WHITESPACE = re.compile(r'[ \t\n\r]*')
+
+
+def polygon_from_dict(polygon_data: dict) -> dict:
+    """
+    Build the viewer's polygon entry from one dataset record.
+    
+    Args:
+        polygon_data: A record from the dataset's "polygons" array.
+    
+    Returns:
+        Dictionary with 'id', 'num_vertices', 'polygon', 'coords' and
+        'test_points' (each a dict with 'point' and 'location').
+    """
+    # Create polygon from vertices
+    vertices = polygon_data['vertices']
+    coords = [[v['x'], v['y']] for v in vertices]
+    polygon = Polygon.from_list(coords)
+    
+    # Load test points
+    test_points = []
+    for tp in polygon_data.get('test_points', []):
+        test_points.append({
+            'point': Point(tp['x'], tp['y']),
+            'location': tp['location']
+        })
+    
+    return {
+        'id': polygon_data['id'],
+        'num_vertices': polygon.num_vertices,
+        'polygon': polygon,
+        'coords': coords,
+        'test_points': test_points
+    }
+
+
+def polygon_stats(polygon: Polygon) -> dict:
+    """
+    Compute the per-polygon statistics used for sorting and filtering.
+    
+    Args:
+        polygon: The polygon to describe.
+    
+    Returns:
+        Dictionary with 'vertices', 'area' and 'convex'.
+    """
+    return {
+        'vertices': polygon.num_vertices,
+        'area': polygon.area(),
+        'convex': polygon.is_convex(),
+    }
+
+
+def iter_polygon_stats(polygons) -> Iterator[dict]:
+    """
+    Yield polygon_stats for every polygon of a dataset, in order.
+    
+    Lazy datasets are read record by record without building test
+    points or caching entries, so a full pass does not evict the
+    polygons being viewed.
+    
+    Args:
+        polygons: A LazyPolygonDataset or a list from load_polygons_from_json.
+    
+    Yields:
+        polygon_stats dictionaries with an added 'id'.
+    """
+    if isinstance(polygons, LazyPolygonDataset):
+        for record in polygons.iter_records():
+            coords = [[v['x'], v['y']] for v in record['vertices']]
+            stats = polygon_stats(Polygon.from_list(coords))
+            stats['id'] = record['id']
+            yield stats
+    else:
+        for entry in polygons:
+            stats = polygon_stats(entry['polygon'])
+            stats['id'] = entry['id']
+            yield stats
+
+
+def scan_polygon_offsets(filepath: str) -> list:
+    """
+    Find the byte range of every record in a dataset's "polygons" array.
+    
+    Each value is skipped with the C JSON scanner, which is several times
+    faster than building the polygons. The file is decoded as Latin-1 so
+    that character offsets equal byte offsets.
+    
+    Args:
+        filepath: Path to the JSON dataset.
+    
+    Returns:
+        List of (start, end) byte offsets, one per polygon.
+    
+    Raises:
+        ValueError: If the file is not a JSON object.
+    """
+    with open(filepath, 'rb') as f:
+        text = f.read().decode('latin-1')
+    decoder = json.JSONDecoder()
+    
+    def skip(i: int) -> int:
+        return _WHITESPACE.match(text, i).end()
+    
+    def expect(i: int, char: str) -> int:
+        if text[i:i + 1] != char:
+            raise ValueError(f"Expected '{char}' at offset {i} in {filepath}")
+        return skip(i + 1)
+    
+    offsets = []
+    i = expect(skip(0), '{')
+    while text[i:i + 1] != '}':
+        key, i = decoder.raw_decode(text, i)
+        i = expect(skip(i), ':')
+        if key == 'polygons':
+            i = expect(i, '[')
+            while text[i:i + 1] != ']':
+                _, end = decoder.raw_decode(text, i)
+                offsets.append((i, end))
+                i = skip(end)
+                if text[i:i + 1] == ',':
+                    i = skip(i + 1)
+            i = skip(i + 1)
+        else:
+            _, i = decoder.raw_decode(text, skip(i))
+            i = skip(i)
+        if text[i:i + 1] == ',':
+            i = skip(i + 1)
+    
+    return offsets
+
+
+def load_polygon_offsets(filepath: str) -> list:
+    """
+    Get the polygon offsets of a dataset, using the sidecar index if current.
+    
+    The index is rebuilt when the dataset's size or modification time
+    changes. Failing to write the index (e.g. a read-only directory) is
+    not an error.
+    
+    Args:
+        filepath: Path to the JSON dataset.
+    
+    Returns:
+        List of (start, end) byte offsets, one per polygon.
+    """
+    stat = os.stat(filepath)
+    index_path = filepath + INDEX_SUFFIX
+    
+    try:
+        with open(index_path, 'r') as f:
+            index = json.load(f)
+        if index['size'] == stat.st_size and index['mtime_ns'] == stat.st_mtime_ns:
+            return [tuple(entry) for entry in index['offsets']]
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+    
+    offsets = scan_polygon_offsets(filepath)
+    try:
+        with open(index_path, 'w') as f:
+            json.dump({'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns,
+                       'offsets': offsets}, f)
+    except OSError:
+        pass
+    return offsets
+
+
+class LazyPolygonDataset:
+    """
+    Read-only sequence of polygon entries parsed on demand.
+    
+    Behaves like the list returned by load_polygons_from_json: len(),
+    indexing and iteration work as usual. Entries are parsed from their
+    byte range on first access. Access is thread-safe, so a background
+    thread can prefetch neighbours of the current polygon.
+    """
+    
+    def __init__(self, filepath: str, cache_size: int = DATASET_CACHE_SIZE):
+        """
+        Open a dataset and load (or build) its offset index.
+        
+        Args:
+            filepath: Path to the JSON dataset.
+            cache_size: Number of parsed polygons kept in memory.
+        """
+        self.filepath = filepath
+        self.offsets = load_polygon_offsets(filepath)
+        self.cache_size = cache_size
+        self._cache = OrderedDict()
+        self._lock = threading.Lock()
+        self._file = open(filepath, 'rb')
+    
+    def __repr__(self) -> str:
+        return f"LazyPolygonDataset({len(self.offsets)} polygons)"
+    
+    def __len__(self) -> int:
+        return len(self.offsets)
+    
+    def __getitem__(self, index: int) -> dict:
+        if index < 0:
+            index += len(self.offsets)
+        if not 0 <= index < len(self.offsets):
+            raise IndexError("polygon index out of range")
+        
+        with self._lock:
+            if index in self._cache:
+                self._cache.move_to_end(index)
+                return self._cache[index]
+            start, end = self.offsets[index]
+            self._file.seek(start)
+            raw = self._file.read(end - start)
+        
+        entry = polygon_from_dict(json.loads(raw))
+        
+        with self._lock:
+            self._cache[index] = entry
+            if len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return entry
+    
+    def iter_records(self) -> Iterator[dict]:
+        """
+        Yield the raw dataset record of every polygon, in order.
+        
+        Records are decoded JSON dictionaries; nothing is cached.
+        """
+        for start, end in self.offsets:
+            with self._lock:
+                self._file.seek(start)
+                raw = self._file.read(end - start)
+            yield json.loads(raw)
+    
+    def close(self):
+        """Close the underlying dataset file."""
+        self._file.close()
@@ -10,11 +10,17 @@ import sys
 import os
 import json
 import random
+import threading
+import functools
+import math
+from collections import OrderedDict
 
 # Add parent directory to path for geometry imports
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from geometry import Polygon, Point
+from geometry import Polygon, Point, classify_grid
+from game.polygon_dataset import (LazyPolygonDataset, iter_polygon_stats,
+                                  polygon_from_dict)
 
 
 # ============================================================================
@@ -52,6 +58,83 @@ BUTTON_WIDTH = 120
 BUTTON_HEIGHT = 50
 BUTTON_MARGIN = 20
 
+# Layout of the cached panels
+INFO_RECT = pygame.Rect(20, 20, 300, 140)
+LEGEND_SIZE = (170, 95)
+PLOT_MARGIN = VERTEX_RADIUS + EDGE_WIDTH + 2
+
+# Number of polygons whose rendered layers are kept in memory
+LAYER_CACHE_SIZE = 16
+
+# Neighbours on each side of the current polygon rendered in the background
+PREFETCH_RADIUS = 2
+
+# Camera zoom limits relative to the home view, and the zoom per wheel step
+MIN_ZOOM = 0.25
+MAX_ZOOM = 1000.0
+ZOOM_STEP = 1.25
+
+# Level of detail: the finest merge grid in world units, the largest grid
+# cell in pixels whose vertices are merged, and vertices per culling chunk
+LOD_MIN_CELL = 1 / 64
+LOD_PIXEL_SIZE = 1.0
+LOD_CHUNK_SIZE = 64
+
+# Polygons with more vertices than this use the level of detail renderer
+# even in the home view; vertex markers are skipped when more are in view
+LOD_MIN_VERTICES = 500
+MAX_VERTEX_MARKERS = 500
+
+# Integer grid classified by the hover readout and heatmap overlay
+GRID_MIN = -100
+GRID_MAX = 100
+HOVER_RECT = pygame.Rect(20, 170, 300, 64)
+HOVER_MARKER_RADIUS = TEST_POINT_RADIUS + 2
+COLOR_NEAREST_EDGE = (255, 140, 60)
+NEAREST_EDGE_WIDTH = EDGE_WIDTH + 2
+HEATMAP_ALPHA = 90
+
+# Line of sight overlay: the region visible from the mouse position
+COLOR_SIGHT = (255, 240, 160, 70)
+
+# Visibility polygons kept per polygon and viewpoint
+SIGHT_CACHE_SIZE = 64
+
+# Posted by the line of sight thread when a visibility polygon is ready
+SIGHT_READY_EVENT = pygame.USEREVENT + 1
+
+# Zoomed-in heatmaps fill each visible cell when there are at most this many
+HEATMAP_MAX_CELL_FILLS = 4096
+
+# Gallery mode
+THUMB_SIZE = 96
+THUMB_GAP = 8
+THUMB_PADDING = 6
+GALLERY_HEADER_HEIGHT = 50
+GALLERY_ATLAS_TILES = 512
+ATLAS_MAX_WIDTH = 2048
+GALLERY_WORK_BUDGET_MS = 8
+
+# Gallery sort keys: (label, stats key or None for dataset order)
+GALLERY_SORT_KEYS = [
+    ("Dataset", None),
+    ("Vertices", 'vertices'),
+    ("Area", 'area'),
+    ("Convexity", 'convex'),
+]
+
+# Gallery filters: (label, predicate(stats, medians) or None for all);
+# medians of vertex count and area are taken over the whole dataset
+GALLERY_FILTERS = [
+    ("All", None),
+    ("Convex", lambda s, m: s['convex']),
+    ("Non-convex", lambda s, m: not s['convex']),
+    ("Few vertices", lambda s, m: s['vertices'] < m['vertices']),
+    ("Many vertices", lambda s, m: s['vertices'] >= m['vertices']),
+    ("Small area", lambda s, m: s['area'] < m['area']),
+    ("Large area", lambda s, m: s['area'] >= m['area']),
+]
+
 
 # ============================================================================
 # UI Components
@@ -65,9 +148,11 @@ class Button:
         self.text = text
         self.hovered = False
         self.font = None
+        self.text_surface = None
     
     def set_font(self, font: pygame.font.Font):
         self.font = font
+        self.text_surface = font.render(self.text, True, COLOR_BUTTON_TEXT)
     
     def handle_event(self, event: pygame.event.Event) -> bool:
         """Handle mouse events. Returns True if button was clicked."""
@@ -84,10 +169,9 @@ class Button:
         pygame.draw.rect(surface, color, self.rect, border_radius=8)
         pygame.draw.rect(surface, COLOR_TEXT_DIM, self.rect, width=2, border_radius=8)
         
-        if self.font:
-            text_surface = self.font.render(self.text, True, COLOR_BUTTON_TEXT)
-            text_rect = text_surface.get_rect(center=self.rect.center)
-            surface.blit(text_surface, text_rect)
+        if self.text_surface:
+            text_rect = self.text_surface.get_rect(center=self.rect.center)
+            surface.blit(self.text_surface, text_rect)
 
 
 # ============================================================================
@@ -107,59 +191,49 @@ def load_polygons_from_json(filepath: str) -> list:
     with open(filepath, 'r') as f:
         dataset = json.load(f)
     
-    polygons = []
+    return [polygon_from_dict(polygon_data)
+            for polygon_data in dataset.get('polygons', [])]
+
+
+def load_polygon_dataset(filepath: str, lazy: bool = True):
+    """
+    Open a polygon dataset for the viewer.
     
-    for polygon_data in dataset.get('polygons', []):
-        # Create polygon from vertices
-        vertices = polygon_data['vertices']
-        coords = [[v['x'], v['y']] for v in vertices]
-        polygon = Polygon.from_list(coords)
-        
-        # Load test points
-        test_points = []
-        for tp in polygon_data.get('test_points', []):
-            test_points.append({
-                'point': Point(tp['x'], tp['y']),
-                'location': tp['location']
-            })
-        
-        polygons.append({
-            'id': polygon_data['id'],
-            'num_vertices': polygon.num_vertices,
-            'polygon': polygon,
-            'coords': coords,
-            'test_points': test_points
-        })
+    Args:
+        filepath: Path to the JSON file.
+        lazy: If True, return a LazyPolygonDataset that parses polygons
+              on demand; otherwise parse everything up front.
     
-    return polygons
+    Returns:
+        A sequence of polygon dictionaries.
+    """
+    if lazy:
+        return LazyPolygonDataset(filepath)
+    return load_polygons_from_json(filepath)
 
 
 # ============================================================================
 # Polygon Rendering
 # ============================================================================
 
-def transform_polygon_to_screen(polygon: Polygon, 
-                                 screen_width: int, 
-                                 screen_height: int,
-                                 padding: int = 100) -> list:
+@functools.lru_cache(maxsize=None)
+def get_viewport_transform(screen_width: int, screen_height: int,
+                           padding: int = 100) -> tuple:
     """
-    Transform polygon coordinates to fit within screen bounds.
-    Uses a fixed coordinate system from -100 to 100.
+    Get the transform of the fixed -100 to 100 viewport.
+    
+    The constants only depend on the window size, so they are computed
+    once and shared by every transform_*_to_screen call.
     
     Args:
-        polygon: The Polygon to transform.
         screen_width: Width of the display area.
         screen_height: Height of the display area.
         padding: Padding around the polygon.
     
     Returns:
-        List of (x, y) tuples in screen coordinates.
+        Tuple (min_x, min_y, scale, offset_x, offset_y): a point (x, y)
+        maps to ((x - min_x) * scale + offset_x, (y - min_y) * scale + offset_y).
     """
-    coords = polygon.to_list()
-    
-    if not coords:
-        return []
-    
     # Use fixed coordinate range -100 to 100
     min_x, max_x = -100, 100
     min_y, max_y = -100, 100
@@ -181,14 +255,37 @@ def transform_polygon_to_screen(polygon: Polygon,
     offset_x = (screen_width - scaled_width) / 2
     offset_y = (screen_height - scaled_height) / 2 - 50  # Shift up for UI
     
-    # Transform coordinates
-    screen_coords = []
-    for x, y in coords:
-        sx = (x - min_x) * scale + offset_x
-        sy = (y - min_y) * scale + offset_y
-        screen_coords.append((sx, sy))
+    return (min_x, min_y, scale, offset_x, offset_y)
+
+
+def transform_polygon_to_screen(polygon: Polygon, 
+                                 screen_width: int, 
+                                 screen_height: int,
+                                 padding: int = 100) -> list:
+    """
+    Transform polygon coordinates to fit within screen bounds.
+    Uses a fixed coordinate system from -100 to 100.
     
-    return screen_coords
+    Args:
+        polygon: The Polygon to transform.
+        screen_width: Width of the display area.
+        screen_height: Height of the display area.
+        padding: Padding around the polygon.
+    
+    Returns:
+        List of (x, y) tuples in screen coordinates.
+    """
+    coords = polygon.to_list()
+    
+    if not coords:
+        return []
+    
+    min_x, min_y, scale, offset_x, offset_y = get_viewport_transform(
+        screen_width, screen_height, padding)
+    
+    # Transform coordinates
+    return [((x - min_x) * scale + offset_x, (y - min_y) * scale + offset_y)
+            for x, y in coords]
 
 
 def draw_polygon(surface: pygame.Surface, 
@@ -207,10 +304,16 @@ def draw_polygon(surface: pygame.Surface,
     
     # Draw filled polygon (with transparency)
     if draw_fill:
-        # Create a temporary surface for transparency
-        temp_surface = pygame.Surface(surface.get_size(), pygame.SRCALPHA)
-        pygame.draw.polygon(temp_surface, COLOR_POLYGON_FILL, screen_coords)
-        surface.blit(temp_surface, (0, 0))
+        # Create a temporary surface for transparency, covering only
+        # the polygon's bounding box
+        left = int(min(x for x, _ in screen_coords))
+        top = int(min(y for _, y in screen_coords))
+        width = int(max(x for x, _ in screen_coords)) - left + 2
+        height = int(max(y for _, y in screen_coords)) - top + 2
+        temp_surface = pygame.Surface((width, height), pygame.SRCALPHA)
+        pygame.draw.polygon(temp_surface, COLOR_POLYGON_FILL,
+                            [(x - left, y - top) for x, y in screen_coords])
+        surface.blit(temp_surface, (left, top))
     
     # Draw edges
     for i in range(len(screen_coords)):
@@ -245,15 +348,37 @@ def draw_info_panel(surface: pygame.Surface,
         font: Main font for text.
         small_font: Smaller font for details.
     """
+    panel = render_info_panel(polygon_data, total_count, font, small_font)
+    surface.blit(panel, INFO_RECT.topleft)
+
+
+def render_info_panel(polygon_data: dict,
+                      total_count: int,
+                      font: pygame.font.Font,
+                      small_font: pygame.font.Font) -> pygame.Surface:
+    """
+    Render the information panel for a polygon onto its own surface.
+    
+    Args:
+        polygon_data: Dictionary with polygon information.
+        total_count: Total number of polygons.
+        font: Main font for text.
+        small_font: Smaller font for details.
+    
+    Returns:
+        A transparent surface the size of INFO_RECT.
+    """
+    surface = pygame.Surface(INFO_RECT.size, pygame.SRCALPHA)
+    
     # Draw info background
-    info_rect = pygame.Rect(20, 20, 300, 140)
+    info_rect = surface.get_rect()
     pygame.draw.rect(surface, COLOR_INFO_BG, info_rect, border_radius=10)
     pygame.draw.rect(surface, COLOR_TEXT_DIM, info_rect, width=1, border_radius=10)
     
     # Title
     title = f"Polygon {polygon_data['id']} of {total_count}"
     title_surface = font.render(title, True, COLOR_TEXT)
-    surface.blit(title_surface, (35, 30))
+    surface.blit(title_surface, (15, 10))
     
     # Polygon details
     polygon = polygon_data['polygon']
@@ -264,24 +389,32 @@ def draw_info_panel(surface: pygame.Surface,
         f"Convex: {'Yes' if polygon.is_convex() else 'No'}",
     ]
     
-    y_offset = 65
+    y_offset = 45
     for detail in details:
         detail_surface = small_font.render(detail, True, COLOR_TEXT_DIM)
-        surface.blit(detail_surface, (35, y_offset))
+        surface.blit(detail_surface, (15, y_offset))
         y_offset += 22
+    
+    return surface
 
 
 def draw_controls_help(surface: pygame.Surface, 
                        font: pygame.font.Font,
                        screen_height: int):
     """Draw keyboard controls help text."""
-    help_text = "← → Arrow Keys or A/D to navigate  |  ESC to quit"
-    help_surface = font.render(help_text, True, COLOR_TEXT_DIM)
+    help_surface = render_controls_help(font)
     help_rect = help_surface.get_rect(centerx=surface.get_width() // 2, 
                                        bottom=screen_height - 15)
     surface.blit(help_surface, help_rect)
 
 
+def render_controls_help(font: pygame.font.Font) -> pygame.Surface:
+    """Render the keyboard controls help text onto its own surface."""
+    help_text = ("← → or A/D navigate  |  Wheel/drag zoom & pan, 0 reset  |  "
+                 "H hover, M heatmap, V sight  |  G gallery  |  ESC quit")
+    return font.render(help_text, True, COLOR_TEXT_DIM)
+
+
 # ============================================================================
 # Test Point Rendering
 # ============================================================================
@@ -304,24 +437,8 @@ def transform_point_to_screen(point: Point, polygon: Polygon,
     Returns:
         Tuple (x, y) in screen coordinates.
     """
-    # Use fixed coordinate range -100 to 100
-    min_x, max_x = -100, 100
-    min_y, max_y = -100, 100
-    
-    poly_width = max_x - min_x   # 200
-    poly_height = max_y - min_y  # 200
-    
-    available_width = screen_width - 2 * padding
-    available_height = screen_height - 2 * padding - 150
-    
-    scale_x = available_width / poly_width
-    scale_y = available_height / poly_height
-    scale = min(scale_x, scale_y)
-    
-    scaled_width = poly_width * scale
-    scaled_height = poly_height * scale
-    offset_x = (screen_width - scaled_width) / 2
-    offset_y = (screen_height - scaled_height) / 2 - 50
+    min_x, min_y, scale, offset_x, offset_y = get_viewport_transform(
+        screen_width, screen_height, padding)
     
     # Transform point
     sx = (point.x - min_x) * scale + offset_x
@@ -330,8 +447,19 @@ def transform_point_to_screen(point: Point, polygon: Polygon,
     return (sx, sy)
 
 
+def get_test_point_color(location: str) -> tuple:
+    """Get the marker color for a test point location."""
+    if location == 'INSIDE':
+        return COLOR_POINT_INSIDE
+    elif location == 'OUTSIDE':
+        return COLOR_POINT_OUTSIDE
+    else:  # BOUNDARY
+        return COLOR_POINT_EDGE
+
+
 def draw_test_points(surface: pygame.Surface, test_points: list,
-                     polygon: Polygon, screen_width: int, screen_height: int):
+                     polygon: Polygon, screen_width: int, screen_height: int,
+                     offset: tuple = (0, 0)):
     """
     Draw test points with colors based on their location relative to the polygon.
     
@@ -341,22 +469,21 @@ def draw_test_points(surface: pygame.Surface, test_points: list,
         polygon: The polygon (used for coordinate transformation).
         screen_width: Width of the display area.
         screen_height: Height of the display area.
+        offset: (dx, dy) added to screen coordinates, for drawing onto a
+                surface that does not start at the window origin.
     """
+    dx, dy = offset
     for test_point in test_points:
         point = test_point['point']
         location = test_point['location']
         
         # Choose color based on location
-        if location == 'INSIDE':
-            color = COLOR_POINT_INSIDE
-        elif location == 'OUTSIDE':
-            color = COLOR_POINT_OUTSIDE
-        else:  # BOUNDARY
-            color = COLOR_POINT_EDGE
+        color = get_test_point_color(location)
         
         # Transform to screen coordinates
-        sx, sy = transform_point_to_screen(point, polygon, 
+        sx, sy = transform_point_to_screen(point, polygon,
                                            screen_width, screen_height)
+        sx, sy = sx + dx, sy + dy
         
         # Draw the point
         pygame.draw.circle(surface, COLOR_VERTEX_OUTLINE, 
@@ -374,17 +501,40 @@ def draw_test_point_legend(surface: pygame.Surface, font: pygame.font.Font,
         font: Font for legend text.
         test_points: List of test point dictionaries.
     """
+    legend = render_test_point_legend(font, test_points)
+    surface.blit(legend, get_legend_rect(surface.get_width()).topleft)
+
+
+def get_legend_rect(screen_width: int) -> pygame.Rect:
+    """Get the screen rectangle of the test point legend (top-right corner)."""
+    return pygame.Rect(screen_width - 190, 15, *LEGEND_SIZE)
+
+
+def render_test_point_legend(font: pygame.font.Font,
+                             test_points: list) -> pygame.Surface:
+    """
+    Render the test point legend onto its own surface.
+    
+    Args:
+        font: Font for legend text.
+        test_points: List of test point dictionaries.
+    
+    Returns:
+        A transparent surface of LEGEND_SIZE.
+    """
+    surface = pygame.Surface(LEGEND_SIZE, pygame.SRCALPHA)
+    
     # Count points by location
     counts = {'INSIDE': 0, 'OUTSIDE': 0, 'BOUNDARY': 0}
     for tp in test_points:
         counts[tp['location']] += 1
     
-    # Draw legend in top-right corner
-    legend_x = surface.get_width() - 180
-    legend_y = 20
+    # Item positions relative to the legend background
+    legend_x = 10
+    legend_y = 5
     
     # Background
-    legend_rect = pygame.Rect(legend_x - 10, legend_y - 5, 170, 95)
+    legend_rect = surface.get_rect()
     pygame.draw.rect(surface, COLOR_INFO_BG, legend_rect, border_radius=10)
     pygame.draw.rect(surface, COLOR_TEXT_DIM, legend_rect, width=1, border_radius=10)
     
@@ -400,6 +550,919 @@ def draw_test_point_legend(surface: pygame.Surface, font: pygame.font.Font,
         pygame.draw.circle(surface, color, (legend_x + 10, y + 8), 8)
         text_surface = font.render(text, True, COLOR_TEXT)
         surface.blit(text_surface, (legend_x + 30, y))
+    
+    return surface
+
+
+def get_plot_rect(screen_width: int, screen_height: int) -> pygame.Rect:
+    """
+    Get the screen rectangle covered by the fixed -100 to 100 viewport.
+    
+    Includes a margin so vertex markers on the edge of the viewport fit.
+    
+    Args:
+        screen_width: Width of the display area.
+        screen_height: Height of the display area.
+    
+    Returns:
+        The plot area as a pygame.Rect.
+    """
+    left, top = transform_point_to_screen(Point(-100, -100), None,
+                                          screen_width, screen_height)
+    right, bottom = transform_point_to_screen(Point(100, 100), None,
+                                              screen_width, screen_height)
+    rect = pygame.Rect(int(left), int(top),
+                       int(right) - int(left) + 1, int(bottom) - int(top) + 1)
+    return rect.inflate(2 * PLOT_MARGIN, 2 * PLOT_MARGIN)
+
+
+def render_polygon_layer(polygon_data: dict, plot_rect: pygame.Rect,
+                         screen_width: int, screen_height: int) -> pygame.Surface:
+    """
+    Render a polygon and its test points onto a transparent plot-sized surface.
+    
+    The translucent fill is drawn straight into the layer's alpha channel,
+    so no full-window temporary surface is needed.
+    
+    Args:
+        polygon_data: Dictionary with polygon information.
+        plot_rect: Screen rectangle the layer will be blitted to.
+        screen_width: Width of the display area.
+        screen_height: Height of the display area.
+    
+    Returns:
+        A transparent surface of plot_rect's size.
+    """
+    layer = pygame.Surface(plot_rect.size, pygame.SRCALPHA)
+    polygon = polygon_data['polygon']
+    coords = [(x - plot_rect.x, y - plot_rect.y)
+              for x, y in transform_polygon_to_screen(polygon, screen_width,
+                                                      screen_height)]
+    if len(coords) >= 3:
+        pygame.draw.polygon(layer, COLOR_POLYGON_FILL, coords)
+    draw_polygon(layer, coords, draw_fill=False)
+    draw_test_points(layer, polygon_data.get('test_points', []), polygon,
+                     screen_width, screen_height,
+                     offset=(-plot_rect.x, -plot_rect.y))
+    return layer
+
+
+# ============================================================================
+# Camera and Level of Detail
+# ============================================================================
+
+class Camera:
+    """
+    Zoomable, pannable view of the polygon plane.
+    
+    The view is one affine transform, screen = world * scale + offset,
+    applied to whole coordinate lists at once. The home view is the fixed
+    -100 to 100 viewport of transform_polygon_to_screen.
+    """
+    
+    def __init__(self, view_rect: pygame.Rect, screen_width: int,
+                 screen_height: int):
+        """
+        Create a camera showing the home view.
+        
+        Args:
+            view_rect: Screen rectangle the camera draws into.
+            screen_width: Width of the display area.
+            screen_height: Height of the display area.
+        """
+        min_x, min_y, scale, offset_x, offset_y = get_viewport_transform(
+            screen_width, screen_height)
+        self.view_rect = view_rect
+        self.home = (scale, offset_x - min_x * scale, offset_y - min_y * scale)
+        self.reset()
+    
+    @property
+    def state(self) -> tuple:
+        """The current (scale, offset_x, offset_y)."""
+        return (self.scale, self.offset_x, self.offset_y)
+    
+    def is_home(self) -> bool:
+        """Check whether the camera shows the home view."""
+        return self.state == self.home
+    
+    def reset(self):
+        """Return to the home view."""
+        self.scale, self.offset_x, self.offset_y = self.home
+    
+    def to_screen(self, x: float, y: float) -> tuple:
+        """Transform a world point to screen coordinates."""
+        return (x * self.scale + self.offset_x, y * self.scale + self.offset_y)
+    
+    def to_world(self, sx: float, sy: float) -> tuple:
+        """Transform a screen point to world coordinates."""
+        return ((sx - self.offset_x) / self.scale, (sy - self.offset_y) / self.scale)
+    
+    def transform(self, coords: list, origin: tuple = (0, 0)) -> list:
+        """
+        Transform a list of world (x, y) pairs to screen coordinates.
+        
+        Args:
+            coords: World coordinates.
+            origin: Screen position subtracted from the results, for
+                    drawing onto a surface that does not start at the
+                    window origin.
+        
+        Returns:
+            List of (x, y) float tuples.
+        """
+        scale = self.scale
+        dx = self.offset_x - origin[0]
+        dy = self.offset_y - origin[1]
+        return [(x * scale + dx, y * scale + dy) for x, y in coords]
+    
+    def world_bounds(self, margin: int = 0) -> tuple:
+        """
+        Get the world rectangle visible in the view.
+        
+        Args:
+            margin: Pixels added around the view rectangle.
+        
+        Returns:
+            Tuple (left, top, right, bottom) in world coordinates.
+        """
+        rect = self.view_rect.inflate(2 * margin, 2 * margin)
+        left, top = self.to_world(rect.left, rect.top)
+        right, bottom = self.to_world(rect.right, rect.bottom)
+        return (left, top, right, bottom)
+    
+    def zoom_at(self, factor: float, pos: tuple) -> bool:
+        """
+        Zoom by a factor, keeping the world point under a screen position fixed.
+        
+        The zoom is clamped to MIN_ZOOM and MAX_ZOOM times the home scale.
+        
+        Args:
+            factor: Scale multiplier; above 1 zooms in.
+            pos: Screen position to zoom about.
+        
+        Returns:
+            True if the view changed.
+        """
+        home_scale = self.home[0]
+        scale = min(max(self.scale * factor, home_scale * MIN_ZOOM),
+                    home_scale * MAX_ZOOM)
+        if scale == self.scale:
+            return False
+        wx, wy = self.to_world(*pos)
+        self.scale = scale
+        self.offset_x = pos[0] - wx * scale
+        self.offset_y = pos[1] - wy * scale
+        return True
+    
+    def pan(self, dx: float, dy: float):
+        """Move the view by a screen distance."""
+        self.offset_x += dx
+        self.offset_y += dy
+
+
+class PolygonOutline:
+    """
+    A polygon's vertex ring prepared for drawing at any zoom.
+    
+    Level of detail: at a grid cell size c, runs of consecutive vertices
+    in the same c-by-c cell are merged into their first vertex. Drawing
+    uses the coarsest cell that is at most LOD_PIXEL_SIZE pixels wide, so
+    only vertices that would share a pixel are merged.
+    
+    Culling: each level is split into chunks of consecutive vertices with
+    bounding boxes. A chunk whose box misses the view lies on the far side
+    of one of the view's edges, so it is drawn as a single segment between
+    its end vertices without changing the fill inside the view.
+    """
+    
+    def __init__(self, polygon: Polygon):
+        """
+        Args:
+            polygon: The polygon to draw.
+        """
+        self.coords = [(v.x, v.y) for v in polygon.vertices]
+        self.levels = {}
+    
+    def cell_for_scale(self, scale: float) -> float:
+        """
+        Get the merge grid cell for a camera scale.
+        
+        Args:
+            scale: Pixels per world unit.
+        
+        Returns:
+            The largest power-of-two multiple of LOD_MIN_CELL no wider than
+            LOD_PIXEL_SIZE pixels, or 0 if vertices should not be merged.
+        """
+        cell = 0.0
+        size = LOD_MIN_CELL
+        while size * scale <= LOD_PIXEL_SIZE:
+            cell = size
+            size *= 2
+        return cell
+    
+    def get_level(self, cell: float) -> tuple:
+        """
+        Get the merged ring and its chunks for a grid cell, building them once.
+        
+        Args:
+            cell: Grid cell size from cell_for_scale.
+        
+        Returns:
+            Tuple (ring, chunks); each chunk is (start, end, min_x, min_y,
+            max_x, max_y) where ring[start:end] are its vertices and the
+            box also covers the edge to the next chunk.
+        """
+        level = self.levels.get(cell)
+        if level is not None:
+            return level
+        
+        ring = self.coords
+        if cell > 0:
+            merged = []
+            last = None
+            for x, y in ring:
+                key = (x // cell, y // cell)
+                if key != last:
+                    merged.append((x, y))
+                    last = key
+            x, y = merged[0]
+            if len(merged) > 1 and (x // cell, y // cell) == last:
+                merged.pop()
+            # Polygons smaller than a pixel keep their vertices
+            if len(merged) >= 3:
+                ring = merged
+        
+        n = len(ring)
+        chunks = []
+        for start in range(0, n, LOD_CHUNK_SIZE):
+            end = min(start + LOD_CHUNK_SIZE, n)
+            part = ring[start:end + 1] if end < n else ring[start:] + ring[:1]
+            xs = [x for x, _ in part]
+            ys = [y for _, y in part]
+            chunks.append((start, end, min(xs), min(ys), max(xs), max(ys)))
+        
+        level = (ring, chunks)
+        self.levels[cell] = level
+        return level
+    
+    def project(self, camera: Camera, origin: tuple = (0, 0),
+                margin: int = 0) -> list:
+        """
+        Get the screen outline of the polygon through a camera.
+        
+        Args:
+            camera: The camera to draw through.
+            origin: Screen position subtracted from the results.
+            margin: Pixels around the view that still count as visible.
+        
+        Returns:
+            List of integer (x, y) screen points with no two consecutive
+            points on the same pixel.
+        """
+        ring, chunks = self.get_level(self.cell_for_scale(camera.scale))
+        left, top, right, bottom = camera.world_bounds(margin)
+        
+        kept = []
+        for start, end, min_x, min_y, max_x, max_y in chunks:
+            if max_x < left or min_x > right or max_y < top or min_y > bottom:
+                kept.append(ring[start])
+                kept.append(ring[end - 1])
+            else:
+                kept.extend(ring[start:end])
+        
+        points = []
+        last = None
+        for x, y in camera.transform(kept, origin):
+            pixel = (int(x), int(y))
+            if pixel != last:
+                points.append(pixel)
+                last = pixel
+        if len(points) > 1 and points[0] == points[-1]:
+            points.pop()
+        return points
+
+
+def clip_ring(points: list, rect: pygame.Rect) -> list:
+    """
+    Clip a closed ring of screen points to a rectangle (Sutherland-Hodgman).
+    
+    The area enclosed inside the rectangle is unchanged. pygame fills a
+    polygon row by row over its whole height, so vertices far outside the
+    view would otherwise cost time even though nothing of them is drawn.
+    
+    Args:
+        points: Integer (x, y) points of a closed ring.
+        rect: Rectangle to clip to.
+    
+    Returns:
+        The clipped ring as integer (x, y) points (empty if nothing is left).
+    """
+    xs = [x for x, _ in points]
+    ys = [y for _, y in points]
+    if (min(xs) >= rect.left and max(xs) <= rect.right and
+            min(ys) >= rect.top and max(ys) <= rect.bottom):
+        return points
+    
+    # (axis, bound, keep points with coordinate >= bound)
+    for axis, bound, lower in ((0, rect.left, True), (0, rect.right, False),
+                               (1, rect.top, True), (1, rect.bottom, False)):
+        other = 1 - axis
+        clipped = []
+        prev = points[-1]
+        prev_in = prev[axis] >= bound if lower else prev[axis] <= bound
+        for point in points:
+            point_in = point[axis] >= bound if lower else point[axis] <= bound
+            if point_in != prev_in:
+                t = (bound - prev[axis]) / (point[axis] - prev[axis])
+                crossing = [0, 0]
+                crossing[axis] = bound
+                crossing[other] = round(prev[other] + t * (point[other] - prev[other]))
+                clipped.append(tuple(crossing))
+            if point_in:
+                clipped.append(point)
+            prev, prev_in = point, point_in
+        points = clipped
+        if not points:
+            break
+    return points
+
+
+def render_camera_layer(layer: pygame.Surface, polygon_data: dict,
+                        outline: PolygonOutline, camera: Camera):
+    """
+    Render a polygon and its test points through a camera.
+    
+    Only the visible part of the outline, at the camera's level of detail,
+    is drawn. Test points are culled in world coordinates before they are
+    transformed, and vertex markers are drawn only while at most
+    MAX_VERTEX_MARKERS are in view.
+    
+    Args:
+        layer: Transparent surface covering the camera's view rectangle;
+               it is cleared first.
+        polygon_data: Dictionary with polygon information.
+        outline: PolygonOutline of the polygon.
+        camera: The camera to draw through.
+    """
+    layer.fill((0, 0, 0, 0))
+    origin = camera.view_rect.topleft
+    
+    coords = outline.project(camera, origin, PLOT_MARGIN)
+    if len(coords) >= 3:
+        # Edges added along the clip rectangle fall outside the layer
+        ring = clip_ring(coords, layer.get_rect().inflate(4 * EDGE_WIDTH,
+                                                          4 * EDGE_WIDTH))
+        if len(ring) >= 3:
+            pygame.draw.polygon(layer, COLOR_POLYGON_FILL, ring)
+            pygame.draw.lines(layer, COLOR_POLYGON_EDGE, True, ring, EDGE_WIDTH)
+    
+    # Draw vertices (on top of edges)
+    bounds = layer.get_rect().inflate(2 * PLOT_MARGIN, 2 * PLOT_MARGIN)
+    markers = [pixel for pixel in coords if bounds.collidepoint(pixel)]
+    if len(markers) <= MAX_VERTEX_MARKERS:
+        for pixel in markers:
+            pygame.draw.circle(layer, COLOR_VERTEX_OUTLINE, pixel, VERTEX_RADIUS + 2)
+            pygame.draw.circle(layer, COLOR_VERTEX, pixel, VERTEX_RADIUS)
+    
+    # Draw test points inside the view
+    left, top, right, bottom = camera.world_bounds(PLOT_MARGIN)
+    visible = [tp for tp in polygon_data.get('test_points', [])
+               if left <= tp['point'].x <= right and top <= tp['point'].y <= bottom]
+    screen_points = camera.transform([(tp['point'].x, tp['point'].y)
+                                      for tp in visible], origin)
+    for test_point, (sx, sy) in zip(visible, screen_points):
+        color = get_test_point_color(test_point['location'])
+        pygame.draw.circle(layer, COLOR_VERTEX_OUTLINE,
+                           (int(sx), int(sy)), TEST_POINT_RADIUS + 2)
+        pygame.draw.circle(layer, color, (int(sx), int(sy)), TEST_POINT_RADIUS)
+
+
+# ============================================================================
+# Point Classification Overlay
+# ============================================================================
+
+def render_heatmap(grid: list) -> pygame.Surface:
+    """
+    Render a classify_grid result with one pixel per grid point.
+    
+    Args:
+        grid: Rows of locations from GRID_MIN to GRID_MAX, as returned by
+              classify_grid.
+    
+    Returns:
+        A transparent surface with row 0 at the top.
+    """
+    colors = {location: bytes(get_test_point_color(location) + (HEATMAP_ALPHA,))
+              for location in ('INSIDE', 'OUTSIDE', 'BOUNDARY')}
+    pixels = b''.join(colors[location] for row in grid for location in row)
+    return pygame.image.frombytes(pixels, (len(grid[0]), len(grid)), 'RGBA')
+
+
+def render_heatmap_layer(layer: pygame.Surface, heatmap: pygame.Surface,
+                         camera: Camera):
+    """
+    Draw a heatmap through a camera, one square cell per grid point.
+    
+    Only the visible cells are drawn. When few are visible (zoomed in)
+    each is filled directly; otherwise the visible part of the heatmap is
+    scaled in one call.
+    
+    Args:
+        layer: Transparent surface covering the camera's view rectangle;
+               it is cleared first.
+        heatmap: Surface from render_heatmap.
+        camera: The camera to draw through.
+    """
+    layer.fill((0, 0, 0, 0))
+    left, top, right, bottom = camera.world_bounds()
+    first_x = max(GRID_MIN, math.ceil(left - 0.5))
+    last_x = min(GRID_MAX, math.floor(right + 0.5))
+    first_y = max(GRID_MIN, math.ceil(top - 0.5))
+    last_y = min(GRID_MAX, math.floor(bottom + 0.5))
+    if first_x > last_x or first_y > last_y:
+        return
+    
+    origin_x, origin_y = camera.view_rect.topleft
+    
+    def corner(x: float, y: float) -> tuple:
+        sx, sy = camera.to_screen(x, y)
+        return (round(sx) - origin_x, round(sy) - origin_y)
+    
+    columns = last_x - first_x + 1
+    rows = last_y - first_y + 1
+    if columns * rows <= HEATMAP_MAX_CELL_FILLS:
+        for gy in range(first_y, last_y + 1):
+            for gx in range(first_x, last_x + 1):
+                x0, y0 = corner(gx - 0.5, gy - 0.5)
+                x1, y1 = corner(gx + 0.5, gy + 0.5)
+                color = heatmap.get_at((gx - GRID_MIN, gy - GRID_MIN))
+                layer.fill(color, (x0, y0, x1 - x0, y1 - y0))
+        return
+    
+    x0, y0 = corner(first_x - 0.5, first_y - 0.5)
+    x1, y1 = corner(last_x + 0.5, last_y + 0.5)
+    visible = heatmap.subsurface((first_x - GRID_MIN, first_y - GRID_MIN,
+                                  columns, rows))
+    layer.blit(pygame.transform.scale(visible, (x1 - x0, y1 - y0)), (x0, y0))
+
+
+def render_sight_layer(layer: pygame.Surface, sight: Polygon, camera: Camera,
+                       origin: tuple):
+    """
+    Draw a visibility polygon translucently onto a transparent plot layer.
+    
+    Args:
+        layer: Plot-sized layer to clear and draw on.
+        sight: Visibility polygon in world coordinates, or None.
+        camera: View camera.
+        origin: Screen position of the layer's top left corner.
+    """
+    layer.fill((0, 0, 0, 0))
+    if sight is None:
+        return
+    coords = [(v.x, v.y) for v in sight.vertices]
+    points = [(round(x), round(y)) for x, y in camera.transform(coords, origin)]
+    points = clip_ring(points, layer.get_rect())
+    if len(points) >= 3:
+        pygame.draw.polygon(layer, COLOR_SIGHT, points)
+
+
+def get_line_rect(line: tuple, width: int) -> pygame.Rect:
+    """
+    Get the screen rectangle covered by a thick line.
+    
+    Args:
+        line: Endpoints as returned by Rect.clipline, or () for no line.
+        width: Line width in pixels.
+    
+    Returns:
+        The covered rectangle, or None for no line.
+    """
+    if not line:
+        return None
+    (x1, y1), (x2, y2) = line
+    rect = pygame.Rect(min(x1, x2), min(y1, y2), abs(x2 - x1) + 1, abs(y2 - y1) + 1)
+    return rect.inflate(2 * width, 2 * width)
+
+
+def render_hover_panel(font: pygame.font.Font, cell: tuple, location: str,
+                       edge: int = None, distance: float = None) -> pygame.Surface:
+    """
+    Render the readout of the grid point under the mouse.
+    
+    Args:
+        font: Font for the readout.
+        cell: Integer (x, y) grid point, or None if the mouse is off the plot.
+        location: Classification of the grid point.
+        edge: Index of the edge nearest to the grid point.
+        distance: Signed distance from the grid point to the boundary.
+    
+    Returns:
+        A transparent surface the size of HOVER_RECT.
+    """
+    surface = pygame.Surface(HOVER_RECT.size, pygame.SRCALPHA)
+    panel_rect = surface.get_rect()
+    pygame.draw.rect(surface, COLOR_INFO_BG, panel_rect, border_radius=10)
+    pygame.draw.rect(surface, COLOR_TEXT_DIM, panel_rect, width=1, border_radius=10)
+    
+    if cell is None:
+        text = font.render("Point the mouse at the plot", True, COLOR_TEXT_DIM)
+        surface.blit(text, (15, 12))
+        return surface
+    
+    pygame.draw.circle(surface, get_test_point_color(location), (23, 20), 8)
+    text = font.render(f"({cell[0]}, {cell[1]}): {location}", True, COLOR_TEXT)
+    surface.blit(text, (40, 12))
+    if edge is not None:
+        pygame.draw.line(surface, COLOR_NEAREST_EDGE, (15, 44), (31, 44),
+                         NEAREST_EDGE_WIDTH)
+        text = font.render(f"Edge {edge}, signed distance {distance:.2f}",
+                           True, COLOR_TEXT_DIM)
+        surface.blit(text, (40, 36))
+    return surface
+
+
+# ============================================================================
+# Gallery Mode
+# ============================================================================
+
+def blend_color(color: tuple, background: tuple) -> tuple:
+    """Blend an (r, g, b, a) color over an opaque background color."""
+    alpha = color[3] / 255
+    return tuple(int(c * alpha + b * (1 - alpha))
+                 for c, b in zip(color[:3], background))
+
+
+def get_thumbnail_transform(width: int, height: int) -> tuple:
+    """
+    Get the transform of the -100 to 100 viewport onto a thumbnail.
+    
+    Returns:
+        Tuple (scale, offset_x, offset_y); a point (x, y) maps to
+        ((x + 100) * scale + offset_x, (y + 100) * scale + offset_y).
+    """
+    scale = (min(width, height) - 2 * THUMB_PADDING) / 200
+    return (scale, (width - 200 * scale) / 2, (height - 200 * scale) / 2)
+
+
+def render_thumbnail(surface: pygame.Surface, polygon: Polygon,
+                     label: pygame.Surface = None):
+    """
+    Draw a polygon thumbnail filling a whole surface.
+    
+    Uses the same fixed -100 to 100 coordinate system as the main view,
+    so thumbnails show polygons at comparable sizes.
+    
+    Args:
+        surface: Opaque surface (or atlas subsurface) to draw on.
+        polygon: The polygon to draw.
+        label: Optional text surface drawn in the bottom-left corner.
+    """
+    width, height = surface.get_size()
+    surface.fill(COLOR_INFO_BG)
+    
+    scale, offset_x, offset_y = get_thumbnail_transform(width, height)
+    coords = [((x + 100) * scale + offset_x, (y + 100) * scale + offset_y)
+              for x, y in polygon.to_list()]
+    if len(coords) >= 3:
+        pygame.draw.polygon(surface, blend_color(COLOR_POLYGON_FILL, COLOR_INFO_BG),
+                            coords)
+        pygame.draw.lines(surface, COLOR_POLYGON_EDGE, True, coords)
+    
+    if label is not None:
+        surface.blit(label, (4, height - label.get_height() - 2))
+
+
+class ThumbnailAtlas:
+    """
+    Fixed-size texture atlas of equally sized thumbnails.
+    
+    Thumbnails live in slots of one large surface, so drawing a tile is a
+    single blit from the atlas. When the atlas is full the least recently
+    used slot is reused.
+    """
+    
+    def __init__(self, tile_size: int, capacity: int):
+        """
+        Allocate the atlas surface.
+        
+        Args:
+            tile_size: Width and height of each thumbnail in pixels.
+            capacity: Number of thumbnails the atlas holds.
+        """
+        self.tile_size = tile_size
+        self.capacity = capacity
+        self.columns = max(1, ATLAS_MAX_WIDTH // tile_size)
+        rows = -(-capacity // self.columns)
+        self.surface = pygame.Surface((self.columns * tile_size, rows * tile_size))
+        
+        # Key -> slot, least recently used first
+        self.slots = OrderedDict()
+        self.free_slots = list(range(capacity - 1, -1, -1))
+    
+    def __len__(self) -> int:
+        return len(self.slots)
+    
+    def __contains__(self, key) -> bool:
+        return key in self.slots
+    
+    def slot_rect(self, slot: int) -> pygame.Rect:
+        """Get the atlas area of a slot."""
+        row, column = divmod(slot, self.columns)
+        return pygame.Rect(column * self.tile_size, row * self.tile_size,
+                           self.tile_size, self.tile_size)
+    
+    def get(self, key) -> pygame.Rect:
+        """
+        Get the atlas area holding a thumbnail and mark it as recently used.
+        
+        Returns:
+            The area as a pygame.Rect, or None if the key is not stored.
+        """
+        slot = self.slots.get(key)
+        if slot is None:
+            return None
+        self.slots.move_to_end(key)
+        return self.slot_rect(slot)
+    
+    def allocate(self, key) -> pygame.Surface:
+        """
+        Reserve a slot for a thumbnail, evicting the oldest one if needed.
+        
+        Returns:
+            A subsurface of the atlas to draw the thumbnail on.
+        """
+        if key in self.slots:
+            slot = self.slots[key]
+            self.slots.move_to_end(key)
+        else:
+            if self.free_slots:
+                slot = self.free_slots.pop()
+            else:
+                _, slot = self.slots.popitem(last=False)
+            self.slots[key] = slot
+        return self.surface.subsurface(self.slot_rect(slot))
+
+
+class PolygonGallery:
+    """
+    Scrollable grid of polygon thumbnails with sorting and filtering.
+    
+    Only tiles inside the viewport are drawn. Missing thumbnails and the
+    statistics used for sorting and filtering are produced a few at a
+    time within a per-frame time budget, so browsing stays at full frame
+    rate on datasets of any size. Until the statistics are complete, the
+    grid shows the dataset order.
+    """
+    
+    def __init__(self, polygons, font: pygame.font.Font,
+                 small_font: pygame.font.Font, width: int, height: int):
+        """
+        Initialize the gallery.
+        
+        Args:
+            polygons: Dataset sequence (list or LazyPolygonDataset).
+            font: Font for the header.
+            small_font: Font for tile labels and header details.
+            width: Width of the display area.
+            height: Height of the display area.
+        """
+        self.polygons = polygons
+        self.font = font
+        self.small_font = small_font
+        self.view_rect = pygame.Rect(0, GALLERY_HEADER_HEIGHT,
+                                     width, height - GALLERY_HEADER_HEIGHT)
+        self.atlas = ThumbnailAtlas(THUMB_SIZE, GALLERY_ATLAS_TILES)
+        
+        pitch = THUMB_SIZE + THUMB_GAP
+        self.columns = max(1, (width - THUMB_GAP) // pitch)
+        self.margin_x = (width - self.columns * pitch + THUMB_GAP) // 2
+        
+        self.scroll = 0
+        self.hovered = None
+        self.dirty = True
+        self.missing_tiles = True
+        
+        # Sorting and filtering, applied once statistics are complete
+        self.stats = []
+        self.stats_iter = iter_polygon_stats(polygons)
+        self.sort_index = 0
+        self.sort_reverse = False
+        self.filter_index = 0
+        self.order = list(range(len(polygons)))
+        
+        self.header_text = None
+        self.header_surface = None
+    
+    @property
+    def stats_complete(self) -> bool:
+        """Check if statistics are available for every polygon."""
+        return len(self.stats) == len(self.polygons)
+    
+    def has_pending_work(self) -> bool:
+        """Check if thumbnails or statistics are still being produced."""
+        return self.missing_tiles or not self.stats_complete
+    
+    # ------------------------------------------------------------------
+    # Layout
+    # ------------------------------------------------------------------
+    
+    def row_count(self) -> int:
+        """Get the number of grid rows."""
+        return -(-len(self.order) // self.columns)
+    
+    def max_scroll(self) -> int:
+        """Get the largest scroll offset in pixels."""
+        content = self.row_count() * (THUMB_SIZE + THUMB_GAP) + THUMB_GAP
+        return max(0, content - self.view_rect.height)
+    
+    def scroll_by(self, pixels: int):
+        """Scroll the grid, clamped to the content."""
+        scroll = max(0, min(self.max_scroll(), self.scroll + pixels))
+        if scroll != self.scroll:
+            self.scroll = scroll
+            self.dirty = True
+    
+    def visible_positions(self) -> range:
+        """Get the grid positions of tiles intersecting the viewport."""
+        pitch = THUMB_SIZE + THUMB_GAP
+        first_row = max(0, (self.scroll - THUMB_GAP) // pitch)
+        last_row = (self.scroll + self.view_rect.height) // pitch
+        start = first_row * self.columns
+        stop = min(len(self.order), (last_row + 1) * self.columns)
+        return range(start, max(start, stop))
+    
+    def tile_rect(self, position: int) -> pygame.Rect:
+        """Get the screen rectangle of the tile at a grid position."""
+        row, column = divmod(position, self.columns)
+        pitch = THUMB_SIZE + THUMB_GAP
+        return pygame.Rect(self.margin_x + column * pitch,
+                           self.view_rect.top + THUMB_GAP + row * pitch - self.scroll,
+                           THUMB_SIZE, THUMB_SIZE)
+    
+    def position_at(self, pos: tuple) -> int:
+        """
+        Get the grid position of the tile under a screen point.
+        
+        Returns:
+            The position, or None if the point is not on a tile.
+        """
+        if not self.view_rect.collidepoint(pos):
+            return None
+        pitch = THUMB_SIZE + THUMB_GAP
+        x = pos[0] - self.margin_x
+        y = pos[1] - self.view_rect.top - THUMB_GAP + self.scroll
+        if x < 0 or y < 0 or x % pitch >= THUMB_SIZE or y % pitch >= THUMB_SIZE:
+            return None
+        column, row = x // pitch, y // pitch
+        if column >= self.columns:
+            return None
+        position = row * self.columns + column
+        return position if position < len(self.order) else None
+    
+    # ------------------------------------------------------------------
+    # Sorting and filtering
+    # ------------------------------------------------------------------
+    
+    def apply_order(self):
+        """Rebuild the displayed order from the current sort and filter."""
+        if not self.stats_complete:
+            return
+        stats = self.stats
+        indices = list(range(len(stats)))
+        
+        _, predicate = GALLERY_FILTERS[self.filter_index]
+        if predicate is not None:
+            medians = {key: sorted(s[key] for s in stats)[len(stats) // 2]
+                       for key in ('vertices', 'area')} if stats else {}
+            indices = [i for i in indices if predicate(stats[i], medians)]
+        
+        _, key = GALLERY_SORT_KEYS[self.sort_index]
+        if key is not None:
+            indices.sort(key=lambda i: stats[i][key])
+        if self.sort_reverse:
+            indices.reverse()
+        
+        self.order = indices
+        self.scroll = min(self.scroll, self.max_scroll())
+        self.hovered = None
+        self.dirty = True
+    
+    # ------------------------------------------------------------------
+    # Events, work and drawing
+    # ------------------------------------------------------------------
+    
+    def handle_event(self, event: pygame.event.Event) -> int:
+        """
+        Process a pygame event.
+        
+        Returns:
+            Dataset index of a clicked polygon, otherwise None.
+        """
+        pitch = THUMB_SIZE + THUMB_GAP
+        if event.type == pygame.MOUSEWHEEL:
+            self.scroll_by(-event.y * pitch // 2)
+        elif event.type == pygame.MOUSEMOTION:
+            hovered = self.position_at(event.pos)
+            if hovered != self.hovered:
+                self.hovered = hovered
+                self.dirty = True
+        elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+            position = self.position_at(event.pos)
+            if position is not None:
+                return self.order[position]
+        elif event.type == pygame.KEYDOWN:
+            page = self.view_rect.height - pitch
+            if event.key == pygame.K_UP:
+                self.scroll_by(-pitch)
+            elif event.key == pygame.K_DOWN:
+                self.scroll_by(pitch)
+            elif event.key == pygame.K_PAGEUP:
+                self.scroll_by(-page)
+            elif event.key == pygame.K_PAGEDOWN:
+                self.scroll_by(page)
+            elif event.key == pygame.K_HOME:
+                self.scroll_by(-self.scroll)
+            elif event.key == pygame.K_END:
+                self.scroll_by(self.max_scroll())
+            elif event.key == pygame.K_s:
+                self.sort_index = (self.sort_index + 1) % len(GALLERY_SORT_KEYS)
+                self.apply_order()
+                self.dirty = True
+            elif event.key == pygame.K_r:
+                self.sort_reverse = not self.sort_reverse
+                self.apply_order()
+                self.dirty = True
+            elif event.key == pygame.K_f:
+                self.filter_index = (self.filter_index + 1) % len(GALLERY_FILTERS)
+                self.apply_order()
+                self.dirty = True
+        return None
+    
+    def update(self):
+        """Render missing visible thumbnails, then compute statistics, within a time budget."""
+        deadline = pygame.time.get_ticks() + GALLERY_WORK_BUDGET_MS
+        
+        self.missing_tiles = False
+        for position in self.visible_positions():
+            index = self.order[position]
+            if index in self.atlas:
+                continue
+            if pygame.time.get_ticks() >= deadline:
+                self.missing_tiles = True
+                return
+            polygon_data = self.polygons[index]
+            label = self.small_font.render(str(polygon_data['id']), True,
+                                           COLOR_TEXT_DIM)
+            render_thumbnail(self.atlas.allocate(index), polygon_data['polygon'],
+                             label)
+            self.dirty = True
+        
+        if not self.stats_complete:
+            while pygame.time.get_ticks() < deadline:
+                stats = next(self.stats_iter, None)
+                if stats is None:
+                    break
+                self.stats.append(stats)
+            if self.stats_complete:
+                self.apply_order()
+            self.dirty = True
+    
+    def render_header(self) -> pygame.Surface:
+        """Get the header text surface, re-rendering it only when it changes."""
+        sort_name, _ = GALLERY_SORT_KEYS[self.sort_index]
+        filter_name, _ = GALLERY_FILTERS[self.filter_index]
+        direction = "desc" if self.sort_reverse else "asc"
+        text = (f"Gallery: {len(self.order)} of {len(self.polygons)}  |  "
+                f"Sort (S/R): {sort_name} {direction}  |  Filter (F): {filter_name}")
+        if not self.stats_complete:
+            text += f"  |  Indexing {100 * len(self.stats) // max(1, len(self.polygons))}%"
+        if text != self.header_text:
+            self.header_text = text
+            self.header_surface = self.small_font.render(text, True, COLOR_TEXT)
+        return self.header_surface
+    
+    def draw(self, surface: pygame.Surface):
+        """Draw the header and the visible tiles."""
+        surface.fill(COLOR_BACKGROUND)
+        
+        surface.set_clip(self.view_rect)
+        for position in self.visible_positions():
+            rect = self.tile_rect(position)
+            area = self.atlas.get(self.order[position])
+            if area is None:
+                pygame.draw.rect(surface, COLOR_INFO_BG, rect)
+            else:
+                surface.blit(self.atlas.surface, rect, area)
+            if position == self.hovered:
+                pygame.draw.rect(surface, COLOR_VERTEX, rect, width=2)
+        surface.set_clip(None)
+        
+        header = self.render_header()
+        surface.blit(header, (THUMB_GAP * 2,
+                              (GALLERY_HEADER_HEIGHT - header.get_height()) // 2))
+        self.dirty = False
 
 
 # ============================================================================
@@ -409,21 +1472,35 @@ def draw_test_point_legend(surface: pygame.Surface, font: pygame.font.Font,
 class PolygonViewer:
     """Main application class for viewing polygons."""
     
-    def __init__(self, json_path: str):
+    def __init__(self, json_path: str, event_driven: bool = True,
+                 lazy: bool = True):
+        """
+        Initialize the viewer window and open the dataset.
+        
+        Args:
+            json_path: Path to the polygon dataset.
+            event_driven: If True, sleep until input arrives and redraw
+                          only the regions that changed. If False, redraw
+                          the whole window at FPS.
+            lazy: If True, parse polygons on demand and prefetch the
+                  neighbours of the current polygon on a background
+                  thread. If False, parse the whole dataset up front.
+        """
         pygame.init()
         pygame.display.set_caption("Polygon Viewer")
         
         self.screen = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
         self.clock = pygame.time.Clock()
         self.running = True
+        self.event_driven = event_driven
         
         # Load fonts
         self.font = pygame.font.Font(None, 36)
         self.small_font = pygame.font.Font(None, 24)
         self.button_font = pygame.font.Font(None, 32)
         
-        # Load polygons from JSON (includes pre-computed test points)
-        self.polygons = load_polygons_from_json(json_path)
+        # Open polygons from JSON (includes pre-computed test points)
+        self.polygons = load_polygon_dataset(json_path, lazy)
         self.current_index = 0
         
         # Create navigation buttons
@@ -441,17 +1518,69 @@ class PolygonViewer:
         self.prev_button.set_font(self.button_font)
         self.next_button.set_font(self.button_font)
         
-        # Cache transformed coordinates
-        self.screen_coords = None
-        self.update_screen_coords()
-    
-    def update_screen_coords(self):
-        """Update cached screen coordinates for current polygon."""
-        if self.polygons:
-            polygon = self.polygons[self.current_index]['polygon']
-            self.screen_coords = transform_polygon_to_screen(
-                polygon, WINDOW_WIDTH, WINDOW_HEIGHT
-            )
+        # Static layout and pre-rendered surfaces
+        self.plot_rect = get_plot_rect(WINDOW_WIDTH, WINDOW_HEIGHT)
+        self.legend_rect = get_legend_rect(WINDOW_WIDTH)
+        self.help_surface = render_controls_help(self.small_font)
+        self.help_rect = self.help_surface.get_rect(
+            centerx=WINDOW_WIDTH // 2, bottom=WINDOW_HEIGHT - 15)
+        
+        # Rendered layers per polygon index, least recently used first;
+        # shared with the prefetch thread
+        self.layer_cache = OrderedDict()
+        self.layer_lock = threading.Lock()
+        
+        # Zoom and pan: the view camera, a fixed home camera for cached
+        # layers, level of detail outlines per polygon index and the plot
+        # surface last rendered through the view camera
+        self.camera = Camera(self.plot_rect, WINDOW_WIDTH, WINDOW_HEIGHT)
+        self.home_camera = Camera(self.plot_rect, WINDOW_WIDTH, WINDOW_HEIGHT)
+        self.outlines = OrderedDict()
+        self.view_layer = pygame.Surface(self.plot_rect.size, pygame.SRCALPHA)
+        self.view_layer_key = None
+        self.dragging = False
+        
+        # Classification overlay: the hover readout of the grid point under
+        # the mouse and the whole-grid heatmap, rendered once per polygon
+        # and camera state
+        self.hover_enabled = False
+        self.hover_cell = None
+        self.hover_edge_rect = None
+        self.heatmap_enabled = False
+        self.heatmap_layer = pygame.Surface(self.plot_rect.size, pygame.SRCALPHA)
+        self.heatmap_layer_key = None
+        
+        # Line of sight overlay from the mouse position. Visibility
+        # polygons are computed on a background thread for the latest
+        # viewpoint only, and cached per (polygon index, world viewpoint);
+        # the last one shown stays up until the next is ready. The layer
+        # is re-rendered when the shown polygon or the camera changes
+        self.sight_enabled = False
+        self.sight_pos = None
+        self.sight_layer = pygame.Surface(self.plot_rect.size, pygame.SRCALPHA)
+        self.sight_layer_key = None
+        self.sight_cache = OrderedDict()
+        self.sight_shown = None
+        self.sight_request = None
+        self.sight_condition = threading.Condition()
+        self.sight_thread = None
+        
+        # Background rendering of neighbouring polygons
+        self.prefetch_queue = []
+        self.prefetch_condition = threading.Condition()
+        self.prefetch_thread = None
+        if lazy:
+            self.prefetch_thread = threading.Thread(
+                target=self.prefetch_worker, daemon=True)
+            self.prefetch_thread.start()
+            self.request_prefetch()
+        
+        # Screen regions to redraw on the next update
+        self.dirty_rects = []
+        
+        # Thumbnail grid, created the first time it is opened
+        self.gallery = None
+        self.gallery_active = False
     
     def get_current_test_points(self):
         """Get test points for the current polygon from the dataset."""
@@ -459,86 +1588,554 @@ class PolygonViewer:
             return self.polygons[self.current_index].get('test_points', [])
         return []
     
+    def get_layers(self, index: int) -> dict:
+        """
+        Get the rendered surfaces for a polygon, rendering them on first use.
+        
+        Args:
+            index: Polygon index in the dataset.
+        
+        Returns:
+            Dictionary with 'plot', 'info' and 'legend' surfaces.
+        """
+        with self.layer_lock:
+            layers = self.layer_cache.get(index)
+            if layers is not None:
+                self.layer_cache.move_to_end(index)
+        
+        polygon_data = self.polygons[index]
+        if layers is None:
+            layers = self.store_layers(index, {
+                'plot': self.render_plot(index, polygon_data),
+            })
+        
+        # Text is rendered here rather than on the prefetch thread, which
+        # would otherwise share the fonts with the main thread
+        if 'info' not in layers:
+            layers['info'] = render_info_panel(
+                polygon_data, len(self.polygons), self.font, self.small_font)
+            layers['legend'] = render_test_point_legend(
+                self.small_font, polygon_data.get('test_points', []))
+        return layers
+    
+    def get_outline(self, index: int) -> PolygonOutline:
+        """Get the level of detail outline of a polygon, building it on first use."""
+        with self.layer_lock:
+            outline = self.outlines.get(index)
+            if outline is not None:
+                self.outlines.move_to_end(index)
+                return outline
+        
+        outline = PolygonOutline(self.polygons[index]['polygon'])
+        with self.layer_lock:
+            self.outlines[index] = outline
+            if len(self.outlines) > LAYER_CACHE_SIZE:
+                self.outlines.popitem(last=False)
+        return outline
+    
+    def render_plot(self, index: int, polygon_data: dict) -> pygame.Surface:
+        """
+        Render the home view plot layer of a polygon.
+        
+        Large polygons go through the level of detail renderer; others
+        use render_polygon_layer.
+        """
+        if polygon_data['num_vertices'] <= LOD_MIN_VERTICES:
+            return render_polygon_layer(polygon_data, self.plot_rect,
+                                        WINDOW_WIDTH, WINDOW_HEIGHT)
+        layer = pygame.Surface(self.plot_rect.size, pygame.SRCALPHA)
+        render_camera_layer(layer, polygon_data, self.get_outline(index),
+                            self.home_camera)
+        return layer
+    
+    def get_plot_surface(self, index: int) -> pygame.Surface:
+        """
+        Get the plot layer of a polygon as seen through the view camera.
+        
+        The home view comes from the layer cache; any other view is
+        rendered once per polygon and camera state.
+        """
+        if self.camera.is_home():
+            return self.get_layers(index)['plot']
+        key = (index, self.camera.state)
+        if key != self.view_layer_key:
+            render_camera_layer(self.view_layer, self.polygons[index],
+                                self.get_outline(index), self.camera)
+            self.view_layer_key = key
+        return self.view_layer
+    
+    def zoom_camera(self, factor: float, pos: tuple = None):
+        """Zoom the view about a screen position (the plot center by default)."""
+        if self.camera.zoom_at(factor, pos or self.plot_rect.center):
+            self.mark_dirty(self.plot_rect)
+            self.update_hover(pygame.mouse.get_pos())
+    
+    def reset_camera(self):
+        """Return the view to the fixed -100 to 100 viewport."""
+        if not self.camera.is_home():
+            self.camera.reset()
+            self.mark_dirty(self.plot_rect)
+            self.update_hover(pygame.mouse.get_pos())
+    
+    def get_grid(self, index: int) -> list:
+        """
+        Get the classification of every grid point for a polygon.
+        
+        Computed once per polygon with classify_grid and kept with the
+        polygon's cached layers, together with its heatmap surface.
+        """
+        layers = self.get_layers(index)
+        if 'grid' not in layers:
+            grid = classify_grid(self.polygons[index]['polygon'],
+                                 GRID_MIN, GRID_MIN, GRID_MAX, GRID_MAX)
+            layers['heatmap'] = render_heatmap(grid)
+            layers['grid'] = grid
+        return layers['grid']
+    
+    def get_heatmap_surface(self, index: int) -> pygame.Surface:
+        """Get the heatmap of a polygon as seen through the view camera."""
+        key = (index, self.camera.state)
+        if key != self.heatmap_layer_key:
+            self.get_grid(index)
+            render_heatmap_layer(self.heatmap_layer,
+                                 self.get_layers(index)['heatmap'], self.camera)
+            self.heatmap_layer_key = key
+        return self.heatmap_layer
+    
+    def get_hover_location(self) -> str:
+        """Classify the grid point under the mouse against the current polygon."""
+        x, y = self.hover_cell
+        if GRID_MIN <= x <= GRID_MAX and GRID_MIN <= y <= GRID_MAX:
+            return self.get_grid(self.current_index)[y - GRID_MIN][x - GRID_MIN]
+        return self.polygons[self.current_index]['polygon'].point_location(Point(x, y))
+    
+    def get_hover_edge(self) -> tuple:
+        """
+        Find the edge nearest to the hovered grid point.
+        
+        Uses the polygon's edge index, so it stays fast on large polygons.
+        
+        Returns:
+            Tuple (edge index, screen endpoints clipped to the plot or an
+            empty tuple if the edge is out of view).
+        """
+        polygon = self.polygons[self.current_index]['polygon']
+        index, _ = polygon.nearest_edge(Point(*self.hover_cell))
+        edge = polygon.edge_index().segments[index]
+        start = self.camera.to_screen(edge.p1.x, edge.p1.y)
+        end = self.camera.to_screen(edge.p2.x, edge.p2.y)
+        return index, self.plot_rect.clipline((int(start[0]), int(start[1])),
+                                              (int(end[0]), int(end[1])))
+    
+    def get_hover_marker_rect(self) -> pygame.Rect:
+        """Get the screen rectangle of the marker on the hovered grid point."""
+        sx, sy = self.camera.to_screen(*self.hover_cell)
+        size = 2 * HOVER_MARKER_RADIUS + 4
+        return pygame.Rect(0, 0, size, size).move(int(sx) - size // 2,
+                                                  int(sy) - size // 2)
+    
+    def update_hover(self, pos: tuple):
+        """Track the grid point under a screen position for the hover readout."""
+        if not self.hover_enabled:
+            return
+        cell = None
+        if self.plot_rect.collidepoint(pos):
+            x, y = self.camera.to_world(*pos)
+            cell = (round(x), round(y))
+        if cell == self.hover_cell:
+            return
+        if self.hover_cell is not None:
+            self.mark_dirty(self.get_hover_marker_rect())
+        if self.hover_edge_rect is not None:
+            self.mark_dirty(self.hover_edge_rect)
+        self.hover_cell = cell
+        self.hover_edge_rect = None
+        if cell is not None:
+            self.mark_dirty(self.get_hover_marker_rect())
+            self.hover_edge_rect = get_line_rect(self.get_hover_edge()[1],
+                                                 NEAREST_EDGE_WIDTH)
+            if self.hover_edge_rect is not None:
+                self.mark_dirty(self.hover_edge_rect)
+        self.mark_dirty(HOVER_RECT)
+    
+    def toggle_hover(self):
+        """Show or hide the hover readout."""
+        self.hover_enabled = not self.hover_enabled
+        if self.hover_cell is not None:
+            self.mark_dirty(self.get_hover_marker_rect())
+        if self.hover_edge_rect is not None:
+            self.mark_dirty(self.hover_edge_rect)
+        self.hover_cell = None
+        self.hover_edge_rect = None
+        self.mark_dirty(HOVER_RECT)
+        self.update_hover(pygame.mouse.get_pos())
+    
+    def get_sight_surface(self) -> pygame.Surface:
+        """Get the region visible from the mouse position as a plot layer."""
+        viewpoint = None
+        if self.sight_pos is not None:
+            viewpoint = (self.current_index, *self.camera.to_world(*self.sight_pos))
+        with self.sight_condition:
+            if viewpoint in self.sight_cache:
+                self.sight_cache.move_to_end(viewpoint)
+                self.sight_shown = (viewpoint, self.sight_cache[viewpoint])
+            elif viewpoint is not None and viewpoint != self.sight_request:
+                # Replace rather than queue: only the latest viewpoint matters
+                self.sight_request = viewpoint
+                self.sight_condition.notify()
+        
+        shown_key, sight = None, None
+        if viewpoint is not None and self.sight_shown is not None:
+            shown_key, sight = self.sight_shown
+            if shown_key[0] != self.current_index:
+                shown_key, sight = None, None
+        key = (self.camera.state, shown_key)
+        if key != self.sight_layer_key:
+            render_sight_layer(self.sight_layer, sight, self.camera,
+                               self.plot_rect.topleft)
+            self.sight_layer_key = key
+        return self.sight_layer
+    
+    def sight_worker(self):
+        """Compute requested visibility polygons until the viewer stops."""
+        while True:
+            with self.sight_condition:
+                while self.running and self.sight_request is None:
+                    self.sight_condition.wait()
+                if not self.running:
+                    return
+                viewpoint = self.sight_request
+            
+            index, x, y = viewpoint
+            try:
+                sight = self.polygons[index]['polygon'].visibility_polygon(Point(x, y))
+            except ValueError:
+                # Outside the polygon or on its boundary
+                sight = None
+            
+            with self.sight_condition:
+                self.sight_cache[viewpoint] = sight
+                if len(self.sight_cache) > SIGHT_CACHE_SIZE:
+                    self.sight_cache.popitem(last=False)
+                if self.sight_request == viewpoint:
+                    self.sight_request = None
+            pygame.event.post(pygame.event.Event(SIGHT_READY_EVENT))
+    
+    def stop_sight(self):
+        """Stop the line of sight thread."""
+        if self.sight_thread is None:
+            return
+        with self.sight_condition:
+            self.running = False
+            self.sight_condition.notify()
+        self.sight_thread.join()
+        self.sight_thread = None
+    
+    def update_sight(self, pos: tuple):
+        """Move the line of sight viewpoint to a screen position."""
+        if not self.sight_enabled:
+            return
+        if not self.plot_rect.collidepoint(pos):
+            pos = None
+        if pos != self.sight_pos:
+            self.sight_pos = pos
+            self.mark_dirty(self.plot_rect)
+    
+    def toggle_sight(self):
+        """Show or hide the line of sight overlay."""
+        self.sight_enabled = not self.sight_enabled
+        self.sight_pos = None
+        if self.sight_enabled and self.sight_thread is None:
+            self.sight_thread = threading.Thread(target=self.sight_worker, daemon=True)
+            self.sight_thread.start()
+        self.mark_dirty(self.plot_rect)
+        self.update_sight(pygame.mouse.get_pos())
+    
+    def toggle_heatmap(self):
+        """Show or hide the classification heatmap."""
+        self.heatmap_enabled = not self.heatmap_enabled
+        self.mark_dirty(self.plot_rect)
+    
+    def store_layers(self, index: int, layers: dict) -> dict:
+        """Add rendered layers to the cache, evicting the oldest entry."""
+        with self.layer_lock:
+            self.layer_cache[index] = layers
+            self.layer_cache.move_to_end(index)
+            if len(self.layer_cache) > LAYER_CACHE_SIZE:
+                self.layer_cache.popitem(last=False)
+        return layers
+    
+    def request_prefetch(self):
+        """Queue the neighbours of the current polygon for background rendering."""
+        if self.prefetch_thread is None:
+            return
+        wanted = []
+        for distance in range(1, PREFETCH_RADIUS + 1):
+            for index in (self.current_index + distance,
+                          self.current_index - distance):
+                if 0 <= index < len(self.polygons):
+                    wanted.append(index)
+        with self.prefetch_condition:
+            # Replace rather than extend: only the latest position matters
+            self.prefetch_queue = wanted
+            self.prefetch_condition.notify()
+    
+    def prefetch_worker(self):
+        """Parse and render queued polygons until the viewer stops."""
+        while True:
+            with self.prefetch_condition:
+                while self.running and not self.prefetch_queue:
+                    self.prefetch_condition.wait()
+                if not self.running:
+                    return
+                index = self.prefetch_queue.pop(0)
+            
+            with self.layer_lock:
+                if index in self.layer_cache:
+                    continue
+            polygon_data = self.polygons[index]
+            self.store_layers(index, {
+                'plot': self.render_plot(index, polygon_data),
+            })
+    
+    def stop_prefetch(self):
+        """Stop the prefetch thread."""
+        if self.prefetch_thread is None:
+            return
+        with self.prefetch_condition:
+            self.running = False
+            self.prefetch_condition.notify()
+        self.prefetch_thread.join()
+        self.prefetch_thread = None
+    
+    def mark_dirty(self, *rects: pygame.Rect):
+        """Queue screen regions for the next redraw."""
+        self.dirty_rects.extend(rects)
+    
+    def mark_content_dirty(self):
+        """Queue every region that shows the current polygon."""
+        self.mark_dirty(self.plot_rect, INFO_RECT, self.legend_rect)
+        if self.hover_enabled:
+            self.mark_dirty(HOVER_RECT)
+    
     def go_to_previous(self):
         """Navigate to previous polygon."""
         if self.current_index > 0:
             self.current_index -= 1
-            self.update_screen_coords()
+            self.mark_content_dirty()
+            self.request_prefetch()
     
     def go_to_next(self):
         """Navigate to next polygon."""
         if self.current_index < len(self.polygons) - 1:
             self.current_index += 1
-            self.update_screen_coords()
+            self.mark_content_dirty()
+            self.request_prefetch()
     
-    def handle_events(self):
-        """Process pygame events."""
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                self.running = False
-            
-            elif event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_ESCAPE:
-                    self.running = False
-                elif event.key in (pygame.K_LEFT, pygame.K_a):
-                    self.go_to_previous()
-                elif event.key in (pygame.K_RIGHT, pygame.K_d):
-                    self.go_to_next()
-            
-            # Button events
-            if self.prev_button.handle_event(event):
+    def toggle_gallery(self):
+        """Switch between the single polygon view and the gallery."""
+        if not self.polygons:
+            return
+        if self.gallery is None:
+            self.gallery = PolygonGallery(self.polygons, self.font,
+                                          self.small_font,
+                                          WINDOW_WIDTH, WINDOW_HEIGHT)
+        self.gallery_active = not self.gallery_active
+        self.gallery.dirty = True
+        self.mark_dirty(self.screen.get_rect())
+    
+    def open_from_gallery(self, index: int):
+        """Leave the gallery showing the polygon at a dataset index."""
+        self.gallery_active = False
+        self.current_index = index
+        self.mark_dirty(self.screen.get_rect())
+        self.request_prefetch()
+    
+    def handle_event(self, event: pygame.event.Event):
+        """Process a single pygame event."""
+        if event.type == pygame.QUIT:
+            self.running = False
+        
+        elif event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
+            self.running = False
+        
+        elif event.type == pygame.KEYDOWN and event.key == pygame.K_g:
+            self.toggle_gallery()
+        
+        elif event.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED):
+            self.mark_dirty(self.screen.get_rect())
+        
+        elif event.type == SIGHT_READY_EVENT:
+            if self.sight_enabled and not self.gallery_active:
+                self.mark_dirty(self.plot_rect)
+        
+        elif self.gallery_active:
+            index = self.gallery.handle_event(event)
+            if index is not None:
+                self.open_from_gallery(index)
+            return
+        
+        elif event.type == pygame.KEYDOWN:
+            if event.key in (pygame.K_LEFT, pygame.K_a):
                 self.go_to_previous()
-            if self.next_button.handle_event(event):
+            elif event.key in (pygame.K_RIGHT, pygame.K_d):
                 self.go_to_next()
+            elif event.key in (pygame.K_EQUALS, pygame.K_PLUS, pygame.K_KP_PLUS):
+                self.zoom_camera(ZOOM_STEP)
+            elif event.key in (pygame.K_MINUS, pygame.K_KP_MINUS):
+                self.zoom_camera(1 / ZOOM_STEP)
+            elif event.key in (pygame.K_0, pygame.K_KP0):
+                self.reset_camera()
+            elif event.key == pygame.K_h:
+                self.toggle_hover()
+            elif event.key == pygame.K_m:
+                self.toggle_heatmap()
+            elif event.key == pygame.K_v:
+                self.toggle_sight()
+        
+        # Camera: wheel zooms about the cursor, dragging the plot pans
+        elif event.type == pygame.MOUSEWHEEL:
+            pos = pygame.mouse.get_pos()
+            if self.plot_rect.collidepoint(pos):
+                self.zoom_camera(ZOOM_STEP ** event.y, pos)
+        
+        elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+            self.dragging = self.plot_rect.collidepoint(event.pos)
+        
+        elif event.type == pygame.MOUSEBUTTONUP and event.button == 1:
+            self.dragging = False
+        
+        elif event.type == pygame.MOUSEMOTION:
+            if self.dragging:
+                self.camera.pan(*event.rel)
+                self.mark_dirty(self.plot_rect)
+            self.update_hover(event.pos)
+            self.update_sight(event.pos)
+        
+        
+        # Button events
+        for button, action in ((self.prev_button, self.go_to_previous),
+                               (self.next_button, self.go_to_next)):
+            was_hovered = button.hovered
+            if button.handle_event(event):
+                action()
+            if button.hovered != was_hovered:
+                self.mark_dirty(button.rect)
     
-    def draw(self):
-        """Render the current frame."""
+    def handle_events(self):
+        """Process pending pygame events."""
+        for event in pygame.event.get():
+            self.handle_event(event)
+    
+    def compose(self, rect: pygame.Rect = None):
+        """
+        Draw the frame from cached surfaces, limited to one screen region.
+        
+        Args:
+            rect: Region to redraw, or None for the whole window.
+        """
+        self.screen.set_clip(rect)
         self.screen.fill(COLOR_BACKGROUND)
         
-        if self.polygons and self.screen_coords:
-            polygon = self.polygons[self.current_index]['polygon']
-            test_points = self.get_current_test_points()
-            
-            # Draw the polygon
-            draw_polygon(self.screen, self.screen_coords)
-            
-            # Draw test points from dataset
-            draw_test_points(self.screen, test_points, polygon,
-                           WINDOW_WIDTH, WINDOW_HEIGHT)
-            
-            # Draw test point legend
-            draw_test_point_legend(self.screen, self.small_font, test_points)
-            
-            # Draw info panel
-            draw_info_panel(
-                self.screen,
-                self.polygons[self.current_index],
-                self.current_index,
-                len(self.polygons),
-                self.font,
-                self.small_font
-            )
+        if self.polygons:
+            layers = self.get_layers(self.current_index)
+            if self.heatmap_enabled:
+                self.screen.blit(self.get_heatmap_surface(self.current_index),
+                                 self.plot_rect.topleft)
+            self.screen.blit(self.get_plot_surface(self.current_index),
+                             self.plot_rect.topleft)
+            if self.sight_enabled:
+                self.screen.blit(self.get_sight_surface(), self.plot_rect.topleft)
+            self.screen.blit(layers['legend'], self.legend_rect.topleft)
+            self.screen.blit(layers['info'], INFO_RECT.topleft)
+            if self.hover_enabled:
+                self.draw_hover()
         
         # Draw navigation buttons
         self.prev_button.draw(self.screen)
         self.next_button.draw(self.screen)
         
         # Draw controls help
-        draw_controls_help(self.screen, self.small_font, WINDOW_HEIGHT)
+        self.screen.blit(self.help_surface, self.help_rect)
         
+        self.screen.set_clip(None)
+    
+    def draw_hover(self):
+        """Draw the hover readout, the nearest edge and the hovered grid point."""
+        location = edge = distance = None
+        if self.hover_cell is not None:
+            location = self.get_hover_location()
+            edge, line = self.get_hover_edge()
+            distance = self.polygons[self.current_index]['polygon'].signed_distance(
+                Point(*self.hover_cell))
+            if line:
+                pygame.draw.line(self.screen, COLOR_NEAREST_EDGE, line[0], line[1],
+                                 NEAREST_EDGE_WIDTH)
+            # The highlight moves with the camera; remember where it was drawn
+            self.hover_edge_rect = get_line_rect(line, NEAREST_EDGE_WIDTH)
+            sx, sy = self.camera.to_screen(*self.hover_cell)
+            pygame.draw.circle(self.screen, COLOR_VERTEX_OUTLINE, (int(sx), int(sy)),
+                               HOVER_MARKER_RADIUS, 2)
+            pygame.draw.circle(self.screen, get_test_point_color(location),
+                               (int(sx), int(sy)), HOVER_MARKER_RADIUS - 3)
+        self.screen.blit(render_hover_panel(self.small_font, self.hover_cell, location,
+                                            edge, distance),
+                         HOVER_RECT.topleft)
+    
+    def draw(self):
+        """Render the whole frame."""
+        if self.gallery_active:
+            self.gallery.draw(self.screen)
+        else:
+            self.compose()
+        self.dirty_rects = []
         pygame.display.flip()
     
+    def redraw_dirty(self):
+        """Redraw and present only the regions queued with mark_dirty."""
+        if self.gallery_active:
+            # The gallery scrolls as a whole, so it redraws every tile
+            if self.gallery.dirty or self.dirty_rects:
+                self.draw()
+            return
+        if not self.dirty_rects:
+            return
+        for rect in self.dirty_rects:
+            self.compose(rect)
+        pygame.display.update(self.dirty_rects)
+        self.dirty_rects = []
+    
     def run(self):
         """Main application loop."""
         print(f"Loaded {len(self.polygons)} polygons")
         print("Use arrow keys or buttons to navigate")
         print("Press ESC to quit")
         
+        self.draw()
         while self.running:
-            self.handle_events()
-            self.draw()
-            self.clock.tick(FPS)
+            if self.event_driven:
+                # Sleep until something happens, unless the gallery still
+                # has thumbnails or statistics to produce
+                busy = self.gallery_active and self.gallery.has_pending_work()
+                if not busy:
+                    self.handle_event(pygame.event.wait())
+                self.handle_events()
+                if self.gallery_active:
+                    self.gallery.update()
+                self.redraw_dirty()
+                if busy:
+                    self.clock.tick(FPS)
+            else:
+                self.handle_events()
+                if self.gallery_active:
+                    self.gallery.update()
+                self.draw()
+                self.clock.tick(FPS)
         
+        self.stop_prefetch()
+        self.stop_sight()
+        if isinstance(self.polygons, LazyPolygonDataset):
+            self.polygons.close()
         pygame.quit()
 
 
@@ -559,7 +2156,11 @@ def main():
         print("Run scripts/generate_polygons.py first to create the dataset.")
         sys.exit(1)
     
-    viewer = PolygonViewer(json_path)
+    # --continuous restores the fixed-rate full redraw loop and --eager
+    # parses the whole dataset up front
+    viewer = PolygonViewer(json_path,
+                           event_driven='--continuous' not in sys.argv[1:],
+                           lazy='--eager' not in sys.argv[1:])
     viewer.run()
 
 
@@ -0,0 +1,172 @@
+"""
+Persistent shape similarity index for a polygon dataset.
+
+Computing the shape descriptor of every polygon is by far the slowest
+part of a similarity search. The standardization, principal axes and
+projected descriptor of every polygon are computed once and stored in a
+SQLite sidecar file next to the dataset; later runs read those vectors
+back and only rebuild the KD-tree over them, which takes milliseconds.
+The sidecar is rebuilt when the dataset's size or modification time
+changes, like the stats sidecar of stats_index.py.
+"""
+
+import os
+import sqlite3
+import sys
+from typing import List
+
+# Add parent directory to path for geometry imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from geometry import Polygon
+from geometry.descriptors import SHAPE_COMPONENTS, ShapeIndex
+from game.polygon_dataset import LazyPolygonDataset
+
+
+# Suffix of the sidecar shape database written next to a dataset
+SHAPES_SUFFIX = '.shapes.sqlite'
+
+# Bumped when the table layout or the descriptor changes, so old sidecars are rebuilt
+SHAPES_VERSION = 1
+
+# Rows inserted per executemany batch while building
+INSERT_BATCH_SIZE = 1000
+
+
+def build_shape_index(filepath: str) -> ShapeIndex:
+    """
+    Index every polygon of a dataset by its shape descriptor.
+    
+    Records are read one at a time through the dataset's offset index.
+    
+    Args:
+        filepath: Path to the JSON dataset.
+    
+    Returns:
+        A ShapeIndex keyed by dataset polygon ids.
+    """
+    dataset = LazyPolygonDataset(filepath)
+    try:
+        return ShapeIndex(
+            (record['id'], Polygon.from_list([[v['x'], v['y']] for v in record['vertices']]))
+            for record in dataset.iter_records())
+    finally:
+        dataset.close()
+
+
+def _component_columns() -> List[str]:
+    """Column names of the projected vector in the shapes table."""
+    return [f"c{k}" for k in range(SHAPE_COMPONENTS)]
+
+
+def _create_tables(connection: sqlite3.Connection):
+    """Create the empty shape, projection and metadata tables."""
+    columns = ', '.join(f"{name} REAL" for name in _component_columns())
+    for table in ('shapes', 'features', 'axes', 'meta'):
+        connection.execute(f"DROP TABLE IF EXISTS {table}")
+    connection.execute(f"CREATE TABLE shapes (position INTEGER PRIMARY KEY, id INTEGER, "
+                       f"{columns})")
+    connection.execute("CREATE TABLE features (feature INTEGER PRIMARY KEY, "
+                       "mean REAL, scale REAL)")
+    connection.execute("CREATE TABLE axes (component INTEGER, feature INTEGER, "
+                       "weight REAL, PRIMARY KEY (component, feature))")
+    connection.execute("CREATE TABLE meta (key TEXT PRIMARY KEY, value INTEGER)")
+
+
+def _is_current(connection: sqlite3.Connection, size: int, mtime_ns: int) -> bool:
+    """Check whether a sidecar was built from the dataset as it is now."""
+    try:
+        meta = dict(connection.execute("SELECT key, value FROM meta"))
+    except sqlite3.DatabaseError:
+        return False
+    return (meta.get('version') == SHAPES_VERSION and meta.get('size') == size and
+            meta.get('mtime_ns') == mtime_ns and
+            meta.get('components') == SHAPE_COMPONENTS)
+
+
+def save_shape_index(connection: sqlite3.Connection, index: ShapeIndex, filepath: str):
+    """
+    Store a dataset's shape index into a database.
+    
+    Args:
+        connection: Database to (re)create the tables in.
+        index: Index built from the dataset, e.g. by build_shape_index.
+        filepath: Path to the JSON dataset, whose size and modification
+                  time are recorded.
+    """
+    stat = os.stat(filepath)
+    names = ['position', 'id'] + _component_columns()
+    insert = (f"INSERT INTO shapes ({', '.join(names)}) "
+              f"VALUES ({', '.join('?' * len(names))})")
+    
+    with connection:
+        _create_tables(connection)
+        rows = [[position, key] + list(vector)
+                for position, (key, vector) in enumerate(zip(index.ids, index.vectors))]
+        for start in range(0, len(rows), INSERT_BATCH_SIZE):
+            connection.executemany(insert, rows[start:start + INSERT_BATCH_SIZE])
+        connection.executemany("INSERT INTO features VALUES (?, ?, ?)",
+                               list(zip(range(len(index.means)), index.means, index.scales)))
+        connection.executemany("INSERT INTO axes VALUES (?, ?, ?)", [
+            (component, feature, weight)
+            for component, axis in enumerate(index.axes)
+            for feature, weight in enumerate(axis)])
+        connection.executemany("INSERT INTO meta VALUES (?, ?)", [
+            ('version', SHAPES_VERSION), ('size', stat.st_size),
+            ('mtime_ns', stat.st_mtime_ns), ('components', SHAPE_COMPONENTS)])
+
+
+def load_shape_index(connection: sqlite3.Connection) -> ShapeIndex:
+    """
+    Rebuild a shape index from a database written by save_shape_index.
+    
+    Args:
+        connection: Database holding the shape tables.
+    
+    Returns:
+        The stored ShapeIndex; only its KD-tree is rebuilt.
+    """
+    ids = []
+    vectors = []
+    for row in connection.execute(f"SELECT id, {', '.join(_component_columns())} "
+                                  f"FROM shapes ORDER BY position"):
+        ids.append(row[0])
+        vectors.append(row[1:])
+    features = list(connection.execute("SELECT mean, scale FROM features ORDER BY feature"))
+    axes = [[0.0] * len(features) for _ in range(SHAPE_COMPONENTS)]
+    for component, feature, weight in connection.execute(
+            "SELECT component, feature, weight FROM axes"):
+        axes[component][feature] = weight
+    return ShapeIndex.from_projection(ids, [mean for mean, _ in features],
+                                      [scale for _, scale in features], axes, vectors)
+
+
+def open_shape_index(filepath: str) -> ShapeIndex:
+    """
+    Open the shape sidecar of a dataset, building it if missing or stale.
+    
+    If the sidecar cannot be written (e.g. a read-only directory), the
+    index is built in memory and not persisted.
+    
+    Args:
+        filepath: Path to the JSON dataset.
+    
+    Returns:
+        A ShapeIndex keyed by dataset polygon ids.
+    """
+    stat = os.stat(filepath)
+    try:
+        connection = sqlite3.connect(filepath + SHAPES_SUFFIX)
+    except sqlite3.Error:
+        return build_shape_index(filepath)
+    try:
+        if _is_current(connection, stat.st_size, stat.st_mtime_ns):
+            return load_shape_index(connection)
+        index = build_shape_index(filepath)
+        try:
+            save_shape_index(connection, index, filepath)
+        except sqlite3.Error:
+            pass
+        return index
+    finally:
+        connection.close()
@@ -0,0 +1,209 @@
+"""
+Persistent per-polygon statistics for fast dataset queries.
+
+The stats of every polygon (vertex count, area, perimeter, convexity,
+holes and test-point mix) are computed once and stored in a SQLite
+sidecar file next to the dataset. Range and filter queries then run as
+indexed SQL over that table, without parsing the dataset or recomputing
+any geometry. The sidecar is rebuilt when the dataset's size or
+modification time changes, like the offset index of polygon_dataset.py.
+"""
+
+import os
+import sqlite3
+import sys
+from typing import Dict, Iterator, List, Optional, Tuple
+
+# Add parent directory to path for geometry imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from geometry import Polygon, PolygonWithHoles
+from game.polygon_dataset import LazyPolygonDataset
+
+
+# Suffix of the sidecar stats database written next to a dataset
+STATS_SUFFIX = '.stats.sqlite'
+
+# Bumped when the table layout changes, so old sidecars are rebuilt
+STATS_VERSION = 1
+
+# Numeric columns that can be filtered by range, in output order
+RANGE_COLUMNS = ['vertices', 'area', 'perimeter', 'holes',
+                 'points', 'inside', 'outside', 'boundary']
+
+# Columns with a SQL index, for the most common range filters
+INDEXED_COLUMNS = ['vertices', 'area', 'perimeter']
+
+# Rows inserted per executemany batch while building
+INSERT_BATCH_SIZE = 1000
+
+
+def record_stats(record: dict) -> dict:
+    """
+    Compute the stats of one dataset record.
+    
+    Args:
+        record: A record from the dataset's "polygons" array.
+    
+    Returns:
+        Dictionary with 'id' and a value for every RANGE_COLUMNS entry and
+        'convex'. Area is that of the region, with holes cut out.
+    """
+    polygon = Polygon.from_list([[v['x'], v['y']] for v in record['vertices']])
+    holes = [Polygon.from_list([[v['x'], v['y']] for v in hole])
+             for hole in record.get('holes', [])]
+    region = PolygonWithHoles(polygon, holes) if holes else polygon
+    
+    locations = [tp['location'] for tp in record.get('test_points', [])]
+    return {
+        'id': record['id'],
+        'vertices': polygon.num_vertices,
+        'area': region.area(),
+        'perimeter': region.perimeter(),
+        'convex': not holes and polygon.is_convex(),
+        'holes': len(holes),
+        'points': len(locations),
+        'inside': locations.count('INSIDE'),
+        'outside': locations.count('OUTSIDE'),
+        'boundary': locations.count('BOUNDARY'),
+    }
+
+
+def _create_tables(connection: sqlite3.Connection):
+    """Create the empty stats and metadata tables."""
+    columns = ', '.join(f"{name} {'REAL' if name in ('area', 'perimeter') else 'INTEGER'}"
+                        for name in RANGE_COLUMNS)
+    connection.execute("DROP TABLE IF EXISTS stats")
+    connection.execute("DROP TABLE IF EXISTS meta")
+    connection.execute(f"CREATE TABLE stats (position INTEGER PRIMARY KEY, id INTEGER, "
+                       f"convex INTEGER, {columns})")
+    connection.execute("CREATE TABLE meta (key TEXT PRIMARY KEY, value INTEGER)")
+
+
+def _is_current(connection: sqlite3.Connection, size: int, mtime_ns: int) -> bool:
+    """Check whether a sidecar was built from the dataset as it is now."""
+    try:
+        meta = dict(connection.execute("SELECT key, value FROM meta"))
+    except sqlite3.DatabaseError:
+        return False
+    return (meta.get('version') == STATS_VERSION and meta.get('size') == size and
+            meta.get('mtime_ns') == mtime_ns)
+
+
+def build_stats(connection: sqlite3.Connection, filepath: str):
+    """
+    Compute the stats of every polygon of a dataset into a database.
+    
+    Records are read one at a time through the dataset's offset index.
+    
+    Args:
+        connection: Database to (re)create the tables in.
+        filepath: Path to the JSON dataset.
+    """
+    stat = os.stat(filepath)
+    names = ['position', 'id', 'convex'] + RANGE_COLUMNS
+    insert = (f"INSERT INTO stats ({', '.join(names)}) "
+              f"VALUES ({', '.join('?' * len(names))})")
+    
+    dataset = LazyPolygonDataset(filepath)
+    try:
+        with connection:
+            _create_tables(connection)
+            batch = []
+            for position, record in enumerate(dataset.iter_records()):
+                stats = record_stats(record)
+                stats['position'] = position
+                batch.append([stats[name] for name in names])
+                if len(batch) >= INSERT_BATCH_SIZE:
+                    connection.executemany(insert, batch)
+                    batch = []
+            connection.executemany(insert, batch)
+            for name in INDEXED_COLUMNS:
+                connection.execute(f"CREATE INDEX stats_{name} ON stats ({name})")
+            connection.executemany("INSERT INTO meta VALUES (?, ?)", [
+                ('version', STATS_VERSION), ('size', stat.st_size),
+                ('mtime_ns', stat.st_mtime_ns)])
+    finally:
+        dataset.close()
+
+
+def open_stats_index(filepath: str) -> sqlite3.Connection:
+    """
+    Open the stats sidecar of a dataset, building it if missing or stale.
+    
+    If the sidecar cannot be written (e.g. a read-only directory), the
+    stats are built in an in-memory database instead.
+    
+    Args:
+        filepath: Path to the JSON dataset.
+    
+    Returns:
+        A connection whose "stats" table has one row per polygon.
+    """
+    stat = os.stat(filepath)
+    try:
+        connection = sqlite3.connect(filepath + STATS_SUFFIX)
+        if _is_current(connection, stat.st_size, stat.st_mtime_ns):
+            return connection
+        build_stats(connection, filepath)
+        return connection
+    except sqlite3.Error:
+        connection = sqlite3.connect(':memory:')
+        build_stats(connection, filepath)
+        return connection
+
+
+def query_stats(connection: sqlite3.Connection,
+                ranges: Optional[Dict[str, Tuple[Optional[float], Optional[float]]]] = None,
+                convex: Optional[bool] = None, order_by: str = 'position',
+                descending: bool = False, limit: Optional[int] = None) -> Iterator[dict]:
+    """
+    Select polygons by their stats.
+    
+    Args:
+        connection: Connection from open_stats_index.
+        ranges: Inclusive (low, high) bounds per RANGE_COLUMNS name;
+                either bound may be None.
+        convex: If set, only convex (True) or non-convex (False) polygons.
+        order_by: Column to sort by: 'position', 'id' or a RANGE_COLUMNS name.
+        descending: Sort in descending order.
+        limit: Maximum number of rows.
+    
+    Yields:
+        Dictionaries with 'position', 'id', 'convex' and every RANGE_COLUMNS
+        value.
+    
+    Raises:
+        ValueError: If a column name is unknown.
+    """
+    conditions: List[str] = []
+    parameters: List[float] = []
+    for name, (low, high) in (ranges or {}).items():
+        if name not in RANGE_COLUMNS:
+            raise ValueError(f"Unknown stats column: {name}")
+        if low is not None:
+            conditions.append(f"{name} >= ?")
+            parameters.append(low)
+        if high is not None:
+            conditions.append(f"{name} <= ?")
+            parameters.append(high)
+    if convex is not None:
+        conditions.append("convex = ?")
+        parameters.append(int(convex))
+    if order_by not in ['position', 'id'] + RANGE_COLUMNS:
+        raise ValueError(f"Unknown stats column: {order_by}")
+    
+    sql = "SELECT * FROM stats"
+    if conditions:
+        sql += " WHERE " + " AND ".join(conditions)
+    sql += f" ORDER BY {order_by} {'DESC' if descending else 'ASC'}, position"
+    if limit is not None:
+        sql += " LIMIT ?"
+        parameters.append(limit)
+    
+    cursor = connection.execute(sql, parameters)
+    names = [column[0] for column in cursor.description]
+    for row in cursor:
+        stats = dict(zip(names, row))
+        stats['convex'] = bool(stats['convex'])
+        yield stats
@@ -5,5 +5,27 @@ Geometry library for polygon operations.
 from .point import Point
 from .segment import Segment
 from .polygon import Polygon
+from .convex import ConvexPolygon, convex_hull
+from .decomposition import ConvexDecomposition, triangulate
+from .spatial_hash import (PointHash, find_shared_vertices,
+                           find_shared_endpoints, weld_polygons)
+from .intersections import find_intersections
+from .raster import classify_grid
+from .multipolygon import PolygonWithHoles, MultiPolygon
+from .boolean import boolean_operation
+from .edge_index import EdgeBVH
+from .visibility import RayCaster
+from .sampling import PoissonDiskGrid, poisson_disk_sample
+from .minkowski import (minkowski_sum, minkowski_sum_convex, no_fit_polygon,
+                        NoFitPolygonCache)
+from .kdtree import KDTree
+from .descriptors import shape_descriptor, ShapeIndex
 
-__all__ = ['Point', 'Segment', 'Polygon']
+__all__ = ['Point', 'Segment', 'Polygon', 'ConvexPolygon', 'convex_hull',
+           'ConvexDecomposition', 'triangulate',
+           'PointHash', 'find_shared_vertices', 'find_shared_endpoints',
+           'weld_polygons', 'find_intersections', 'classify_grid',
+           'PolygonWithHoles', 'MultiPolygon', 'boolean_operation', 'EdgeBVH',
+           'RayCaster', 'PoissonDiskGrid', 'poisson_disk_sample',
+           'minkowski_sum', 'minkowski_sum_convex', 'no_fit_polygon',
+           'NoFitPolygonCache', 'KDTree', 'shape_descriptor', 'ShapeIndex']
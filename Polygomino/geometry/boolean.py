@@ -0,0 +1,359 @@
+"""
+Boolean operations on polygons: union, intersection, difference and xor.
+"""
+
+from __future__ import annotations
+import functools
+from fractions import Fraction
+from typing import Dict, List, Tuple, Union
+from .point import Point
+from .segment import Segment
+from .polygon import Polygon
+from .intersections import find_intersections
+from .multipolygon import PolygonWithHoles, MultiPolygon
+
+Shape = Union[Polygon, PolygonWithHoles, MultiPolygon]
+
+# Whether a face is in the result, given whether it is in each operand
+OPERATIONS = {
+    'union': lambda a, b: a or b,
+    'intersection': lambda a, b: a and b,
+    'difference': lambda a, b: a and not b,
+    'xor': lambda a, b: a != b,
+}
+
+
+def _exact(value) -> Union[int, Fraction]:
+    """Convert a coordinate to an int, or a Fraction if it is not integral."""
+    if isinstance(value, int):
+        return value
+    value = Fraction(value)
+    return value.numerator if value.denominator == 1 else value
+
+
+def _plain(value: Union[int, Fraction]) -> Union[int, float]:
+    """Convert an exact coordinate back to an int, or a float."""
+    if isinstance(value, int):
+        return value
+    return value.numerator if value.denominator == 1 else float(value)
+
+
+def _orient(a: tuple, b: tuple, c: tuple):
+    """Cross product of (b - a) and (c - a); positive if c is left of a->b."""
+    return (b[0] - a[0]) * (c[1] - a[1]) - (b[1] - a[1]) * (c[0] - a[0])
+
+
+def _shape_rings(shape: Shape) -> List[Polygon]:
+    """Get the boundary rings of a Polygon, PolygonWithHoles or MultiPolygon."""
+    return [shape] if isinstance(shape, Polygon) else shape.rings
+
+
+def _split_edges(first: Shape, second: Shape) -> Dict[Tuple[tuple, tuple], List[int]]:
+    """
+    Split the edges of both operands where they touch each other.
+    
+    Touching pairs come from the Bentley-Ottmann sweep of
+    find_intersections, and split points are computed exactly, so the
+    pieces only meet at their endpoints. Identical pieces are merged.
+    
+    Returns:
+        Dictionary mapping each piece (left, right), with left < right
+        in (x, y) order, to the parity of its edge count in each operand.
+    """
+    segments = []
+    owners = []
+    for operand, shape in enumerate((first, second)):
+        for ring in _shape_rings(shape):
+            points = [(_exact(v.x), _exact(v.y)) for v in ring.vertices]
+            for i in range(len(points)):
+                p, q = points[i], points[(i + 1) % len(points)]
+                if p != q:
+                    segments.append((p, q) if p < q else (q, p))
+                    owners.append(operand)
+    
+    cuts = [list(segment) for segment in segments]
+    edges = [Segment(Point(*p), Point(*q)) for p, q in segments]
+    for i, j in find_intersections(edges):
+        (p1, q1), (p2, q2) = segments[i], segments[j]
+        dx1, dy1 = q1[0] - p1[0], q1[1] - p1[1]
+        dx2, dy2 = q2[0] - p2[0], q2[1] - p2[1]
+        denom = dx1 * dy2 - dy1 * dx2
+        if denom == 0:
+            # Collinear overlap: each is cut at the other's inner endpoints
+            for point in (p2, q2):
+                if p1 < point < q1:
+                    cuts[i].append(point)
+            for point in (p1, q1):
+                if p2 < point < q2:
+                    cuts[j].append(point)
+            continue
+        ex, ey = p2[0] - p1[0], p2[1] - p1[1]
+        u = Fraction(ex * dy2 - ey * dx2, denom)
+        point = (_exact(p1[0] + u * dx1), _exact(p1[1] + u * dy1))
+        cuts[i].append(point)
+        cuts[j].append(point)
+    
+    pieces: Dict[Tuple[tuple, tuple], List[int]] = {}
+    for points, operand in zip(cuts, owners):
+        points = sorted(set(points))
+        for p, q in zip(points, points[1:]):
+            pieces.setdefault((p, q), [0, 0])[operand] ^= 1
+    return pieces
+
+
+class _SweepEdge:
+    """A piece of boundary with the operands' interiors on either side."""
+    
+    __slots__ = ('left', 'right', 'in_first', 'in_second',
+                 'above_first', 'above_second')
+    
+    def __init__(self, left: tuple, right: tuple, counts: List[int]):
+        self.left = left
+        self.right = right
+        self.in_first = counts[0] == 1
+        self.in_second = counts[1] == 1
+        self.above_first = False
+        self.above_second = False
+    
+    def slope_key(self) -> tuple:
+        """Sort key for edges leaving one point, bottom to top."""
+        dx = self.right[0] - self.left[0]
+        if dx == 0:
+            return (True, 0)
+        return (False, Fraction(self.right[1] - self.left[1], dx))
+
+
+def _label_edges(pieces: Dict[Tuple[tuple, tuple], List[int]]) -> List[_SweepEdge]:
+    """
+    Find which faces above each edge lie inside each operand.
+    
+    A left-to-right sweep keeps the edges crossing the sweep line in
+    bottom-to-top order, as in the Martinez-Rueda algorithm. The face
+    below a new edge is the face above its predecessor, and crossing an
+    edge of an operand toggles whether that operand is inside (even-odd
+    rule, as in Polygon.point_location). Vertical edges are ordered as if
+    sheared slightly, so their "above" side is their left side.
+    """
+    edges = [_SweepEdge(p, q, counts) for (p, q), counts in pieces.items()
+             if counts[0] or counts[1]]
+    
+    # Ends before starts at each point, and starts bottom to top, so an
+    # edge's predecessor is final when it is inserted
+    events = [(edge.right, 0, (), edge) for edge in edges]
+    events += [(edge.left, 1, edge.slope_key(), edge) for edge in edges]
+    events.sort(key=lambda event: event[:3])
+    
+    status: List[_SweepEdge] = []
+    for point, is_start, _, edge in events:
+        if not is_start:
+            status.remove(edge)
+            continue
+        
+        # Edges are disjoint apart from endpoints: compare at this point,
+        # or by direction for edges leaving it
+        lo, hi = 0, len(status)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            other = status[mid]
+            side = _orient(other.left, other.right, point)
+            if side == 0:
+                side = _orient(other.left, other.right, edge.right)
+            if side > 0:
+                lo = mid + 1
+            else:
+                hi = mid
+        
+        if lo > 0:
+            below = status[lo - 1]
+            edge.above_first = below.above_first != edge.in_first
+            edge.above_second = below.above_second != edge.in_second
+        else:
+            edge.above_first = edge.in_first
+            edge.above_second = edge.in_second
+        status.insert(lo, edge)
+    
+    return edges
+
+
+def _clockwise_from(reference: tuple):
+    """Sort key ordering directions by clockwise angle from a reference direction."""
+    def compare(a: tuple, b: tuple) -> int:
+        def half(d):
+            cross = reference[0] * d[1] - reference[1] * d[0]
+            if cross < 0:
+                return 0
+            if cross == 0:
+                return 1
+            return 2
+        ha, hb = half(a), half(b)
+        if ha != hb:
+            return ha - hb
+        cross = a[0] * b[1] - a[1] * b[0]
+        return 1 if cross > 0 else (-1 if cross < 0 else 0)
+    return functools.cmp_to_key(compare)
+
+
+def _split_at_repeats(ring: List[tuple]) -> List[List[tuple]]:
+    """Split a closed walk that visits a vertex more than once into simple loops."""
+    loops = []
+    stack: List[tuple] = []
+    position: Dict[tuple, int] = {}
+    for point in ring:
+        if point in position:
+            k = position[point]
+            loops.append(stack[k:])
+            for other in stack[k + 1:]:
+                del position[other]
+            del stack[k + 1:]
+        else:
+            position[point] = len(stack)
+            stack.append(point)
+    loops.append(stack)
+    return loops
+
+
+def _trace_rings(directed: List[Tuple[tuple, tuple]]) -> List[List[tuple]]:
+    """
+    Join directed edges, interior on their left, into simple closed rings.
+    
+    After each edge comes the outgoing edge closest clockwise to it, so
+    each walk follows the boundary of one face of the result. Walks that
+    pass a vertex twice, where a boundary touches itself, are split there;
+    the resulting rings may touch each other at such vertices.
+    """
+    outgoing: Dict[tuple, List[tuple]] = {}
+    for p, q in directed:
+        outgoing.setdefault(p, []).append(q)
+    
+    rings = []
+    visited = set()
+    for edge in directed:
+        walk = []
+        while edge not in visited:
+            visited.add(edge)
+            previous, current = edge
+            walk.append(previous)
+            candidates = outgoing[current]
+            if len(candidates) == 1:
+                following = candidates[0]
+            else:
+                key = _clockwise_from((previous[0] - current[0], previous[1] - current[1]))
+                following = min(candidates,
+                                key=lambda q: key((q[0] - current[0], q[1] - current[1])))
+            edge = (current, following)
+        if walk:
+            rings.extend(_split_at_repeats(walk))
+    return rings
+
+
+def _signed_area2(ring: List[tuple]):
+    """Twice the signed area of a ring; positive if counter-clockwise."""
+    total = 0
+    for i in range(len(ring)):
+        (x1, y1), (x2, y2) = ring[i - 1], ring[i]
+        total += x1 * y2 - x2 * y1
+    return total
+
+
+def _ring_contains(ring: List[tuple], point: tuple) -> bool:
+    """Exact even-odd test for a point known not to lie on the ring."""
+    inside = False
+    for i in range(len(ring)):
+        a, b = ring[i - 1], ring[i]
+        if (a[1] > point[1]) != (b[1] > point[1]):
+            side = _orient(a, b, point)
+            if (side > 0) == (b[1] > a[1]):
+                inside = not inside
+    return inside
+
+
+def _drop_collinear(ring: List[tuple]) -> List[tuple]:
+    """Remove vertices where the ring continues in a straight line."""
+    n = len(ring)
+    return [ring[i] for i in range(n)
+            if _orient(ring[i - 1], ring[i], ring[(i + 1) % n]) != 0]
+
+
+def _to_polygon(ring: List[tuple], exact: bool) -> Polygon:
+    """Build a Polygon from exact ring coordinates."""
+    convert = _exact if exact else _plain
+    return Polygon([Point(convert(x), convert(y)) for x, y in _drop_collinear(ring)])
+
+
+def boolean_operation(first: Shape, second: Shape, operation: str,
+                      exact: bool = False) -> MultiPolygon:
+    """
+    Combine two shapes with a boolean operation.
+    
+    The edges of both shapes are split where they meet, using the
+    Bentley-Ottmann sweep of find_intersections, and a second sweep in the
+    manner of Martinez-Rueda labels each piece with the operands' interiors
+    on either side. Pieces with the result on exactly one side are joined
+    into rings; counter-clockwise rings are outer boundaries and each
+    clockwise ring becomes a hole of the smallest outer ring around it.
+    
+    All predicates are exact: integer and float coordinates are used as
+    exact integers or fractions, and only new intersection points that are
+    not integral are rounded to floats in the result, unless exact is set.
+    Rounding can make nearly collinear edges of the result touch or
+    cross, so pass exact=True when chaining many operations. Each operand
+    is filled by the even-odd rule of Polygon.point_location, so holes and
+    even self-intersecting rings are handled consistently. The result's
+    rings are simple but may touch each other at single vertices, which
+    MultiPolygon.validation_errors() allows, so exact results validate.
+    
+    Args:
+        first: A Polygon, PolygonWithHoles or MultiPolygon.
+        second: A Polygon, PolygonWithHoles or MultiPolygon.
+        operation: 'union', 'intersection', 'difference' (first minus
+                   second) or 'xor'.
+        exact: If True, keep non-integral coordinates of the result as
+               Fractions instead of floats.
+    
+    Returns:
+        A MultiPolygon of PolygonWithHoles, empty if the result is empty.
+    
+    Raises:
+        ValueError: If the operation is unknown.
+    """
+    if operation not in OPERATIONS:
+        raise ValueError(f"Unknown boolean operation: {operation}")
+    keep = OPERATIONS[operation]
+    
+    directed = []
+    for edge in _label_edges(_split_edges(first, second)):
+        above = keep(edge.above_first, edge.above_second)
+        below = keep(edge.above_first != edge.in_first,
+                     edge.above_second != edge.in_second)
+        if above != below:
+            # Direct edges so that the result lies on their left
+            directed.append((edge.left, edge.right) if above
+                            else (edge.right, edge.left))
+    
+    outers, holes = [], []
+    for ring in _trace_rings(directed):
+        area2 = _signed_area2(ring)
+        (outers if area2 > 0 else holes).append((ring, area2))
+    
+    # A hole belongs to the smallest outer ring containing an edge
+    # midpoint of it; midpoints of pieces lie on no other ring
+    assigned = [[] for _ in outers]
+    boxes = [(min(x for x, _ in ring), min(y for _, y in ring),
+              max(x for x, _ in ring), max(y for _, y in ring))
+             for ring, _ in outers]
+    for hole, _ in holes:
+        (x1, y1), (x2, y2) = hole[0], hole[1]
+        mid = (Fraction(x1 + x2) / 2, Fraction(y1 + y2) / 2)
+        parent = None
+        for k, (ring, area2) in enumerate(outers):
+            min_x, min_y, max_x, max_y = boxes[k]
+            if not (min_x < mid[0] < max_x and min_y < mid[1] < max_y):
+                continue
+            if (parent is None or area2 < outers[parent][1]) and _ring_contains(ring, mid):
+                parent = k
+        if parent is not None:
+            assigned[parent].append(hole)
+    
+    return MultiPolygon([PolygonWithHoles(_to_polygon(ring, exact),
+                                          [_to_polygon(hole, exact) for hole in assigned[k]])
+                         for k, (ring, _) in enumerate(outers)])
@@ -0,0 +1,292 @@
+"""
+Convex polygon specialization and convex hull construction.
+"""
+
+from __future__ import annotations
+from typing import Iterable, List, Optional, Tuple
+from .point import Point
+from .polygon import Polygon
+
+
+def _cross(ox: float, oy: float, ax: float, ay: float,
+           bx: float, by: float) -> float:
+    """Cross product of vectors (a-o) and (b-o) on raw coordinates."""
+    return (ax - ox) * (by - oy) - (ay - oy) * (bx - ox)
+
+
+def convex_hull(points: Iterable[Point]) -> List[Point]:
+    """
+    Compute the convex hull of a set of points using Andrew's monotone chain.
+    
+    Runs in O(n log n). Collinear points on the hull boundary are dropped.
+    
+    Args:
+        points: Points to enclose.
+    
+    Returns:
+        Hull vertices in counter-clockwise order, starting from the
+        lowest-x (then lowest-y) point. Fewer than 3 points are returned
+        when the input is degenerate.
+    """
+    pts = sorted(set((p.x, p.y) for p in points))
+    if len(pts) <= 2:
+        return [Point(x, y) for x, y in pts]
+    
+    lower = []
+    for p in pts:
+        while len(lower) >= 2 and _cross(*lower[-2], *lower[-1], *p) <= 0:
+            lower.pop()
+        lower.append(p)
+    
+    upper = []
+    for p in reversed(pts):
+        while len(upper) >= 2 and _cross(*upper[-2], *upper[-1], *p) <= 0:
+            upper.pop()
+        upper.append(p)
+    
+    # Last point of each chain is the first point of the other
+    hull = lower[:-1] + upper[:-1]
+    return [Point(x, y) for x, y in hull]
+
+
+def convex_ring(vertices: List[Point]) -> Optional[Tuple[List[int], int]]:
+    """
+    Reduce a polygon to its strictly convex corner vertices.
+    
+    Unlike Polygon.is_convex, this also rejects polygons whose turns all
+    share a sign but which wind around more than once (e.g. a pentagram),
+    backtracking spikes, and zero-area polygons.
+    
+    Args:
+        vertices: Polygon vertices in either orientation.
+    
+    Returns:
+        Tuple (indices, orientation) where indices are the original
+        vertex indices of the strict corners in input order and
+        orientation is +1 for counter-clockwise, -1 for clockwise.
+        None if the polygon is not a simple convex polygon.
+    """
+    n = len(vertices)
+    xs = [v.x for v in vertices]
+    ys = [v.y for v in vertices]
+    
+    # Skip repeated vertices so every turn is measured between real edges
+    distinct = [i for i in range(n)
+                if xs[i] != xs[i - 1] or ys[i] != ys[i - 1]]
+    if len(distinct) < 3:
+        return None
+    
+    corners = []
+    sign = 0
+    d = len(distinct)
+    for k in range(d):
+        h, i, j = distinct[k - 1], distinct[k], distinct[(k + 1) % d]
+        ax, ay = xs[i] - xs[h], ys[i] - ys[h]
+        bx, by = xs[j] - xs[i], ys[j] - ys[i]
+        cross = ax * by - ay * bx
+        if cross == 0:
+            # Straight-through vertices are harmless, a reversal of
+            # direction is a spike
+            if ax * bx + ay * by < 0:
+                return None
+            continue
+        current = 1 if cross > 0 else -1
+        if sign == 0:
+            sign = current
+        elif sign != current:
+            return None
+        corners.append(i)
+    
+    if len(corners) < 3:
+        return None
+    
+    # Same-sign turns can still wind more than once; a simple convex
+    # polygon changes x and y direction at most twice each
+    x_flips = y_flips = 0
+    last_dx = last_dy = 0
+    m = len(corners)
+    for k in range(m + 1):
+        a = corners[k % m]
+        b = corners[(k + 1) % m]
+        dx = xs[b] - xs[a]
+        dy = ys[b] - ys[a]
+        if dx != 0:
+            if last_dx != 0 and (dx > 0) != (last_dx > 0):
+                x_flips += 1
+            last_dx = dx
+        if dy != 0:
+            if last_dy != 0 and (dy > 0) != (last_dy > 0):
+                y_flips += 1
+            last_dy = dy
+    # The loop visits the first edge twice so the closing flip is counted
+    if x_flips > 2 or y_flips > 2:
+        return None
+    
+    return corners, sign
+
+
+class ConvexPolygon(Polygon):
+    """
+    A simple convex polygon with O(log n) point location.
+    
+    Point location binary-searches the fan of wedges around the first
+    corner vertex. The boundary test only visits edges whose bounding
+    boxes come within tolerance of the point, found through the edge
+    index, so results match Polygon.point_location at any tolerance.
+    """
+    
+    def __init__(self, vertices: List[Point]):
+        """
+        Initialize a convex polygon.
+        
+        Args:
+            vertices: List of Point objects in either orientation.
+                     Collinear and repeated vertices are allowed.
+        
+        Raises:
+            ValueError: If the vertices do not form a simple convex polygon.
+        """
+        super().__init__(vertices)
+        if self._build_locator() is None:
+            raise ValueError("Vertices do not form a simple convex polygon")
+    
+    def __repr__(self) -> str:
+        return f"ConvexPolygon({len(self.vertices)} vertices)"
+    
+    @staticmethod
+    def from_list(coords: List[List[float]]) -> ConvexPolygon:
+        """
+        Create a ConvexPolygon from a list of [x, y] coordinate pairs.
+        
+        Args:
+            coords: List of [x, y] pairs.
+        
+        Returns:
+            A ConvexPolygon object.
+        """
+        return ConvexPolygon([Point(c[0], c[1]) for c in coords])
+    
+    @staticmethod
+    def hull_of(points: Iterable[Point]) -> ConvexPolygon:
+        """
+        Create the convex hull of a set of points as a ConvexPolygon.
+        
+        Args:
+            points: Points to enclose.
+        
+        Returns:
+            A counter-clockwise ConvexPolygon.
+        
+        Raises:
+            ValueError: If all points are collinear.
+        """
+        return ConvexPolygon(convex_hull(points))
+    
+    def as_convex(self) -> ConvexPolygon:
+        """Return this polygon, which is already convex."""
+        return self
+    
+    def _build_locator(self) -> Optional[tuple]:
+        """
+        Build the wedge search structure, cached until vertices change.
+        
+        Returns:
+            Tuple (xs, ys) with corner coordinates in counter-clockwise
+            order. None if the polygon is not convex.
+        """
+        if 'convex_locator' in self._cache:
+            return self._cache['convex_locator']
+        
+        locator = None
+        ring = convex_ring(self.vertices)
+        if ring is not None:
+            corners, orientation = ring
+            if orientation < 0:
+                corners = corners[::-1]
+            xs = [self.vertices[i].x for i in corners]
+            ys = [self.vertices[i].y for i in corners]
+            locator = (xs, ys)
+        
+        self._cache['convex_locator'] = locator
+        return locator
+    
+    def _find_wedge(self, x: float, y: float, xs: List[float],
+                    ys: List[float]) -> int:
+        """
+        Binary search for the wedge around corner 0 containing (x, y).
+        
+        Returns:
+            Index i in [1, m-2] such that the wedge between rays to
+            corners i and i+1 is the closest one to the point.
+        """
+        x0, y0 = xs[0], ys[0]
+        lo, hi = 1, len(xs) - 2
+        while lo < hi:
+            mid = (lo + hi + 1) // 2
+            if _cross(x0, y0, xs[mid], ys[mid], x, y) >= 0:
+                lo = mid
+            else:
+                hi = mid - 1
+        return lo
+    
+    def intersects_convex(self, other: ConvexPolygon) -> bool:
+        """
+        Check if two convex polygons share at least one point.
+        
+        Uses the separating axis theorem over the edge normals of both
+        polygons. Touching boundaries count as intersecting.
+        
+        Args:
+            other: The other convex polygon.
+        
+        Returns:
+            True if the polygons intersect, False otherwise.
+        """
+        own = self._build_locator()
+        theirs = other._build_locator()
+        for (xs, ys), (other_xs, other_ys) in ((own, theirs), (theirs, own)):
+            m = len(xs)
+            for i in range(m):
+                j = (i + 1) % m
+                # Outward normal of a counter-clockwise edge
+                nx, ny = ys[j] - ys[i], xs[i] - xs[j]
+                limit = nx * xs[i] + ny * ys[i]
+                if all(nx * x + ny * y > limit
+                       for x, y in zip(other_xs, other_ys)):
+                    return False
+        return True
+    
+    def point_location(self, point: Point, tolerance: float = 0.5) -> str:
+        """
+        Determine if a point is inside, outside, or on an edge of the polygon.
+        
+        Runs in O(log n) using a wedge binary search, plus the edges
+        within tolerance of the point.
+        
+        Args:
+            point: The point to check.
+            tolerance: Numerical tolerance for edge detection.
+                       Default of 0.5 is suitable for integer coordinates.
+        
+        Returns:
+            'INSIDE', 'OUTSIDE' or 'BOUNDARY', as Polygon.point_location.
+        """
+        locator = self._build_locator()
+        if locator is None:
+            return self._scan_point_location(point, tolerance)
+        xs, ys = locator
+        m = len(xs)
+        x, y = point.x, point.y
+        
+        # A large tolerance can reach edges far from the point's wedge
+        index = self.edge_index()
+        for k in index.within(point, tolerance):
+            if index.segments[k].contains_point(point, tolerance):
+                return 'BOUNDARY'
+        
+        i = self._find_wedge(x, y, xs, ys)
+        if (_cross(xs[0], ys[0], xs[1], ys[1], x, y) > 0 and
+                _cross(xs[0], ys[0], xs[m - 1], ys[m - 1], x, y) < 0 and
+                _cross(xs[i], ys[i], xs[i + 1], ys[i + 1], x, y) > 0):
+            return 'INSIDE'
+        return 'OUTSIDE'
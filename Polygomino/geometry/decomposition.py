@@ -0,0 +1,391 @@
+"""
+Triangulation and convex decomposition of simple polygons.
+"""
+
+from __future__ import annotations
+from typing import List, Optional, Tuple, TYPE_CHECKING
+from .point import Point
+from .convex import ConvexPolygon
+
+if TYPE_CHECKING:
+    from .polygon import Polygon
+
+
+def _cross(ax: float, ay: float, bx: float, by: float,
+           cx: float, cy: float) -> float:
+    """Cross product of vectors (b-a) and (c-a) on raw coordinates."""
+    return (bx - ax) * (cy - ay) - (by - ay) * (cx - ax)
+
+
+def _signed_area2(ring: List[int], xs: List[float], ys: List[float]) -> float:
+    """Twice the signed area of a ring of vertex indices."""
+    total = 0.0
+    for k in range(len(ring)):
+        i, j = ring[k - 1], ring[k]
+        total += xs[i] * ys[j] - xs[j] * ys[i]
+    return total
+
+
+def _clean_ring(ring: List[int], xs: List[float],
+                ys: List[float]) -> List[int]:
+    """
+    Drop repeated, straight-through and spike vertices from a ring.
+    
+    None of these change the enclosed region, and none of them ever need
+    to be a triangle corner.
+    """
+    ring = list(ring)
+    k = 0
+    checked = 0
+    while len(ring) >= 3 and checked < len(ring):
+        m = len(ring)
+        k %= m
+        h, i, j = ring[k - 1], ring[k], ring[(k + 1) % m]
+        if _cross(xs[h], ys[h], xs[i], ys[i], xs[j], ys[j]) == 0:
+            # Removing a vertex can make its predecessor removable
+            del ring[k]
+            k -= 1
+            checked = 0
+        else:
+            k += 1
+            checked += 1
+    return ring
+
+
+def _find_pinch(ring: List[int], xs: List[float],
+                ys: List[float]) -> Optional[Tuple[int, int]]:
+    """
+    Find a vertex that touches a non-incident edge of the ring.
+    
+    Polygon.is_simple only rejects proper crossings and overlaps, so a
+    vertex may rest on another edge (or vertex) and pinch the polygon.
+    
+    Returns:
+        Tuple (k, e) of ring positions: vertex k lies on the edge from
+        position e to e + 1. None if the ring has no pinch.
+    """
+    m = len(ring)
+    for k in range(m):
+        v = ring[k]
+        vx, vy = xs[v], ys[v]
+        for e in range(m):
+            if e == k or (e + 1) % m == k:
+                continue
+            a, b = ring[e], ring[(e + 1) % m]
+            if (min(xs[a], xs[b]) <= vx <= max(xs[a], xs[b]) and
+                    min(ys[a], ys[b]) <= vy <= max(ys[a], ys[b]) and
+                    _cross(xs[a], ys[a], xs[b], ys[b], vx, vy) == 0):
+                return k, e
+    return None
+
+
+def _ring_location(ring: List[int], xs: List[float], ys: List[float],
+                   x: float, y: float) -> int:
+    """
+    Locate a point against a ring by exact crossing parity.
+    
+    Returns:
+        1 if inside, -1 if outside, 0 if on the ring.
+    """
+    inside = False
+    m = len(ring)
+    for k in range(m):
+        a, b = ring[k - 1], ring[k]
+        ax, ay, bx, by = xs[a], ys[a], xs[b], ys[b]
+        if (min(ax, bx) <= x <= max(ax, bx) and min(ay, by) <= y <= max(ay, by)
+                and _cross(ax, ay, bx, by, x, y) == 0):
+            return 0
+        if (ay > y) != (by > y):
+            if ax + (y - ay) * (bx - ax) / (by - ay) > x:
+                inside = not inside
+    return 1 if inside else -1
+
+
+def _nested(inner: List[int], outer: List[int], xs: List[float],
+            ys: List[float]) -> bool:
+    """Check if a loop lies inside another loop it touches at a pinch."""
+    for v in inner:
+        location = _ring_location(outer, xs, ys, xs[v], ys[v])
+        if location != 0:
+            return location > 0
+    # Every vertex on the other loop: treat as nested so callers bail out
+    return True
+
+
+def _triangulate_ring(ring: List[int], xs: List[float], ys: List[float],
+                      triangles: List[Tuple[int, int, int]]) -> None:
+    """
+    Ear-clip a ring, splitting it at pinch vertices first.
+    
+    The ring may be in either orientation; the enclosed region follows
+    the crossing-parity rule of Polygon.point_location.
+    
+    Raises:
+        ValueError: If a pinched-off loop lies inside the rest of the ring
+                    (a hole touching the boundary) or no ear can be found.
+    """
+    ring = _clean_ring(ring, xs, ys)
+    if len(ring) < 3:
+        return
+    area2 = _signed_area2(ring, xs, ys)
+    if area2 == 0:
+        return
+    
+    pinch = _find_pinch(ring, xs, ys)
+    if pinch is not None:
+        k, e = pinch
+        m = len(ring)
+        first = [ring[(k + i) % m] for i in range((e - k) % m + 1)]
+        second = [ring[(e + 1 + i) % m] for i in range((k - e - 1) % m + 1)]
+        # Loops that touch from outside enclose the union of their regions,
+        # a loop inside the other would carve a hole
+        first = _clean_ring(first, xs, ys)
+        second = _clean_ring(second, xs, ys)
+        if len(first) >= 3 and len(second) >= 3 and (
+                _nested(first, second, xs, ys) or
+                _nested(second, first, xs, ys)):
+            raise ValueError("Polygon encloses a hole touching its boundary")
+        _triangulate_ring(first, xs, ys, triangles)
+        _triangulate_ring(second, xs, ys, triangles)
+        return
+    
+    if area2 < 0:
+        ring.reverse()
+    
+    m = len(ring)
+    prev = [(k - 1) % m for k in range(m)]
+    nxt = [(k + 1) % m for k in range(m)]
+    
+    def is_convex(k: int) -> bool:
+        a, b, c = ring[prev[k]], ring[k], ring[nxt[k]]
+        return _cross(xs[a], ys[a], xs[b], ys[b], xs[c], ys[c]) > 0
+    
+    def is_ear(k: int, closed: bool) -> bool:
+        if not is_convex(k):
+            return False
+        a, b, c = ring[prev[k]], ring[k], ring[nxt[k]]
+        ax, ay, bx, by, cx, cy = xs[a], ys[a], xs[b], ys[b], xs[c], ys[c]
+        # Only reflex vertices can lie inside an ear
+        q = nxt[nxt[k]]
+        while q != prev[k]:
+            v = ring[q]
+            vx, vy = xs[v], ys[v]
+            if not is_convex(q):
+                d1 = _cross(ax, ay, bx, by, vx, vy)
+                d2 = _cross(bx, by, cx, cy, vx, vy)
+                d3 = _cross(cx, cy, ax, ay, vx, vy)
+                if closed:
+                    if d1 >= 0 and d2 >= 0 and d3 >= 0:
+                        return False
+                elif d1 > 0 and d2 > 0 and d3 > 0:
+                    return False
+            q = nxt[q]
+        return True
+    
+    remaining = m
+    k = 0
+    misses = 0
+    closed = True
+    while remaining > 3:
+        if is_ear(k, closed):
+            triangles.append((ring[prev[k]], ring[k], ring[nxt[k]]))
+            p, q = prev[k], nxt[k]
+            nxt[p] = q
+            prev[q] = p
+            remaining -= 1
+            k = p
+            misses = 0
+            closed = True
+            continue
+        k = nxt[k]
+        misses += 1
+        if misses > remaining:
+            if not closed:
+                raise ValueError("Polygon is not simple (no ear found)")
+            # A vertex resting on a candidate diagonal blocks every ear;
+            # accept an ear whose triangle only touches other vertices
+            closed = False
+            misses = 0
+    
+    triangles.append((ring[prev[k]], ring[k], ring[nxt[k]]))
+
+
+def triangulate(polygon: Polygon) -> List[Tuple[int, int, int]]:
+    """
+    Triangulate a simple polygon by ear clipping.
+    
+    Runs in O(n^2) for n corner vertices. Collinear and repeated vertices
+    are skipped, so the triangles cover the polygon using corners only.
+    Vertices touching another edge (allowed by Polygon.is_simple) split
+    the polygon into loops that are triangulated separately.
+    
+    Args:
+        polygon: A simple polygon in either orientation.
+    
+    Returns:
+        List of (i, j, k) vertex index triples into polygon.vertices, each
+        in counter-clockwise order.
+    
+    Raises:
+        ValueError: If the polygon is degenerate or cannot be triangulated.
+    """
+    xs = [v.x for v in polygon.vertices]
+    ys = [v.y for v in polygon.vertices]
+    ring = list(range(len(xs)))
+    area2 = _signed_area2(ring, xs, ys)
+    if area2 == 0:
+        raise ValueError("Polygon has zero area")
+    if area2 < 0:
+        ring.reverse()
+    
+    triangles = []
+    _triangulate_ring(ring, xs, ys, triangles)
+    return triangles
+
+
+def _hertel_mehlhorn(xs: List[float], ys: List[float],
+                     triangles: List[Tuple[int, int, int]]) -> List[List[int]]:
+    """
+    Merge triangles across diagonals while the merged piece stays convex.
+    
+    Produces at most four times the minimum number of convex pieces.
+    """
+    pieces = {t: list(tri) for t, tri in enumerate(triangles)}
+    parent = list(range(len(triangles)))
+    
+    def find(t: int) -> int:
+        while parent[t] != t:
+            parent[t] = parent[parent[t]]
+            t = parent[t]
+        return t
+    
+    # A diagonal is an edge shared by two triangles in opposite directions
+    owner = {}
+    diagonals = []
+    for t, (a, b, c) in enumerate(triangles):
+        for u, v in ((a, b), (b, c), (c, a)):
+            if (v, u) in owner:
+                diagonals.append((u, v, t, owner[(v, u)]))
+            else:
+                owner[(u, v)] = t
+    
+    for a, b, t1, t2 in diagonals:
+        p1, p2 = find(t1), find(t2)
+        # Piece p1 runs a -> b, piece p2 runs b -> a
+        piece1, piece2 = pieces[p1], pieces[p2]
+        i = piece1.index(b)
+        rot1 = piece1[i:] + piece1[:i]          # b, ..., a
+        j = piece2.index(a)
+        rot2 = piece2[j:] + piece2[:j]          # a, ..., b
+        merged = rot1 + rot2[1:-1]
+        
+        # Convexity can only break at the two diagonal endpoints
+        at_a = (rot1[-2], a, rot2[1])
+        at_b = (rot2[-2], b, rot1[1])
+        if any(_cross(xs[h], ys[h], xs[v], ys[v], xs[w], ys[w]) < 0
+               for h, v, w in (at_a, at_b)):
+            continue
+        
+        pieces[p1] = merged
+        del pieces[p2]
+        parent[p2] = p1
+    
+    return list(pieces.values())
+
+
+class ConvexDecomposition:
+    """
+    A simple polygon split into convex parts for fast containment queries.
+    
+    Built with ear clipping followed by Hertel-Mehlhorn merging. Point
+    queries find the edges within tolerance through the polygon's edge
+    index, then test each part whose bounding box contains the point, so
+    the cost is a handful of O(log k) convex tests instead of an O(n) scan.
+    """
+    
+    def __init__(self, polygon: Polygon):
+        """
+        Decompose a polygon into convex parts.
+        
+        Args:
+            polygon: A simple polygon in either orientation.
+        
+        Raises:
+            ValueError: If the polygon is degenerate or not simple.
+        """
+        vertices = polygon.vertices
+        self.edge_index = polygon.edge_index()
+        
+        convex = polygon.as_convex()
+        if convex is not None:
+            self.parts = [convex]
+            self.bounds = [convex.bounding_box()]
+            return
+        
+        # Ear clipping assumes a simple ring; on a crossing ring it still
+        # returns parts, but they do not cover the polygon's interior
+        if not polygon.is_simple():
+            raise ValueError("Polygon is not simple")
+        
+        xs = [v.x for v in vertices]
+        ys = [v.y for v in vertices]
+        index_parts = _hertel_mehlhorn(xs, ys, triangulate(polygon))
+        
+        self.parts = [ConvexPolygon([vertices[i] for i in indices])
+                      for indices in index_parts]
+        self.bounds = [part.bounding_box() for part in self.parts]
+    
+    def __len__(self) -> int:
+        return len(self.parts)
+    
+    def point_location(self, point: Point, tolerance: float = 0.5) -> str:
+        """
+        Determine if a point is inside, outside, or on the polygon boundary.
+        
+        Matches Polygon.point_location exactly for integer coordinates:
+        the boundary test visits the same edges, and any other point is
+        inside exactly when it lies in one of the closed parts.
+        
+        Args:
+            point: The point to check.
+            tolerance: Numerical tolerance for edge detection.
+        
+        Returns:
+            'INSIDE', 'OUTSIDE' or 'BOUNDARY'.
+        """
+        index = self.edge_index
+        for k in index.within(point, tolerance):
+            if index.segments[k].contains_point(point, tolerance):
+                return 'BOUNDARY'
+        
+        # Off the boundary, so the closed parts (which tile the polygon)
+        # decide; diagonals between parts are interior
+        x, y = point.x, point.y
+        for part, (min_x, min_y, max_x, max_y) in zip(self.parts, self.bounds):
+            if (min_x <= x <= max_x and min_y <= y <= max_y and
+                    part.point_location(point, 0) != 'OUTSIDE'):
+                return 'INSIDE'
+        return 'OUTSIDE'
+    
+    def intersects(self, other: ConvexDecomposition) -> bool:
+        """
+        Check if the two decomposed regions share at least one point.
+        
+        Touching boundaries count as intersecting.
+        
+        Args:
+            other: Decomposition of the other polygon.
+        
+        Returns:
+            True if any pair of convex parts intersects.
+        """
+        for part, (a_min_x, a_min_y, a_max_x, a_max_y) in zip(self.parts,
+                                                             self.bounds):
+            for other_part, (b_min_x, b_min_y, b_max_x, b_max_y) in zip(
+                    other.parts, other.bounds):
+                if (a_max_x < b_min_x or b_max_x < a_min_x or
+                        a_max_y < b_min_y or b_max_y < a_min_y):
+                    continue
+                if part.intersects_convex(other_part):
+                    return True
+        return False
@@ -0,0 +1,241 @@
+"""
+Bounding volume hierarchy over segments for nearest-edge and ray queries.
+"""
+
+from __future__ import annotations
+import math
+from typing import List, Tuple
+from .point import Point
+from .segment import Segment
+
+
+# Segments per leaf node
+LEAF_SIZE = 8
+
+# Relative tolerance of the ray-box test
+RAY_SLACK = 1e-9
+
+
+class EdgeBVH:
+    """
+    A binary tree of bounding boxes over a list of segments.
+    
+    Nodes are split at the median segment center along the longer side of
+    their box, so the tree is balanced and built in O(n log^2 n). Nearest
+    segment queries visit the closer child first and skip any node whose
+    box is farther than the best segment found, which takes O(log n) for
+    typical polygons.
+    """
+    
+    def __init__(self, segments: List[Segment]):
+        """
+        Build the hierarchy.
+        
+        Args:
+            segments: Segments to index, e.g. Polygon.get_edges().
+        
+        Raises:
+            ValueError: If there are no segments.
+        """
+        if not segments:
+            raise ValueError("An edge index needs at least one segment")
+        self.segments = segments
+        
+        # Flat node arrays; a leaf has left == -1 and covers
+        # order[start:end], an inner node has children left and right
+        self.boxes: List[Tuple[float, float, float, float]] = []
+        self.left: List[int] = []
+        self.right: List[int] = []
+        self.start: List[int] = []
+        self.end: List[int] = []
+        
+        boxes = [(min(s.p1.x, s.p2.x), min(s.p1.y, s.p2.y),
+                  max(s.p1.x, s.p2.x), max(s.p1.y, s.p2.y)) for s in segments]
+        self.order = list(range(len(segments)))
+        self._build(boxes, 0, len(segments))
+    
+    def __len__(self) -> int:
+        return len(self.segments)
+    
+    def _build(self, boxes: List[tuple], start: int, end: int) -> int:
+        """Build the subtree over order[start:end] and return its node index."""
+        node = len(self.boxes)
+        items = self.order[start:end]
+        self.boxes.append((min(boxes[i][0] for i in items), min(boxes[i][1] for i in items),
+                           max(boxes[i][2] for i in items), max(boxes[i][3] for i in items)))
+        self.left.append(-1)
+        self.right.append(-1)
+        self.start.append(start)
+        self.end.append(end)
+        if end - start <= LEAF_SIZE:
+            return node
+        
+        min_x, min_y, max_x, max_y = self.boxes[node]
+        axis = 0 if max_x - min_x >= max_y - min_y else 1
+        items.sort(key=lambda i: boxes[i][axis] + boxes[i][axis + 2])
+        self.order[start:end] = items
+        
+        middle = (start + end) // 2
+        self.left[node] = self._build(boxes, start, middle)
+        self.right[node] = self._build(boxes, middle, end)
+        return node
+    
+    def _box_distance_squared(self, node: int, x: float, y: float) -> float:
+        """Squared distance from a point to a node's bounding box."""
+        min_x, min_y, max_x, max_y = self.boxes[node]
+        dx = min_x - x if x < min_x else (x - max_x if x > max_x else 0)
+        dy = min_y - y if y < min_y else (y - max_y if y > max_y else 0)
+        return dx * dx + dy * dy
+    
+    def nearest(self, point: Point) -> Tuple[int, float]:
+        """
+        Find the segment nearest to a point.
+        
+        Args:
+            point: The point to measure from.
+        
+        Returns:
+            Tuple (index into segments, distance). Ties go to the segment
+            found first.
+        """
+        x, y = point.x, point.y
+        best, best_d2 = -1, math.inf
+        stack = [(0, self._box_distance_squared(0, x, y))]
+        while stack:
+            node, d2 = stack.pop()
+            if d2 >= best_d2:
+                continue
+            
+            left = self.left[node]
+            if left < 0:
+                for i in self.order[self.start[node]:self.end[node]]:
+                    distance2 = self.segments[i].distance_squared_to_point(point)
+                    if distance2 < best_d2:
+                        best, best_d2 = i, distance2
+                continue
+            
+            # Push the farther child first so the nearer one is searched first
+            right = self.right[node]
+            d_left = self._box_distance_squared(left, x, y)
+            d_right = self._box_distance_squared(right, x, y)
+            if d_left <= d_right:
+                stack.append((right, d_right))
+                stack.append((left, d_left))
+            else:
+                stack.append((left, d_left))
+                stack.append((right, d_right))
+        
+        return best, math.sqrt(best_d2)
+    
+    def within(self, point: Point, reach: float) -> List[int]:
+        """
+        Find the segments whose bounding boxes are within reach of a point.
+        
+        A box is within reach when the point lies inside it once it is
+        grown by `reach` on every side, which is the fast rejection test
+        of Segment.contains_point.
+        
+        Args:
+            point: The point to search around.
+            reach: Per-axis distance from the point.
+        
+        Returns:
+            Indices into segments, in no particular order.
+        """
+        x, y = point.x, point.y
+        found = []
+        stack = [0]
+        while stack:
+            node = stack.pop()
+            min_x, min_y, max_x, max_y = self.boxes[node]
+            if not (min_x - reach <= x <= max_x + reach and
+                    min_y - reach <= y <= max_y + reach):
+                continue
+            left = self.left[node]
+            if left < 0:
+                found.extend(self.order[self.start[node]:self.end[node]])
+            else:
+                stack.append(self.right[node])
+                stack.append(left)
+        return found
+    
+    def _box_ray_entry(self, node: int, ox: float, oy: float,
+                       inv_x: float, inv_y: float) -> float:
+        """
+        Ray parameter at which a ray enters a node's bounding box.
+        
+        Args:
+            inv_x: 1 / direction.x, or None if the ray is vertical.
+            inv_y: 1 / direction.y, or None if the ray is horizontal.
+        
+        Returns:
+            The entry parameter (0 if the origin is inside), or infinity
+            if the ray misses the box.
+        """
+        min_x, min_y, max_x, max_y = self.boxes[node]
+        t_enter, t_exit = 0.0, math.inf
+        for origin, inverse, low, high in ((ox, inv_x, min_x, max_x),
+                                           (oy, inv_y, min_y, max_y)):
+            if inverse is None:
+                if origin < low or origin > high:
+                    return math.inf
+                continue
+            t1, t2 = (low - origin) * inverse, (high - origin) * inverse
+            if t1 > t2:
+                t1, t2 = t2, t1
+            t_enter = max(t_enter, t1)
+            t_exit = min(t_exit, t2)
+            # Slack keeps rays through a box corner, such as rays aimed
+            # at a vertex, from missing by a rounding error
+            if t_enter > t_exit + RAY_SLACK * max(1.0, t_exit):
+                return math.inf
+        return t_enter
+    
+    def raycast(self, origin: Point, direction: Point,
+                max_t: float = math.inf) -> Tuple[int, float]:
+        """
+        Find the first segment hit by a ray.
+        
+        Boxes are tested with the slab method, nearer boxes first, and a
+        box entered beyond the best hit so far is skipped.
+        
+        Args:
+            origin: Start of the ray.
+            direction: Direction of the ray; need not be a unit vector.
+            max_t: Ignore hits beyond origin + max_t * direction.
+        
+        Returns:
+            Tuple (index into segments, ray parameter t) of the first hit
+            (see Segment.ray_intersection), or (-1, math.inf) on a miss.
+        """
+        ox, oy = origin.x, origin.y
+        inv_x = 1 / direction.x if direction.x != 0 else None
+        inv_y = 1 / direction.y if direction.y != 0 else None
+        best, best_t = -1, max_t
+        stack = [(0, self._box_ray_entry(0, ox, oy, inv_x, inv_y))]
+        while stack:
+            node, entry = stack.pop()
+            if entry == math.inf or entry > best_t:
+                continue
+            
+            left = self.left[node]
+            if left < 0:
+                for i in self.order[self.start[node]:self.end[node]]:
+                    t = self.segments[i].ray_intersection(origin, direction)
+                    if t is not None and t < best_t:
+                        best, best_t = i, t
+                continue
+            
+            right = self.right[node]
+            t_left = self._box_ray_entry(left, ox, oy, inv_x, inv_y)
+            t_right = self._box_ray_entry(right, ox, oy, inv_x, inv_y)
+            if t_left <= t_right:
+                stack.append((right, t_right))
+                stack.append((left, t_left))
+            else:
+                stack.append((left, t_left))
+                stack.append((right, t_right))
+        
+        if best < 0:
+            return -1, math.inf
+        return best, best_t
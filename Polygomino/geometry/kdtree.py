@@ -0,0 +1,136 @@
+"""
+KD-tree over fixed-length feature vectors for nearest neighbour queries.
+"""
+
+from __future__ import annotations
+import heapq
+import math
+from typing import List, Sequence, Tuple
+
+
+# Vectors per leaf node
+LEAF_SIZE = 8
+
+
+class KDTree:
+    """
+    A balanced KD-tree over a list of equal-length vectors.
+    
+    Nodes split at the median of the dimension with the widest spread.
+    Queries search the child on the query's side first and skip a subtree
+    when the distance to its splitting plane exceeds the k-th best
+    distance so far. How much that prunes depends on the dimension: with
+    a handful of dimensions a query visits a small fraction of the
+    leaves, but as the dimension grows the k-th best distance approaches
+    the spread of the data, few planes lie beyond it and a query degrades
+    towards computing every distance. Reduce vectors to their few most
+    informative components before indexing them (see ShapeIndex in
+    descriptors.py).
+    """
+    
+    def __init__(self, vectors: List[Sequence[float]]):
+        """
+        Build the tree.
+        
+        Args:
+            vectors: Vectors to index, all of the same length.
+        
+        Raises:
+            ValueError: If there are no vectors or their lengths differ.
+        """
+        if not vectors:
+            raise ValueError("A KD-tree needs at least one vector")
+        self.dimensions = len(vectors[0])
+        if any(len(v) != self.dimensions for v in vectors):
+            raise ValueError("All vectors must have the same length")
+        self.vectors = [tuple(v) for v in vectors]
+        
+        # Flat node arrays; a leaf has left == -1 and covers
+        # order[start:end], an inner node splits on axis at value
+        self.axis: List[int] = []
+        self.value: List[float] = []
+        self.left: List[int] = []
+        self.right: List[int] = []
+        self.start: List[int] = []
+        self.end: List[int] = []
+        
+        self.order = list(range(len(vectors)))
+        self._build(0, len(vectors))
+    
+    def __len__(self) -> int:
+        return len(self.vectors)
+    
+    def _build(self, start: int, end: int) -> int:
+        """Build the subtree over order[start:end] and return its node index."""
+        node = len(self.axis)
+        self.axis.append(-1)
+        self.value.append(0.0)
+        self.left.append(-1)
+        self.right.append(-1)
+        self.start.append(start)
+        self.end.append(end)
+        if end - start <= LEAF_SIZE:
+            return node
+        
+        items = self.order[start:end]
+        spreads = [max(self.vectors[i][d] for i in items) -
+                   min(self.vectors[i][d] for i in items)
+                   for d in range(self.dimensions)]
+        axis = max(range(self.dimensions), key=spreads.__getitem__)
+        items.sort(key=lambda i: self.vectors[i][axis])
+        self.order[start:end] = items
+        
+        middle = (start + end) // 2
+        self.axis[node] = axis
+        self.value[node] = self.vectors[items[middle - start]][axis]
+        self.left[node] = self._build(start, middle)
+        self.right[node] = self._build(middle, end)
+        return node
+    
+    def nearest(self, query: Sequence[float], count: int = 1) -> List[Tuple[int, float]]:
+        """
+        Find the vectors nearest to a query vector (Euclidean distance).
+        
+        Args:
+            query: Vector of the tree's length.
+            count: Number of neighbours to return.
+        
+        Returns:
+            Up to count (index into vectors, distance) tuples, nearest
+            first; ties go to the lower index. Empty if count is not
+            positive.
+        
+        Raises:
+            ValueError: If the query length differs from the vectors'.
+        """
+        if len(query) != self.dimensions:
+            raise ValueError("Query length differs from the indexed vectors")
+        if count <= 0:
+            return []
+        # Max-heap of the best candidates as (-distance^2, -index)
+        best: List[Tuple[float, int]] = []
+        stack = [(0, 0.0)]
+        while stack:
+            node, plane_d2 = stack.pop()
+            if len(best) == count and plane_d2 > -best[0][0]:
+                continue
+            
+            left = self.left[node]
+            if left < 0:
+                for i in self.order[self.start[node]:self.end[node]]:
+                    vector = self.vectors[i]
+                    d2 = sum((a - b) * (a - b) for a, b in zip(vector, query))
+                    item = (-d2, -i)
+                    if len(best) < count:
+                        heapq.heappush(best, item)
+                    elif item > best[0]:
+                        heapq.heapreplace(best, item)
+                continue
+            
+            # Push the far side first so the near side is searched first
+            offset = query[self.axis[node]] - self.value[node]
+            near, far = (left, self.right[node]) if offset < 0 else (self.right[node], left)
+            stack.append((far, max(plane_d2, offset * offset)))
+            stack.append((near, plane_d2))
+        
+        return [(-i, math.sqrt(-d2)) for d2, i in sorted(best, reverse=True)]
@@ -0,0 +1,287 @@
+"""
+Minkowski sums and no-fit polygons for packing pieces.
+"""
+
+from __future__ import annotations
+import math
+from typing import Dict, Hashable, List, Tuple
+from .point import Point
+from .polygon import Polygon
+from .convex import ConvexPolygon, convex_ring
+from .multipolygon import PolygonWithHoles, MultiPolygon
+from .boolean import boolean_operation
+
+
+def _convex_corners(polygon: Polygon) -> List[Tuple[float, float]]:
+    """
+    Get the strict corners of a convex polygon counter-clockwise, starting
+    from the lowest (then leftmost) corner.
+    
+    Raises:
+        ValueError: If the polygon is not a simple convex polygon.
+    """
+    ring = convex_ring(polygon.vertices)
+    if ring is None:
+        raise ValueError("Polygon is not convex")
+    indices, orientation = ring
+    corners = [(polygon.vertices[i].x, polygon.vertices[i].y) for i in indices]
+    if orientation < 0:
+        corners.reverse()
+    start = min(range(len(corners)), key=lambda i: (corners[i][1], corners[i][0]))
+    return corners[start:] + corners[:start]
+
+
+def minkowski_sum_convex(first: Polygon, second: Polygon) -> ConvexPolygon:
+    """
+    Compute the Minkowski sum of two convex polygons.
+    
+    Both boundaries are walked counter-clockwise from their lowest corner
+    and their edges merged by angle, so the sum takes O(n + m) for n and m
+    corners. Parallel edges are joined into one.
+    
+    Args:
+        first: A convex polygon in either orientation.
+        second: A convex polygon in either orientation.
+    
+    Returns:
+        The sum as a counter-clockwise ConvexPolygon.
+    
+    Raises:
+        ValueError: If either polygon is not a simple convex polygon.
+    """
+    a = _convex_corners(first)
+    b = _convex_corners(second)
+    n, m = len(a), len(b)
+    vertices = []
+    i = j = 0
+    while i < n or j < m:
+        vertices.append(Point(a[i % n][0] + b[j % m][0], a[i % n][1] + b[j % m][1]))
+        ax = a[(i + 1) % n][0] - a[i % n][0]
+        ay = a[(i + 1) % n][1] - a[i % n][1]
+        bx = b[(j + 1) % m][0] - b[j % m][0]
+        by = b[(j + 1) % m][1] - b[j % m][1]
+        cross = ax * by - ay * bx
+        if j == m or (i < n and cross > 0):
+            i += 1
+        elif i == n or cross < 0:
+            j += 1
+        else:
+            i += 1
+            j += 1
+    return ConvexPolygon(vertices)
+
+
+def _convex_parts(polygon: Polygon) -> List[Polygon]:
+    """Get a polygon's convex parts: itself if convex, else its decomposition."""
+    convex = polygon.as_convex()
+    if convex is not None:
+        return [convex]
+    return polygon.convex_decomposition().parts
+
+
+def _part_sums(first: Polygon, second: Polygon) -> List[ConvexPolygon]:
+    """Get the Minkowski sums of every pair of convex parts of two polygons."""
+    return [minkowski_sum_convex(a, b)
+            for a in _convex_parts(first) for b in _convex_parts(second)]
+
+
+def _union_all(shapes: List, exact: bool) -> MultiPolygon:
+    """
+    Union many shapes by merging them in pairs, level by level.
+    
+    Pairwise merging keeps the operands of each union about the same size,
+    so no single growing result is re-swept once per shape.
+    """
+    if not shapes:
+        return MultiPolygon([])
+    while len(shapes) > 1:
+        last = len(shapes) == 2
+        merged = [boolean_operation(shapes[k], shapes[k + 1], 'union',
+                                    exact=exact or not last)
+                  for k in range(0, len(shapes) - 1, 2)]
+        if len(shapes) % 2:
+            merged.append(shapes[-1])
+        shapes = merged
+    result = shapes[0]
+    return result if isinstance(result, MultiPolygon) else MultiPolygon([result])
+
+
+def minkowski_sum(first: Polygon, second: Polygon, exact: bool = False) -> MultiPolygon:
+    """
+    Compute the Minkowski sum of two simple polygons.
+    
+    Convex pairs use the linear merge of minkowski_sum_convex. Otherwise
+    both polygons are split into convex parts (Hertel-Mehlhorn), every
+    pair of parts is summed and the sums are joined with boolean unions.
+    The sum of non-convex polygons can have holes.
+    
+    Args:
+        first: A simple polygon.
+        second: A simple polygon.
+        exact: If True, keep non-integral coordinates of the result as
+               Fractions; see boolean_operation.
+    
+    Returns:
+        The sum as a MultiPolygon.
+    
+    Raises:
+        ValueError: If either polygon is degenerate or not simple.
+    """
+    sums = _part_sums(first, second)
+    if len(sums) == 1:
+        return MultiPolygon(sums)
+    return _union_all(sums, exact)
+
+
+def rotate_polygon(polygon: Polygon, degrees: float) -> Polygon:
+    """
+    Rotate a polygon counter-clockwise about the origin.
+    
+    Multiples of 90 degrees are applied exactly, so integer pieces keep
+    integer coordinates.
+    
+    Args:
+        polygon: The polygon to rotate.
+        degrees: Rotation angle in degrees.
+    
+    Returns:
+        A new rotated Polygon.
+    """
+    quarter = degrees / 90
+    if quarter == int(quarter):
+        turns = int(quarter) % 4
+        rotate = [lambda x, y: (x, y), lambda x, y: (-y, x),
+                  lambda x, y: (-x, -y), lambda x, y: (y, -x)][turns]
+        return Polygon([Point(*rotate(v.x, v.y)) for v in polygon.vertices])
+    c, s = math.cos(math.radians(degrees)), math.sin(math.radians(degrees))
+    return Polygon([Point(v.x * c - v.y * s, v.x * s + v.y * c)
+                    for v in polygon.vertices])
+
+
+def _reflected(polygon: Polygon) -> Polygon:
+    """Reflect a polygon through the origin."""
+    return Polygon([Point(-v.x, -v.y) for v in polygon.vertices])
+
+
+def no_fit_polygon(placed: Polygon, moving: Polygon, exact: bool = False) -> MultiPolygon:
+    """
+    Compute the no-fit polygon of a moving piece around a placed piece.
+    
+    The no-fit polygon is placed (+) (-moving): the moving piece, shifted
+    by an offset, touches the placed piece when the offset is on its
+    boundary and stays clear of it outside. Inside, the interiors overlap
+    except on zero-width slits: where the moving piece slides snugly into
+    a gap, the sums of the convex parts only touch, and their union fills
+    the slit. NoFitPolygonCache.overlaps checks those offsets against the
+    part sums. Both pieces are in their own coordinates; the offset is the
+    moving piece's position minus the placed piece's position.
+    
+    Args:
+        placed: The fixed piece.
+        moving: The piece being positioned.
+        exact: Keep non-integral coordinates as Fractions.
+    
+    Returns:
+        The no-fit polygon as a MultiPolygon.
+    
+    Raises:
+        ValueError: If either piece is degenerate or not simple.
+    """
+    return minkowski_sum(placed, _reflected(moving), exact)
+
+
+class NoFitPolygonCache:
+    """
+    No-fit polygons between named pieces, computed once per
+    (placed piece, moving piece, rotation).
+    
+    A packing search asks the same pairs over and over; after the first
+    query, whether a candidate position collides is a single point
+    location in the cached no-fit polygon instead of a collision test
+    between the two pieces. Offsets inside the no-fit polygon are
+    confirmed against the convex part sums it is the union of, so snug
+    fits along filled slits are not reported as collisions.
+    """
+    
+    def __init__(self, pieces: Dict[Hashable, Polygon], exact: bool = False):
+        """
+        Initialize an empty cache.
+        
+        Args:
+            pieces: Simple polygons by name, in their own coordinates.
+            exact: Keep non-integral no-fit polygon coordinates as Fractions.
+        """
+        self.pieces = dict(pieces)
+        self.exact = exact
+        self.cache: Dict[tuple, MultiPolygon] = {}
+        self.part_sums: Dict[tuple, List[Tuple[ConvexPolygon, tuple]]] = {}
+        self.hits = 0
+        self.misses = 0
+    
+    def __len__(self) -> int:
+        return len(self.cache)
+    
+    def no_fit_polygon(self, placed: Hashable, moving: Hashable,
+                       rotation: float = 0) -> MultiPolygon:
+        """
+        Get the no-fit polygon of a moving piece around a placed piece.
+        
+        Args:
+            placed: Name of the fixed piece, unrotated.
+            moving: Name of the piece being positioned.
+            rotation: Counter-clockwise rotation of the moving piece about
+                      its origin, in degrees, relative to the placed piece.
+        
+        Returns:
+            The no-fit polygon, with a point location index per ring.
+        
+        Raises:
+            KeyError: If a piece name is unknown.
+            ValueError: If a piece is degenerate or not simple.
+        """
+        key = (placed, moving, rotation)
+        nfp = self.cache.get(key)
+        if nfp is not None:
+            self.hits += 1
+            return nfp
+        self.misses += 1
+        moving_piece = self.pieces[moving]
+        if rotation:
+            moving_piece = rotate_polygon(moving_piece, rotation)
+        sums = _part_sums(self.pieces[placed], _reflected(moving_piece))
+        nfp = MultiPolygon(sums) if len(sums) == 1 else _union_all(sums, self.exact)
+        nfp = MultiPolygon([PolygonWithHoles(p.outer, p.holes, locators=True)
+                            for p in nfp], locators=True)
+        self.cache[key] = nfp
+        self.part_sums[key] = [(part, part.bounding_box()) for part in sums]
+        return nfp
+    
+    def overlaps(self, placed: Hashable, placed_position: Point, moving: Hashable,
+                 position: Point, rotation: float = 0) -> bool:
+        """
+        Check whether a moving piece at a position overlaps a placed piece.
+        
+        Touching boundaries do not count as overlapping.
+        
+        Args:
+            placed: Name of the fixed piece.
+            placed_position: Translation of the fixed piece.
+            moving: Name of the piece being positioned.
+            position: Translation of the moving piece.
+            rotation: Rotation of the moving piece, as in no_fit_polygon.
+        
+        Returns:
+            True if the interiors of the two pieces intersect.
+        """
+        nfp = self.no_fit_polygon(placed, moving, rotation)
+        offset = Point(position.x - placed_position.x, position.y - placed_position.y)
+        if nfp.point_location(offset, 0) != 'INSIDE':
+            return False
+        # The interiors overlap exactly when the offset is strictly inside
+        # the sum of some pair of convex parts
+        x, y = offset.x, offset.y
+        for part, (min_x, min_y, max_x, max_y) in self.part_sums[(placed, moving, rotation)]:
+            if (min_x < x < max_x and min_y < y < max_y and
+                    part.point_location(offset, 0) == 'INSIDE'):
+                return True
+        return False
@@ -0,0 +1,587 @@
+"""
+Polygons with holes and sets of disjoint polygons.
+"""
+
+from __future__ import annotations
+import math
+from itertools import chain
+from typing import List, Optional, Tuple, Union
+from .point import Point
+from .segment import Segment
+from .polygon import Polygon
+
+
+def _ring_entry(ring: Polygon, locator: bool) -> tuple:
+    """
+    Prepare a ring for point location.
+    
+    Returns:
+        Tuple (bounds, edges, locator); the locator is a ConvexPolygon or
+        ConvexDecomposition when requested and available, else None.
+    """
+    index = None
+    if locator:
+        index = ring.as_convex()
+        if index is None:
+            try:
+                index = ring.convex_decomposition()
+            except ValueError:
+                index = None
+    return (ring.bounding_box(), ring.get_edges(), index)
+
+
+def _locate_in_rings(point: Point, entries: List[tuple], tolerance: float) -> str:
+    """
+    Locate a point against a set of rings in one crossing-number pass.
+    
+    Crossings of a ray cast to the right are counted over all rings
+    together, so a point inside an odd number of rings is inside. A ring
+    whose bounding box does not contain the point is skipped: the ray
+    crosses it an even number of times and the point cannot be on it.
+    Rings with a locator contribute one crossing if they contain the point.
+    
+    Args:
+        point: The point to check.
+        entries: Ring entries from _ring_entry.
+        tolerance: Numerical tolerance for edge detection.
+    
+    Returns:
+        'INSIDE', 'OUTSIDE' or 'BOUNDARY'.
+    """
+    x, y = point.x, point.y
+    crossings = 0
+    for (min_x, min_y, max_x, max_y), edges, locator in entries:
+        if not (min_x - tolerance <= x <= max_x + tolerance and
+                min_y - tolerance <= y <= max_y + tolerance):
+            continue
+        
+        if locator is not None:
+            location = locator.point_location(point, tolerance)
+            if location == 'BOUNDARY':
+                return 'BOUNDARY'
+            if location == 'INSIDE':
+                crossings += 1
+            continue
+        
+        for edge in edges:
+            if edge.contains_point(point, tolerance):
+                return 'BOUNDARY'
+            v1, v2 = edge.p1, edge.p2
+            # Same crossing rule as Polygon.point_location
+            if (v1.y > y and v2.y > y) or (v1.y <= y and v2.y <= y):
+                continue
+            t = (y - v1.y) / (v2.y - v1.y)
+            if v1.x + t * (v2.x - v1.x) > x:
+                crossings += 1
+    
+    return 'INSIDE' if crossings % 2 == 1 else 'OUTSIDE'
+
+
+def _same(a: Point, b: Point) -> bool:
+    """Check if two points have exactly the same coordinates."""
+    return a.x == b.x and a.y == b.y
+
+
+def _meeting_point(a: Segment, b: Segment) -> Optional[Point]:
+    """
+    Get the single point at which two intersecting segments meet.
+    
+    Returns:
+        The shared point, or None if the segments cross properly or
+        overlap along a stretch of line.
+    """
+    d1 = Segment._ccw(a.p1, a.p2, b.p1)
+    d2 = Segment._ccw(a.p1, a.p2, b.p2)
+    if d1 == 0 and d2 == 0:
+        # Collinear: they overlap unless they only meet end to end
+        axis = 'x' if abs(a.p2.x - a.p1.x) + abs(b.p2.x - b.p1.x) > 0 else 'y'
+        ends = [a.p1, a.p2, b.p1, b.p2]
+        low = max(min(getattr(p, axis) for p in ends[:2]),
+                  min(getattr(p, axis) for p in ends[2:]))
+        high = min(max(getattr(p, axis) for p in ends[:2]),
+                   max(getattr(p, axis) for p in ends[2:]))
+        if high > low:
+            return None
+        return next(p for p in ends if getattr(p, axis) == low)
+    if a.intersects(b, proper=True):
+        return None
+    for p, other in ((b.p1, a), (b.p2, a), (a.p1, b), (a.p2, b)):
+        if (Segment._ccw(other.p1, other.p2, p) == 0 and
+                Segment._on_segment(other.p1, p, other.p2)):
+            return p
+    return None
+
+
+def _path_through(edges: List[Segment], k: int, point: Point) -> Tuple[Point, Point]:
+    """
+    Get the ring vertices before and after a point on edge k of a ring.
+    """
+    edge = edges[k]
+    if _same(point, edge.p1):
+        return edges[k - 1].p1, edge.p2
+    if _same(point, edge.p2):
+        return edge.p1, edges[(k + 1) % len(edges)].p2
+    return edge.p1, edge.p2
+
+
+def _paths_cross(point: Point, first: Tuple[Point, Point],
+                 second: Tuple[Point, Point]) -> bool:
+    """
+    Check if two boundary paths through a point cross there.
+    
+    The first path splits the directions around the point into two
+    sides; the second crosses it when it leaves on both sides. Leaving
+    along the first path counts as crossing, since the paths overlap.
+    """
+    def angle(p: Point) -> float:
+        return math.atan2(p.y - point.y, p.x - point.x)
+    
+    low, high = sorted(angle(p) for p in first)
+    sides = set()
+    for p in second:
+        direction = angle(p)
+        if direction == low or direction == high:
+            return True
+        sides.add(low < direction < high)
+    return len(sides) == 2
+
+
+def _crossing_rings(rings: List[Polygon]) -> List[Tuple[int, int]]:
+    """
+    Find the pairs of rings whose boundaries cross or overlap.
+    
+    All edges go through one Bentley-Ottmann sweep
+    (geometry.find_intersections). Boundaries may touch at isolated
+    points: where two edges only meet at a point, the paths of the two
+    rings through it are compared and only a crossing counts. A ring
+    paired with itself crosses or overlaps itself.
+    
+    Returns:
+        Sorted list of ring index pairs (i, j) with i <= j.
+    """
+    from .intersections import find_intersections
+    ring_edges = [ring.get_edges() for ring in rings]
+    edges: List[Segment] = []
+    owner: List[Tuple[int, int]] = []
+    for r, ring in enumerate(ring_edges):
+        edges.extend(ring)
+        owner.extend((r, k) for k in range(len(ring)))
+    
+    pairs = set()
+    for i, j in find_intersections(edges):
+        (a, k), (b, m) = owner[i], owner[j]
+        pair = (min(a, b), max(a, b))
+        if pair in pairs:
+            continue
+        point = _meeting_point(edges[i], edges[j])
+        if point is None:
+            pairs.add(pair)
+            continue
+        first = _path_through(ring_edges[a], k, point)
+        second = _path_through(ring_edges[b], m, point)
+        if a == b and {(p.x, p.y) for p in first} == {(p.x, p.y) for p in second}:
+            # Consecutive edges of one path through a vertex
+            continue
+        if _paths_cross(point, first, second):
+            pairs.add(pair)
+    return sorted(pairs)
+
+
+def _ring_location(ring: Polygon, region) -> str:
+    """
+    Locate a ring against a region by a point of it off the region's boundary.
+    
+    Rings may touch, so the vertices are tried first and then the edge
+    midpoints, until one is not on the boundary.
+    
+    Returns:
+        'INSIDE' or 'OUTSIDE', or 'BOUNDARY' if the whole ring is.
+    """
+    midpoints = (Point((e.p1.x + e.p2.x) / 2, (e.p1.y + e.p2.y) / 2)
+                 for e in ring.get_edges())
+    for point in chain(ring.vertices, midpoints):
+        location = region.point_location(point, 0)
+        if location != 'BOUNDARY':
+            return location
+    return 'BOUNDARY'
+
+
+def _bounds_contain(outer: Tuple[float, float, float, float],
+                    inner: Tuple[float, float, float, float]) -> bool:
+    """Check whether one bounding box contains another."""
+    return (outer[0] <= inner[0] and outer[1] <= inner[1] and
+            inner[2] <= outer[2] and inner[3] <= outer[3])
+
+
+class PolygonWithHoles:
+    """
+    A simple outer ring with zero or more simple holes cut out of it.
+    
+    Holes must lie inside the outer ring and outside each other. Rings may
+    touch at isolated points but must not cross or share an edge;
+    validation_errors() checks this. The rings may be in either
+    orientation.
+    """
+    
+    def __init__(self, outer: Polygon, holes: Optional[List[Polygon]] = None,
+                 locators: bool = False):
+        """
+        Initialize a polygon with holes.
+        
+        Args:
+            outer: The outer boundary.
+            holes: Rings cut out of the outer boundary.
+            locators: If True, point location uses a per-ring index (the
+                      ring's ConvexPolygon or ConvexDecomposition) instead
+                      of scanning the ring's edges. Worth it for many
+                      queries against large rings.
+        """
+        self.outer = outer
+        self.holes = list(holes or [])
+        self.locators = locators
+        self._entries = None
+    
+    def __repr__(self) -> str:
+        return (f"PolygonWithHoles({self.outer.num_vertices} vertices, "
+                f"{len(self.holes)} holes)")
+    
+    @property
+    def rings(self) -> List[Polygon]:
+        """The outer ring followed by the holes."""
+        return [self.outer] + self.holes
+    
+    @property
+    def num_vertices(self) -> int:
+        """Return the number of vertices over all rings."""
+        return sum(ring.num_vertices for ring in self.rings)
+    
+    def get_edges(self) -> List[Segment]:
+        """
+        Get the edges of every ring.
+        
+        Returns:
+            List of Segment objects, outer ring first.
+        """
+        return [edge for ring in self.rings for edge in ring.get_edges()]
+    
+    def area(self) -> float:
+        """
+        Calculate the area of the outer ring minus the area of the holes.
+        
+        Returns:
+            The area of the region.
+        """
+        return self.outer.area() - sum(hole.area() for hole in self.holes)
+    
+    def perimeter(self) -> float:
+        """
+        Calculate the total boundary length, including the holes.
+        
+        Returns:
+            The sum of the ring perimeters.
+        """
+        return sum(ring.perimeter() for ring in self.rings)
+    
+    def bounding_box(self) -> Tuple[float, float, float, float]:
+        """
+        Calculate the axis-aligned bounding box (that of the outer ring).
+        
+        Returns:
+            Tuple (min_x, min_y, max_x, max_y).
+        """
+        return self.outer.bounding_box()
+    
+    def to_list(self) -> List[List[List[float]]]:
+        """
+        Convert the rings to lists of [x, y] coordinate pairs.
+        
+        Returns:
+            One list of [x, y] pairs per ring, outer ring first.
+        """
+        return [ring.to_list() for ring in self.rings]
+    
+    @staticmethod
+    def from_list(rings: List[List[List[float]]],
+                  locators: bool = False) -> PolygonWithHoles:
+        """
+        Create a PolygonWithHoles from lists of [x, y] coordinate pairs.
+        
+        Args:
+            rings: The outer ring followed by the holes.
+            locators: As in the constructor.
+        
+        Returns:
+            A PolygonWithHoles object.
+        """
+        polygons = [Polygon.from_list(coords) for coords in rings]
+        return PolygonWithHoles(polygons[0], polygons[1:], locators)
+    
+    def _ring_entries(self) -> List[tuple]:
+        """Get the per-ring point location data, building it on first use."""
+        if self._entries is None:
+            self._entries = [_ring_entry(ring, self.locators) for ring in self.rings]
+        return self._entries
+    
+    def point_location(self, point: Point, tolerance: float = 0.5) -> str:
+        """
+        Determine if a point is inside, outside, or on the boundary of the region.
+        
+        A point inside a hole is 'OUTSIDE'; a point on a hole's boundary
+        is 'BOUNDARY'. All rings are handled in one crossing-number pass
+        with bounding box rejection per ring.
+        
+        Args:
+            point: The point to check.
+            tolerance: Numerical tolerance for edge detection.
+                       Default of 0.5 is suitable for integer coordinates.
+        
+        Returns:
+            'INSIDE', 'OUTSIDE' or 'BOUNDARY'.
+        """
+        return _locate_in_rings(point, self._ring_entries(), tolerance)
+    
+    def contains_point(self, point: Point) -> bool:
+        """
+        Check if a point is inside or on the boundary of the region.
+        
+        Args:
+            point: The point to check.
+        
+        Returns:
+            True if point is inside or on boundary, False if outside.
+        """
+        return self.point_location(point) != 'OUTSIDE'
+    
+    def union(self, other) -> MultiPolygon:
+        """Get the region inside this polygon or another shape (see boolean_operation)."""
+        from .boolean import boolean_operation
+        return boolean_operation(self, other, 'union')
+    
+    def intersection(self, other) -> MultiPolygon:
+        """Get the region inside both this polygon and another shape (see boolean_operation)."""
+        from .boolean import boolean_operation
+        return boolean_operation(self, other, 'intersection')
+    
+    def difference(self, other) -> MultiPolygon:
+        """Get the region inside this polygon but not another shape (see boolean_operation)."""
+        from .boolean import boolean_operation
+        return boolean_operation(self, other, 'difference')
+    
+    def validation_errors(self) -> List[str]:
+        """
+        Check that the rings form a valid polygon with holes.
+        
+        No ring may cross or overlap itself or another ring (checked with
+        one exact sweep over all edges; touching at isolated points is
+        allowed), every hole must lie inside the outer ring and no hole
+        may lie inside another.
+        
+        Returns:
+            List of error messages; empty if the polygon is valid.
+        """
+        errors = []
+        names = ["Outer ring"] + [f"Hole {k + 1}" for k in range(len(self.holes))]
+        for i, j in _crossing_rings(self.rings):
+            if i == j:
+                errors.append(f"{names[i]} is not simple")
+            else:
+                errors.append(f"{names[i]} and {names[j].lower()} intersect")
+        
+        for k, hole in enumerate(self.holes):
+            if _ring_location(hole, self.outer) != 'INSIDE':
+                errors.append(f"{names[k + 1]} is not inside the outer ring")
+            for m, other in enumerate(self.holes):
+                if m != k and _bounds_contain(other.bounding_box(), hole.bounding_box()) \
+                        and _ring_location(hole, other) == 'INSIDE':
+                    errors.append(f"{names[k + 1]} is nested inside {names[m + 1].lower()}")
+        return errors
+    
+    def is_valid(self) -> bool:
+        """
+        Check whether validation_errors() finds no problems.
+        
+        Returns:
+            True if the polygon with holes is valid.
+        """
+        return not self.validation_errors()
+
+
+class MultiPolygon:
+    """
+    A set of disjoint polygons, each possibly with holes.
+    
+    Members may sit inside holes of other members and may touch at
+    isolated points, but must not overlap; validation_errors() checks
+    this.
+    """
+    
+    def __init__(self, polygons: List[Union[Polygon, PolygonWithHoles]],
+                 locators: bool = False):
+        """
+        Initialize a multipolygon.
+        
+        Args:
+            polygons: Members; plain Polygons are treated as having no holes.
+            locators: If True, point location uses per-ring indexes, as in
+                      PolygonWithHoles.
+        """
+        self.polygons = [p if isinstance(p, PolygonWithHoles)
+                         else PolygonWithHoles(p, locators=locators)
+                         for p in polygons]
+        self.locators = locators
+        self._entries = None
+    
+    def __repr__(self) -> str:
+        return f"MultiPolygon({len(self.polygons)} polygons)"
+    
+    def __len__(self) -> int:
+        return len(self.polygons)
+    
+    def __iter__(self):
+        return iter(self.polygons)
+    
+    @property
+    def rings(self) -> List[Polygon]:
+        """Every ring of every member, in member order."""
+        return [ring for polygon in self.polygons for ring in polygon.rings]
+    
+    @property
+    def num_vertices(self) -> int:
+        """Return the number of vertices over all members."""
+        return sum(polygon.num_vertices for polygon in self.polygons)
+    
+    def get_edges(self) -> List[Segment]:
+        """
+        Get the edges of every ring of every member.
+        
+        Returns:
+            List of Segment objects.
+        """
+        return [edge for ring in self.rings for edge in ring.get_edges()]
+    
+    def area(self) -> float:
+        """
+        Calculate the total area of the members, excluding their holes.
+        
+        Returns:
+            The area of the region.
+        """
+        return sum(polygon.area() for polygon in self.polygons)
+    
+    def perimeter(self) -> float:
+        """
+        Calculate the total boundary length of the members, including holes.
+        
+        Returns:
+            The sum of all ring perimeters.
+        """
+        return sum(polygon.perimeter() for polygon in self.polygons)
+    
+    def bounding_box(self) -> Tuple[float, float, float, float]:
+        """
+        Calculate the axis-aligned bounding box of all members.
+        
+        Returns:
+            Tuple (min_x, min_y, max_x, max_y).
+        
+        Raises:
+            ValueError: If the multipolygon is empty.
+        """
+        if not self.polygons:
+            raise ValueError("An empty multipolygon has no bounding box")
+        boxes = [polygon.bounding_box() for polygon in self.polygons]
+        return (min(b[0] for b in boxes), min(b[1] for b in boxes),
+                max(b[2] for b in boxes), max(b[3] for b in boxes))
+    
+    def _ring_entries(self) -> List[tuple]:
+        """Get the point location data of every ring, building it on first use."""
+        if self._entries is None:
+            self._entries = [entry for polygon in self.polygons
+                             for entry in polygon._ring_entries()]
+        return self._entries
+    
+    def point_location(self, point: Point, tolerance: float = 0.5) -> str:
+        """
+        Determine if a point is inside, outside, or on the boundary of the region.
+        
+        All rings of all members are handled in one crossing-number pass
+        with bounding box rejection per ring.
+        
+        Args:
+            point: The point to check.
+            tolerance: Numerical tolerance for edge detection.
+        
+        Returns:
+            'INSIDE', 'OUTSIDE' or 'BOUNDARY'.
+        """
+        return _locate_in_rings(point, self._ring_entries(), tolerance)
+    
+    def contains_point(self, point: Point) -> bool:
+        """
+        Check if a point is inside or on the boundary of any member.
+        
+        Args:
+            point: The point to check.
+        
+        Returns:
+            True if point is inside or on boundary, False if outside.
+        """
+        return self.point_location(point) != 'OUTSIDE'
+    
+    def union(self, other) -> MultiPolygon:
+        """Get the region inside this multipolygon or another shape (see boolean_operation)."""
+        from .boolean import boolean_operation
+        return boolean_operation(self, other, 'union')
+    
+    def intersection(self, other) -> MultiPolygon:
+        """Get the region inside both this multipolygon and another shape (see boolean_operation)."""
+        from .boolean import boolean_operation
+        return boolean_operation(self, other, 'intersection')
+    
+    def difference(self, other) -> MultiPolygon:
+        """Get the region inside this multipolygon but not another shape (see boolean_operation)."""
+        from .boolean import boolean_operation
+        return boolean_operation(self, other, 'difference')
+    
+    def validation_errors(self) -> List[str]:
+        """
+        Check that the members are valid and disjoint.
+        
+        Each member must be a valid PolygonWithHoles. Rings of different
+        members must not cross or overlap (one sweep over all edges;
+        touching at isolated points is allowed), and no member may lie
+        inside another unless it sits in one of its holes.
+        
+        Returns:
+            List of error messages; empty if the multipolygon is valid.
+        """
+        errors = []
+        for k, polygon in enumerate(self.polygons):
+            errors.extend(f"Polygon {k + 1}: {error}"
+                          for error in polygon.validation_errors())
+        
+        # Map each ring to its member
+        owner = [k for k, polygon in enumerate(self.polygons)
+                 for _ in polygon.rings]
+        crossing = set()
+        for i, j in _crossing_rings(self.rings):
+            if owner[i] != owner[j]:
+                crossing.add((owner[i], owner[j]))
+        for a, b in sorted(crossing):
+            errors.append(f"Polygons {a + 1} and {b + 1} intersect")
+        
+        for k, polygon in enumerate(self.polygons):
+            for m, other in enumerate(self.polygons):
+                if m != k and _bounds_contain(other.bounding_box(), polygon.bounding_box()) \
+                        and _ring_location(polygon.outer, other) == 'INSIDE':
+                    errors.append(f"Polygon {k + 1} lies inside polygon {m + 1}")
+        return errors
+    
+    def is_valid(self) -> bool:
+        """
+        Check whether validation_errors() finds no problems.
+        
+        Returns:
+            True if the multipolygon is valid.
+        """
+        return not self.validation_errors()
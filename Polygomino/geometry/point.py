@@ -22,6 +22,8 @@ class Point:
         return math.isclose(self.x, other.x) and math.isclose(self.y, other.y)
     
     def __hash__(self) -> int:
+        # Rounding cannot agree with the tolerance in __eq__ for every pair
+        # of points; use PointHash for tolerant vertex lookups
         return hash((round(self.x, 10), round(self.y, 10)))
     
     def distance_to(self, other: Point) -> float:
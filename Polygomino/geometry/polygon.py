@@ -3,11 +3,15 @@ Polygon class for polygon operations.
 """
 
 from __future__ import annotations
-from typing import List
+from typing import List, Optional, Tuple
 from .point import Point
 from .segment import Segment
 
 
+# Edge count from which is_simple uses the sweep instead of the pairwise scan
+SWEEP_MIN_EDGES = 128
+
+
 class Polygon:
     """Represents a polygon defined by a list of vertices."""
     
@@ -21,8 +25,25 @@ class Polygon:
         """
         if len(vertices) < 3:
             raise ValueError("A polygon must have at least 3 vertices")
+        self._cache = {}
         self.vertices = vertices
     
+    @property
+    def vertices(self) -> List[Point]:
+        """Return the polygon vertices."""
+        return self._vertices
+    
+    @vertices.setter
+    def vertices(self, vertices: List[Point]):
+        """
+        Replace the polygon vertices and drop any cached query structures.
+        
+        Mutating the vertex list in place does not invalidate caches;
+        assign a new list instead.
+        """
+        self._vertices = vertices
+        self._cache = {}
+    
     def __repr__(self) -> str:
         return f"Polygon({len(self.vertices)} vertices)"
     
@@ -51,6 +72,23 @@ class Polygon:
         A simple polygon has edges that only meet at their endpoints,
         non-adjacent edges do not intersect, and no edges overlap.
         
+        Large polygons are checked with a Bentley-Ottmann sweep
+        (geometry.find_intersections) instead of comparing every pair
+        of edges.
+        
+        Returns:
+            True if the polygon is simple, False otherwise.
+        """
+        if len(self.vertices) >= SWEEP_MIN_EDGES:
+            from .intersections import find_intersections
+            return not find_intersections(self.get_edges(), proper=True)
+        
+        return self._scan_is_simple()
+    
+    def _scan_is_simple(self) -> bool:
+        """
+        Reference O(n^2) simplicity test comparing every pair of edges.
+        
         Returns:
             True if the polygon is simple, False otherwise.
         """
@@ -99,6 +137,19 @@ class Polygon:
         """
         return sum(edge.length() for edge in self.get_edges())
     
+    def bounding_box(self) -> Tuple[float, float, float, float]:
+        """
+        Calculate the axis-aligned bounding box of the polygon.
+        
+        Returns:
+            Tuple (min_x, min_y, max_x, max_y).
+        """
+        if 'bounds' not in self._cache:
+            xs = [v.x for v in self.vertices]
+            ys = [v.y for v in self.vertices]
+            self._cache['bounds'] = (min(xs), min(ys), max(xs), max(ys))
+        return self._cache['bounds']
+    
     def centroid(self) -> Point:
         """
         Calculate the centroid (center of mass) of the polygon.
@@ -145,13 +196,16 @@ class Polygon:
         if n < 3:
             return False
         
+        xs = [v.x for v in self.vertices]
+        ys = [v.y for v in self.vertices]
+        
         sign = None
         for i in range(n):
-            p1 = self.vertices[i]
-            p2 = self.vertices[(i + 1) % n]
-            p3 = self.vertices[(i + 2) % n]
+            j = (i + 1) % n
+            k = (i + 2) % n
             
-            cross = (p2 - p1).cross(p3 - p2)
+            cross = ((xs[j] - xs[i]) * (ys[k] - ys[j]) -
+                     (ys[j] - ys[i]) * (xs[k] - xs[j]))
             
             if cross != 0:
                 current_sign = cross > 0
@@ -162,11 +216,322 @@ class Polygon:
         
         return True
     
+    def simplify(self, tolerance: float = 0.0,
+                 method: str = 'douglas_peucker') -> Tuple[Polygon, List[int]]:
+        """
+        Get a copy of the polygon with fewer vertices.
+        
+        Repeated and exactly collinear vertices are always removed, which
+        leaves the boundary unchanged. With a positive tolerance the
+        result is further reduced by a lossy method; it may then no longer
+        be simple, so check is_simple() if that matters.
+        
+        Args:
+            tolerance: 0 for exact collinear removal only. For
+                       'douglas_peucker', the maximum distance a removed
+                       vertex may lie from the new boundary; for
+                       'visvalingam', the triangle area below which a
+                       vertex is removed.
+            method: 'douglas_peucker' or 'visvalingam'.
+        
+        Returns:
+            Tuple (polygon, index_map) where index_map[k] is the index in
+            this polygon of vertex k of the simplified polygon.
+        
+        Raises:
+            ValueError: If the tolerance is negative or the method unknown.
+        """
+        from .simplify import remove_collinear, douglas_peucker, visvalingam
+        methods = {'douglas_peucker': douglas_peucker,
+                   'visvalingam': visvalingam}
+        if method not in methods:
+            raise ValueError(f"Unknown simplification method: {method}")
+        if tolerance < 0:
+            raise ValueError("Tolerance must not be negative")
+        
+        index_map = remove_collinear(self.vertices)
+        if tolerance > 0:
+            kept = [self.vertices[i] for i in index_map]
+            index_map = [index_map[k] for k in methods[method](kept, tolerance)]
+        return Polygon([self.vertices[i] for i in index_map]), index_map
+    
+    def as_convex(self) -> Optional['ConvexPolygon']:
+        """
+        Get a ConvexPolygon view of this polygon if it is simple and convex.
+        
+        The result is cached until the vertices are replaced.
+        
+        Returns:
+            A ConvexPolygon sharing this polygon's vertices, or None if the
+            polygon is not convex.
+        """
+        if 'convex' not in self._cache:
+            from .convex import ConvexPolygon
+            try:
+                self._cache['convex'] = ConvexPolygon(self.vertices)
+            except ValueError:
+                self._cache['convex'] = None
+        return self._cache['convex']
+    
+    def convex_decomposition(self) -> 'ConvexDecomposition':
+        """
+        Get the polygon split into convex parts (Hertel-Mehlhorn).
+        
+        The decomposition is built on first use and cached until the
+        vertices are replaced.
+        
+        Returns:
+            A ConvexDecomposition of this polygon.
+        
+        Raises:
+            ValueError: If the polygon is degenerate or not simple.
+        """
+        if 'decomposition' not in self._cache:
+            from .decomposition import ConvexDecomposition
+            try:
+                self._cache['decomposition'] = ConvexDecomposition(self)
+            except ValueError as e:
+                self._cache['decomposition'] = e
+        decomposition = self._cache['decomposition']
+        if isinstance(decomposition, ValueError):
+            raise decomposition
+        return decomposition
+    
+    def convex_parts(self) -> List['ConvexPolygon']:
+        """
+        Get the convex parts of the polygon.
+        
+        Returns:
+            List of ConvexPolygon objects whose union is this polygon.
+        """
+        return self.convex_decomposition().parts
+    
+    def intersects(self, other: Polygon) -> bool:
+        """
+        Check if this polygon shares at least one point with another polygon.
+        
+        Tests pairs of convex parts with overlapping bounding boxes using
+        the separating axis theorem. Touching boundaries count as
+        intersecting.
+        
+        Args:
+            other: The other polygon.
+        
+        Returns:
+            True if the polygons intersect, False otherwise.
+        """
+        a_min_x, a_min_y, a_max_x, a_max_y = self.bounding_box()
+        b_min_x, b_min_y, b_max_x, b_max_y = other.bounding_box()
+        if (a_max_x < b_min_x or b_max_x < a_min_x or
+                a_max_y < b_min_y or b_max_y < a_min_y):
+            return False
+        try:
+            return self.convex_decomposition().intersects(
+                other.convex_decomposition())
+        except ValueError:
+            # Degenerate polygons fall back to the edge scan
+            return self._scan_intersects(other)
+    
+    def _scan_intersects(self, other: Polygon) -> bool:
+        """
+        Reference O(n * m) polygon intersection test.
+        
+        Two polygons intersect if any pair of edges intersects, or if one
+        polygon lies entirely inside the other.
+        
+        Args:
+            other: The other polygon.
+        
+        Returns:
+            True if the polygons intersect, False otherwise.
+        """
+        other_edges = other.get_edges()
+        for edge in self.get_edges():
+            for other_edge in other_edges:
+                if edge.intersects(other_edge):
+                    return True
+        return (self._scan_point_location(other.vertices[0]) != 'OUTSIDE' or
+                other._scan_point_location(self.vertices[0]) != 'OUTSIDE')
+    
+    def union(self, other) -> 'MultiPolygon':
+        """
+        Get the region inside this polygon or another shape.
+        
+        Args:
+            other: A Polygon, PolygonWithHoles or MultiPolygon.
+        
+        Returns:
+            A MultiPolygon; see geometry.boolean_operation.
+        """
+        from .boolean import boolean_operation
+        return boolean_operation(self, other, 'union')
+    
+    def intersection(self, other) -> 'MultiPolygon':
+        """
+        Get the region inside both this polygon and another shape.
+        
+        Args:
+            other: A Polygon, PolygonWithHoles or MultiPolygon.
+        
+        Returns:
+            A MultiPolygon; see geometry.boolean_operation.
+        """
+        from .boolean import boolean_operation
+        return boolean_operation(self, other, 'intersection')
+    
+    def difference(self, other) -> 'MultiPolygon':
+        """
+        Get the region inside this polygon but not another shape.
+        
+        Args:
+            other: A Polygon, PolygonWithHoles or MultiPolygon.
+        
+        Returns:
+            A MultiPolygon, with holes where other lies inside this
+            polygon; see geometry.boolean_operation.
+        """
+        from .boolean import boolean_operation
+        return boolean_operation(self, other, 'difference')
+    
+    def edge_index(self) -> 'EdgeBVH':
+        """
+        Get a bounding volume hierarchy over the edges.
+        
+        The index is built on first use and cached until the vertices are
+        replaced.
+        
+        Returns:
+            An EdgeBVH over get_edges().
+        """
+        if 'edge_index' not in self._cache:
+            from .edge_index import EdgeBVH
+            self._cache['edge_index'] = EdgeBVH(self.get_edges())
+        return self._cache['edge_index']
+    
+    def nearest_edge(self, point: Point) -> Tuple[int, float]:
+        """
+        Find the edge nearest to a point, in O(log n) for typical polygons.
+        
+        Args:
+            point: The point to measure from.
+        
+        Returns:
+            Tuple (index into get_edges(), Euclidean distance to that edge).
+        """
+        return self.edge_index().nearest(point)
+    
+    def signed_distance(self, point: Point) -> float:
+        """
+        Calculate the distance from a point to the boundary, negative inside.
+        
+        The sign is read off the nearest boundary feature, so no O(n)
+        containment test is needed: the side of the nearest edge, or for
+        a nearest vertex, whether the point lies in the polygon's angle
+        there. The sign is exact for integer coordinates. Intended for
+        simple polygons; a vertex shared by two parts of the boundary may
+        give the wrong sign nearby.
+        
+        Args:
+            point: The point to measure from.
+        
+        Returns:
+            Distance to the nearest edge; negative inside the polygon, 0 on
+            the boundary.
+        """
+        index, distance = self.nearest_edge(point)
+        if distance == 0:
+            return 0.0
+        
+        if 'counter_clockwise' not in self._cache:
+            twice_area = sum(a.x * b.y - b.x * a.y for a, b in
+                             ((e.p1, e.p2) for e in self.get_edges()))
+            self._cache['counter_clockwise'] = twice_area > 0
+        
+        vertices = self.vertices
+        n = len(vertices)
+        a, b = vertices[index], vertices[(index + 1) % n]
+        along = (point.x - a.x) * (b.x - a.x) + (point.y - a.y) * (b.y - a.y)
+        length2 = (b.x - a.x) ** 2 + (b.y - a.y) ** 2
+        
+        if 0 < along < length2:
+            # Nearest point inside the edge: the point's side decides
+            inside = Segment._ccw(a, b, point) > 0
+        else:
+            # Nearest point is a vertex: test the angle between its
+            # neighbours, skipping repeated vertices
+            k = index if along <= 0 else (index + 1) % n
+            vertex = vertices[k]
+            before, after = k, k
+            for _ in range(n):
+                before = (before - 1) % n
+                if vertices[before] != vertex:
+                    break
+            for _ in range(n):
+                after = (after + 1) % n
+                if vertices[after] != vertex:
+                    break
+            u, w = vertices[before], vertices[after]
+            if not self._cache['counter_clockwise']:
+                u, w = w, u
+            enters = Segment._ccw(vertex, w, point) > 0
+            leaves = Segment._ccw(vertex, point, u) > 0
+            if Segment._ccw(u, vertex, w) >= 0:
+                inside = enters and leaves
+            else:
+                inside = enters or leaves
+            return -distance if inside else distance
+        
+        if not self._cache['counter_clockwise']:
+            inside = not inside
+        return -distance if inside else distance
+    
+    def cast_ray(self, origin: Point, direction: Point,
+                 max_distance: float = float('inf')) -> Optional[Tuple[int, Point]]:
+        """
+        Find the first edge hit by a ray, in O(log n) through the edge index.
+        
+        A ray starting on an edge does not hit that edge at its origin.
+        
+        Args:
+            origin: Start of the ray.
+            direction: Direction of the ray; need not be a unit vector.
+            max_distance: Ignore hits farther than this from the origin.
+        
+        Returns:
+            Tuple (index into get_edges(), hit point), or None on a miss.
+        """
+        length = (direction.x ** 2 + direction.y ** 2) ** 0.5
+        if length == 0:
+            return None
+        index, t = self.edge_index().raycast(origin, direction, max_distance / length)
+        if index < 0:
+            return None
+        return index, Point(origin.x + t * direction.x, origin.y + t * direction.y)
+    
+    def visibility_polygon(self, point: Point) -> Polygon:
+        """
+        Compute the part of the polygon visible from a point inside it.
+        
+        Args:
+            point: The viewpoint.
+        
+        Returns:
+            A star-shaped Polygon; see geometry.visibility.visibility_from.
+        
+        Raises:
+            ValueError: If the point is not strictly inside the polygon.
+        """
+        if self.point_location(point, 0) != 'INSIDE':
+            raise ValueError("The viewpoint must be inside the polygon")
+        from .visibility import visibility_from
+        return visibility_from(self.edge_index(), point)
+    
     def point_location(self, point: Point, tolerance: float = 0.5) -> str:
         """
         Determine if a point is inside, outside, or on an edge of the polygon.
         
-        Uses the ray casting algorithm to determine point location.
+        Convex polygons are dispatched to ConvexPolygon.point_location,
+        which runs in O(log n). Other polygons use the ray casting algorithm.
         
         Args:
             point: The point to check.
@@ -178,6 +543,23 @@ class Polygon:
             'OUTSIDE': Point is outside the polygon.
             'BOUNDARY': Point is on the boundary of the polygon.
         """
+        convex = self.as_convex()
+        if convex is not None:
+            return convex.point_location(point, tolerance)
+        
+        return self._scan_point_location(point, tolerance)
+    
+    def _scan_point_location(self, point: Point, tolerance: float = 0.5) -> str:
+        """
+        Reference O(n) point location: boundary scan plus ray casting.
+        
+        Args:
+            point: The point to check.
+            tolerance: Numerical tolerance for edge detection.
+        
+        Returns:
+            'INSIDE', 'OUTSIDE' or 'BOUNDARY'.
+        """
         # First check if point is on any edge (boundary)
         for edge in self.get_edges():
             if edge.contains_point(point, tolerance):
@@ -220,11 +602,22 @@ class Polygon:
         """
         Check if a point is inside or on the boundary of the polygon.
         
+        Uses the cached convex decomposition, so repeated queries cost a
+        few convex tests instead of a full edge scan.
+        
         Args:
             point: The point to check.
         
         Returns:
             True if point is inside or on boundary, False if outside.
         """
-        location = self.point_location(point)
+        min_x, min_y, max_x, max_y = self.bounding_box()
+        if not (min_x - 0.5 <= point.x <= max_x + 0.5 and
+                min_y - 0.5 <= point.y <= max_y + 0.5):
+            return False
+        try:
+            location = self.convex_decomposition().point_location(point)
+        except ValueError:
+            # Degenerate polygons fall back to the edge scan
+            location = self.point_location(point)
         return location in ('INSIDE', 'BOUNDARY')
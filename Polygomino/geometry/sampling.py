@@ -0,0 +1,253 @@
+"""
+Poisson-disk sampling of points inside, outside and on a polygon.
+"""
+
+from __future__ import annotations
+import math
+import random
+from typing import Dict, List, Optional, Tuple
+from .point import Point
+from .polygon import Polygon
+from .raster import classify_grid
+
+
+# Regions that can be sampled, named like Polygon.point_location results
+SAMPLE_LOCATIONS = ('INSIDE', 'OUTSIDE', 'BOUNDARY')
+
+# Default width of the exterior band, as a fraction of the larger
+# bounding box side (the margin the random test point generator uses)
+DEFAULT_BAND_FRACTION = 0.3
+
+# Grid cells that can hold a point closer than the spacing, nearest first
+# so that rejected candidates exit early. The corners of the 5 x 5 block
+# are at least one spacing away and are left out.
+NEIGHBOUR_OFFSETS = sorted(((i, j) for i in range(-2, 3) for j in range(-2, 3)
+                            if abs(i) + abs(j) < 4),
+                           key=lambda offset: offset[0] ** 2 + offset[1] ** 2)
+
+
+class PoissonDiskGrid:
+    """
+    Background grid for a point set with a minimum spacing.
+    
+    Cells have side spacing / sqrt(2), so a cell holds at most one point
+    and every point closer than the spacing lies within two cells on
+    each axis. Checking a candidate therefore looks at no more than 21
+    cells, independent of the number of points.
+    """
+    
+    def __init__(self, spacing: float, points: List[Point] = None):
+        """
+        Initialize the grid.
+        
+        Args:
+            spacing: Minimum distance between any two points.
+            points: Points already placed, e.g. from another region. They
+                    are not checked against each other.
+        
+        Raises:
+            ValueError: If the spacing is not positive.
+        """
+        if spacing <= 0:
+            raise ValueError("Spacing must be positive")
+        self.spacing = spacing
+        self.cell_size = spacing / math.sqrt(2)
+        self.cells: Dict[Tuple[int, int], Point] = {}
+        self.points: List[Point] = []
+        for point in points or []:
+            self.add(point)
+    
+    def __len__(self) -> int:
+        return len(self.points)
+    
+    def _cell(self, x: float, y: float) -> Tuple[int, int]:
+        """Get the grid cell containing a position."""
+        return math.floor(x / self.cell_size), math.floor(y / self.cell_size)
+    
+    def fits(self, x: float, y: float) -> bool:
+        """
+        Check whether a position keeps the minimum spacing to every point.
+        
+        Returns:
+            True if no stored point is closer than the spacing.
+        """
+        cx, cy = self._cell(x, y)
+        limit = self.spacing * self.spacing
+        cells = self.cells
+        for i, j in NEIGHBOUR_OFFSETS:
+            other = cells.get((cx + i, cy + j))
+            if other is not None and (other.x - x) ** 2 + (other.y - y) ** 2 < limit:
+                return False
+        return True
+    
+    def add(self, point: Point):
+        """Store a point; callers check fits() first."""
+        self.cells[self._cell(point.x, point.y)] = point
+        self.points.append(point)
+
+
+def _sample_boundary(polygon: Polygon, grid: PoissonDiskGrid, integer: bool,
+                     tolerance: float, rng: random.Random,
+                     limit: Optional[int]) -> List[Point]:
+    """
+    Dart-throw along the edges, one candidate per unit of length.
+    
+    Candidates are visited in random order and kept when they fit, which
+    gives a maximal spaced subset of the candidates.
+    """
+    candidates = []
+    for edge in polygon.get_edges():
+        steps = max(1, math.ceil(edge.length()))
+        for k in range(steps):
+            t = k / steps
+            x = edge.p1.x + t * (edge.p2.x - edge.p1.x)
+            y = edge.p1.y + t * (edge.p2.y - edge.p1.y)
+            candidates.append((round(x), round(y)) if integer else (x, y))
+    if integer:
+        candidates = list(dict.fromkeys(candidates))
+    rng.shuffle(candidates)
+    
+    samples = []
+    for x, y in candidates:
+        if limit is not None and len(samples) >= limit:
+            break
+        if not grid.fits(x, y):
+            continue
+        point = Point(x, y)
+        if integer and polygon.point_location(point, tolerance) != 'BOUNDARY':
+            continue
+        grid.add(point)
+        samples.append(point)
+    return samples
+
+
+def poisson_disk_sample(polygon: Polygon, spacing: float, location: str = 'INSIDE',
+                        grid: Optional[PoissonDiskGrid] = None,
+                        band: Optional[float] = None,
+                        bounds: Optional[Tuple[float, float, float, float]] = None,
+                        attempts: int = 30, integer: bool = False,
+                        tolerance: float = 0.5,
+                        rng: Optional[random.Random] = None,
+                        limit: Optional[int] = None) -> List[Point]:
+    """
+    Sample well-spread points in one region of a polygon (Bridson).
+    
+    Every new point is a candidate in the annulus between one and two
+    spacings around an active point, so the region fills outward from a
+    random seed. A point whose candidates all fail stops being active.
+    When none are left, random throws look for uncovered parts of the
+    region, and sampling ends after `attempts` throws in a row fail.
+    Each candidate is checked against the grid in O(1) and classified
+    with point_location (or, for integer points, a classify_grid raster of
+    the sampling box), so n samples cost O(n) classifications rather than
+    O(n^2) distance checks.
+    
+    The BOUNDARY region is sampled by dart throwing along the edges.
+    
+    Args:
+        polygon: The polygon to sample around.
+        spacing: Minimum distance between points, including points already
+                 in the grid.
+        location: 'INSIDE', 'OUTSIDE' or 'BOUNDARY', as classified by
+                  point_location with the given tolerance.
+        grid: Grid of points to keep clear of; new points are added to it.
+        band: OUTSIDE points lie within this distance of the boundary.
+              Defaults to 30% of the larger bounding box side.
+        bounds: Optional (min_x, min_y, max_x, max_y) clamp for all points.
+        attempts: Candidates per active point, and failed throws before
+                  sampling stops.
+        integer: Round candidates to integer coordinates before checking
+                 them, so the spacing also holds for the rounded points.
+        tolerance: Boundary tolerance for point_location.
+        rng: Random number generator; defaults to the random module.
+        limit: Stop once this many points are placed, instead of filling
+               the whole region. Small limits classify candidates with
+               point_location rather than rasterizing the box.
+    
+    Returns:
+        The new points, in the order they were placed.
+    
+    Raises:
+        ValueError: If the spacing is not positive, the location is
+                    unknown, or the grid uses a different spacing.
+    """
+    if location not in SAMPLE_LOCATIONS:
+        raise ValueError(f"Unknown location: {location}")
+    if grid is None:
+        grid = PoissonDiskGrid(spacing)
+    elif grid.spacing != spacing:
+        raise ValueError("The grid was built for a different spacing")
+    rng = rng or random
+    
+    if location == 'BOUNDARY':
+        return _sample_boundary(polygon, grid, integer, tolerance, rng, limit)
+    
+    min_x, min_y, max_x, max_y = polygon.bounding_box()
+    if location == 'OUTSIDE':
+        if band is None:
+            band = DEFAULT_BAND_FRACTION * max(max_x - min_x, max_y - min_y)
+        min_x, min_y, max_x, max_y = min_x - band, min_y - band, max_x + band, max_y + band
+    if bounds is not None:
+        min_x, min_y = max(min_x, bounds[0]), max(min_y, bounds[1])
+        max_x, max_y = min(max_x, bounds[2]), min(max_y, bounds[3])
+    if integer:
+        min_x, min_y = math.ceil(min_x), math.ceil(min_y)
+        max_x, max_y = math.floor(max_x), math.floor(max_y)
+    if min_x > max_x or min_y > max_y:
+        return []
+    
+    # Integer candidates are looked up in one rasterized classification
+    # of the sampling box instead of a point_location scan each, unless a
+    # limit makes the candidates fewer than the box's lattice points
+    rows = None
+    box_points = (max_x - min_x + 1) * (max_y - min_y + 1)
+    if integer and (limit is None or limit * attempts > box_points):
+        rows = classify_grid(polygon, min_x, min_y, max_x, max_y, tolerance)
+    
+    def place(x: float, y: float) -> Optional[Point]:
+        """Add a candidate to the grid if it fits the region and spacing."""
+        if integer:
+            x, y = round(x), round(y)
+        if not (min_x <= x <= max_x and min_y <= y <= max_y) or not grid.fits(x, y):
+            return None
+        point = Point(x, y)
+        if rows is not None:
+            found = rows[y - min_y][x - min_x]
+        else:
+            found = polygon.point_location(point, tolerance)
+        if found != location:
+            return None
+        if location == 'OUTSIDE' and polygon.nearest_edge(point)[1] > band:
+            return None
+        grid.add(point)
+        return point
+    
+    samples = []
+    active = []
+    failures = 0
+    while failures < attempts and (limit is None or len(samples) < limit):
+        if not active:
+            point = place(rng.uniform(min_x, max_x), rng.uniform(min_y, max_y))
+            if point is None:
+                failures += 1
+            else:
+                failures = 0
+                samples.append(point)
+                active.append(point)
+            continue
+        
+        index = rng.randrange(len(active))
+        parent = active[index]
+        for _ in range(attempts):
+            radius = rng.uniform(spacing, 2 * spacing)
+            angle = rng.uniform(0, 2 * math.pi)
+            point = place(parent.x + radius * math.cos(angle),
+                          parent.y + radius * math.sin(angle))
+            if point is not None:
+                samples.append(point)
+                active.append(point)
+                break
+        else:
+            active[index] = active[-1]
+            active.pop()
+    return samples
@@ -3,6 +3,8 @@ Segment class for line segment operations.
 """
 
 from __future__ import annotations
+import math
+from typing import Optional
 from .point import Point
 
 
@@ -109,6 +111,86 @@ class Segment:
         
         return abs(cross) <= tolerance
     
+    def distance_squared_to_point(self, point: Point) -> float:
+        """
+        Calculate the squared Euclidean distance from a point to this segment.
+        
+        The point is projected onto the segment and clamped to its
+        endpoints. Inside the segment the result is cross^2 / length^2,
+        computed exactly until the final division.
+        
+        Args:
+            point: The point to measure from.
+        
+        Returns:
+            The squared distance to the nearest point of the segment.
+        """
+        x1, y1, x2, y2 = self.p1.x, self.p1.y, self.p2.x, self.p2.y
+        dx, dy = x2 - x1, y2 - y1
+        px, py = point.x - x1, point.y - y1
+        length2 = dx * dx + dy * dy
+        along = px * dx + py * dy
+        if length2 == 0 or along <= 0:
+            return px * px + py * py
+        if along >= length2:
+            qx, qy = point.x - x2, point.y - y2
+            return qx * qx + qy * qy
+        cross = px * dy - py * dx
+        return cross * cross / length2
+    
+    def distance_to_point(self, point: Point) -> float:
+        """
+        Calculate the Euclidean distance from a point to this segment.
+        
+        Unlike contains_point, which thresholds a cross product, this is a
+        true distance.
+        
+        Args:
+            point: The point to measure from.
+        
+        Returns:
+            The distance to the nearest point of the segment.
+        """
+        return math.sqrt(self.distance_squared_to_point(point))
+    
+    def ray_intersection(self, origin: Point, direction: Point) -> Optional[float]:
+        """
+        Find where a ray first meets this segment.
+        
+        Uses the same cross products as the crossing test of
+        Polygon.point_location. A ray starting on the segment does not hit
+        it at its origin, so rays can be cast again from a hit point, and
+        a ray running along the segment only hits it if the segment lies
+        entirely ahead.
+        
+        Args:
+            origin: Start of the ray.
+            direction: Direction of the ray; need not be a unit vector.
+        
+        Returns:
+            Ray parameter t > 0 of the hit (the hit point is
+            origin + t * direction), or None if the ray misses.
+        """
+        dx, dy = direction.x, direction.y
+        ex, ey = self.p2.x - self.p1.x, self.p2.y - self.p1.y
+        wx, wy = self.p1.x - origin.x, self.p1.y - origin.y
+        denom = dx * ey - dy * ex
+        if denom == 0:
+            if wx * dy - wy * dx != 0:
+                return None
+            # Collinear: hit the nearer endpoint if both lie ahead
+            length2 = dx * dx + dy * dy
+            if length2 == 0:
+                return None
+            t1 = (wx * dx + wy * dy) / length2
+            t2 = ((self.p2.x - origin.x) * dx + (self.p2.y - origin.y) * dy) / length2
+            return min(t1, t2) if t1 > 0 and t2 > 0 else None
+        t = (wx * ey - wy * ex) / denom
+        u = (wx * dy - wy * dx) / denom
+        if t > 0 and 0 <= u <= 1:
+            return t
+        return None
+    
     def random_point_on_segment(self) -> Point:
         """
         Generate a random point on this segment with integer coordinates.
@@ -0,0 +1,172 @@
+"""
+Polygon simplification: exact collinear removal, Douglas-Peucker and
+Visvalingam-Whyatt.
+
+All functions work on a closed ring of vertices and return the indices
+of the vertices to keep, in ring order, so callers can map simplified
+vertices back to the original polygon.
+"""
+
+from __future__ import annotations
+import heapq
+import math
+from typing import List
+from .point import Point
+
+
+def _cross(ox: float, oy: float, ax: float, ay: float,
+           bx: float, by: float) -> float:
+    """Cross product of vectors (a-o) and (b-o) on raw coordinates."""
+    return (ax - ox) * (by - oy) - (ay - oy) * (bx - ox)
+
+
+def _segment_distance(px: float, py: float, ax: float, ay: float,
+                      bx: float, by: float) -> float:
+    """Distance from (px, py) to the segment from (ax, ay) to (bx, by)."""
+    dx, dy = bx - ax, by - ay
+    length2 = dx * dx + dy * dy
+    if length2 == 0:
+        return math.hypot(px - ax, py - ay)
+    t = ((px - ax) * dx + (py - ay) * dy) / length2
+    t = max(0.0, min(1.0, t))
+    return math.hypot(px - (ax + t * dx), py - (ay + t * dy))
+
+
+def remove_collinear(vertices: List[Point]) -> List[int]:
+    """
+    Drop repeated vertices and vertices lying straight between their neighbours.
+    
+    The test is exact (a zero cross product with the vertex between its
+    neighbours), so the boundary of the polygon is unchanged. Spikes,
+    where the boundary doubles back on itself, are kept.
+    
+    Args:
+        vertices: Polygon vertices in either orientation.
+    
+    Returns:
+        Indices of the kept vertices in ring order. At least 3 indices
+        are kept, even for zero-area polygons.
+    """
+    n = len(vertices)
+    xs = [v.x for v in vertices]
+    ys = [v.y for v in vertices]
+    prev = [(i - 1) % n for i in range(n)]
+    nxt = [(i + 1) % n for i in range(n)]
+    alive = [True] * n
+    remaining = n
+    
+    pending = list(range(n))
+    while pending and remaining > 3:
+        i = pending.pop()
+        if not alive[i]:
+            continue
+        h, j = prev[i], nxt[i]
+        if _cross(xs[h], ys[h], xs[i], ys[i], xs[j], ys[j]) != 0:
+            continue
+        # Collinear: removable only if i does not stick out past h or j
+        if (xs[i] - xs[h]) * (xs[j] - xs[i]) + (ys[i] - ys[h]) * (ys[j] - ys[i]) < 0:
+            continue
+        alive[i] = False
+        remaining -= 1
+        nxt[h], prev[j] = j, h
+        pending.extend((h, j))
+    
+    return [i for i in range(n) if alive[i]]
+
+
+def douglas_peucker(vertices: List[Point], tolerance: float) -> List[int]:
+    """
+    Simplify a closed ring with the Douglas-Peucker algorithm.
+    
+    The ring is split at two anchors (vertex 0 and the vertex farthest
+    from it) plus the vertex farthest from the line between them, and each
+    chain keeps its farthest vertex while that lies more than `tolerance`
+    from the segment joining the chain's ends.
+    
+    Args:
+        vertices: Polygon vertices in either orientation.
+        tolerance: Maximum distance a removed vertex may lie from the
+                   simplified boundary.
+    
+    Returns:
+        Indices of the kept vertices in ring order (at least 3 unless all
+        vertices are collinear).
+    """
+    n = len(vertices)
+    xs = [v.x for v in vertices]
+    ys = [v.y for v in vertices]
+    
+    far = max(range(n), key=lambda i: (xs[i] - xs[0]) ** 2 + (ys[i] - ys[0]) ** 2)
+    apex = max(range(n), key=lambda i: abs(
+        _cross(xs[0], ys[0], xs[far], ys[far], xs[i], ys[i])))
+    keep = [False] * n
+    for i in {0, far, apex}:
+        keep[i] = True
+    anchors = sorted(i for i in range(n) if keep[i])
+    
+    stack = [(anchors[k], anchors[(k + 1) % len(anchors)])
+             for k in range(len(anchors))]
+    while stack:
+        a, b = stack.pop()
+        best, best_distance = -1, tolerance
+        i = (a + 1) % n
+        while i != b:
+            distance = _segment_distance(xs[i], ys[i], xs[a], ys[a],
+                                         xs[b], ys[b])
+            if distance > best_distance:
+                best, best_distance = i, distance
+            i = (i + 1) % n
+        if best >= 0:
+            keep[best] = True
+            stack.append((a, best))
+            stack.append((best, b))
+    
+    return [i for i in range(n) if keep[i]]
+
+
+def visvalingam(vertices: List[Point], tolerance: float) -> List[int]:
+    """
+    Simplify a closed ring with the Visvalingam-Whyatt algorithm.
+    
+    Repeatedly removes the vertex whose triangle with its current
+    neighbours has the smallest area, until every remaining triangle has
+    an area of at least `tolerance`. Runs in O(n log n) with a heap.
+    
+    Args:
+        vertices: Polygon vertices in either orientation.
+        tolerance: Triangle area below which a vertex is removed.
+    
+    Returns:
+        Indices of the kept vertices in ring order (at least 3).
+    """
+    n = len(vertices)
+    xs = [v.x for v in vertices]
+    ys = [v.y for v in vertices]
+    prev = [(i - 1) % n for i in range(n)]
+    nxt = [(i + 1) % n for i in range(n)]
+    alive = [True] * n
+    remaining = n
+    
+    def effective_area(i: int) -> float:
+        h, j = prev[i], nxt[i]
+        return abs(_cross(xs[h], ys[h], xs[i], ys[i], xs[j], ys[j])) / 2
+    
+    # Entries are (area, index, version); stale versions are skipped
+    version = [0] * n
+    heap = [(effective_area(i), i, 0) for i in range(n)]
+    heapq.heapify(heap)
+    while heap and remaining > 3:
+        area, i, v = heapq.heappop(heap)
+        if not alive[i] or v != version[i]:
+            continue
+        if area >= tolerance:
+            break
+        alive[i] = False
+        remaining -= 1
+        h, j = prev[i], nxt[i]
+        nxt[h], prev[j] = j, h
+        for k in (h, j):
+            version[k] += 1
+            heapq.heappush(heap, (effective_area(k), k, version[k]))
+    
+    return [i for i in range(n) if alive[i]]
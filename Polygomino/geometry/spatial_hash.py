@@ -0,0 +1,275 @@
+"""
+Quantized spatial hash for welding nearly-equal points.
+"""
+
+from __future__ import annotations
+import math
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+from .point import Point
+from .segment import Segment
+from .polygon import Polygon
+
+
+# Relative tolerance used by Point.__eq__ (math.isclose default)
+POINT_REL_TOL = 1e-9
+
+
+class PointHash:
+    """
+    Dictionary keyed by points, where nearby points share one entry.
+    
+    Points are bucketed into cells of side `tolerance` near the origin.
+    Far from the origin Point.__eq__ accepts differences larger than the
+    tolerance, so there the cells grow geometrically to stay wider than
+    that reach. Every stored point within reach therefore lies in the 3x3
+    block around a lookup's cell, which is found in expected O(1) at any
+    coordinate magnitude. Two points match when they are within
+    `tolerance` of each other on both axes, or when they compare equal
+    with Point.__eq__. Lookups therefore never miss a point that `==`
+    would accept, which Point.__hash__ cannot guarantee.
+    
+    The first point stored for a location becomes its canonical point.
+    """
+    
+    def __init__(self, tolerance: float = 1e-6):
+        """
+        Initialize an empty point hash.
+        
+        Args:
+            tolerance: Per-axis distance at which points are welded.
+        """
+        if tolerance <= 0:
+            raise ValueError("Tolerance must be positive")
+        self.tolerance = tolerance
+        # Cells are `tolerance` wide while the relative reach stays below
+        # half of it
+        self._linear_cells = math.floor((1 - POINT_REL_TOL) /
+                                        (2 * POINT_REL_TOL))
+        self._linear_limit = self._linear_cells * tolerance
+        # Beyond that each cell spans a factor (1 + 4 * rel), four times the
+        # reach of the next cell out, so matches stay in adjacent cells
+        self._log_step = math.log1p(4 * POINT_REL_TOL)
+        self._cells: Dict[Tuple[int, int], List[Tuple[Point, Any]]] = {}
+        self._size = 0
+    
+    def __repr__(self) -> str:
+        return f"PointHash({self._size} points, tolerance={self.tolerance})"
+    
+    def __len__(self) -> int:
+        return self._size
+    
+    def __iter__(self) -> Iterator[Point]:
+        for bucket in self._cells.values():
+            for point, _ in bucket:
+                yield point
+    
+    def __contains__(self, point: Point) -> bool:
+        return self._find(point) is not None
+    
+    def __getitem__(self, point: Point) -> Any:
+        entry = self._find(point)
+        if entry is None:
+            raise KeyError(point)
+        return entry[2]
+    
+    def __setitem__(self, point: Point, value: Any):
+        entry = self._find(point)
+        if entry is None:
+            self._insert(point, value)
+        else:
+            bucket, index, _ = entry
+            bucket[index] = (bucket[index][0], value)
+    
+    def _index(self, value: float) -> int:
+        """Get the cell index containing a value along one axis."""
+        magnitude = abs(value)
+        if magnitude <= self._linear_limit:
+            return math.floor(value / self.tolerance)
+        band = math.floor(math.log(magnitude / self._linear_limit) /
+                          self._log_step)
+        if value > 0:
+            return self._linear_cells + band
+        return -self._linear_cells - 1 - band
+    
+    def _cell(self, x: float, y: float) -> Tuple[int, int]:
+        """Get the cell coordinates containing (x, y)."""
+        return (self._index(x), self._index(y))
+    
+    def _matches(self, a: Point, b: Point) -> bool:
+        """Check if two points weld together."""
+        return ((abs(a.x - b.x) <= self.tolerance and
+                 abs(a.y - b.y) <= self.tolerance) or a == b)
+    
+    def _find(self, point: Point) -> Optional[Tuple[list, int, Any]]:
+        """
+        Find the stored entry nearest to a point among those that match it.
+        
+        Returns:
+            Tuple (bucket, index, value), or None if nothing matches.
+        """
+        x, y = point.x, point.y
+        cx, cy = self._cell(x, y)
+        
+        best = None
+        best_distance = math.inf
+        for i in range(cx - 1, cx + 2):
+            for j in range(cy - 1, cy + 2):
+                bucket = self._cells.get((i, j))
+                if not bucket:
+                    continue
+                for index, (stored, value) in enumerate(bucket):
+                    if self._matches(point, stored):
+                        distance = max(abs(stored.x - x), abs(stored.y - y))
+                        if distance < best_distance:
+                            best = (bucket, index, value)
+                            best_distance = distance
+        return best
+    
+    def _insert(self, point: Point, value: Any):
+        """Store a point that has no existing match."""
+        self._cells.setdefault(self._cell(point.x, point.y), []).append(
+            (point, value))
+        self._size += 1
+    
+    def get(self, point: Point, default: Any = None) -> Any:
+        """
+        Get the value stored for a point.
+        
+        Args:
+            point: The point to look up.
+            default: Value returned when no stored point matches.
+        
+        Returns:
+            The stored value, or default.
+        """
+        entry = self._find(point)
+        return default if entry is None else entry[2]
+    
+    def find(self, point: Point) -> Optional[Point]:
+        """
+        Get the canonical stored point matching a point.
+        
+        Args:
+            point: The point to look up.
+        
+        Returns:
+            The stored Point, or None if no stored point matches.
+        """
+        entry = self._find(point)
+        if entry is None:
+            return None
+        bucket, index, _ = entry
+        return bucket[index][0]
+    
+    def weld(self, point: Point, value: Any = None) -> Point:
+        """
+        Get the canonical point for a point, storing it if it is new.
+        
+        Args:
+            point: The point to weld.
+            value: Value stored when the point is new.
+        
+        Returns:
+            The existing matching Point, or the given point once stored.
+        """
+        entry = self._find(point)
+        if entry is not None:
+            bucket, index, _ = entry
+            return bucket[index][0]
+        self._insert(point, value)
+        return point
+    
+    def items(self) -> Iterator[Tuple[Point, Any]]:
+        """Iterate over (canonical point, value) pairs."""
+        for bucket in self._cells.values():
+            yield from bucket
+
+
+def find_shared_vertices(polygons: List[Polygon], tolerance: float = 1e-6
+                         ) -> Dict[Point, List[Tuple[int, int]]]:
+    """
+    Find vertices that appear in more than one polygon.
+    
+    Args:
+        polygons: Polygons to compare.
+        tolerance: Per-axis distance at which vertices are the same.
+    
+    Returns:
+        Dictionary of canonical point -> list of (polygon index,
+        vertex index) for every vertex shared by at least two polygons.
+    """
+    index = PointHash(tolerance)
+    for p, polygon in enumerate(polygons):
+        for v, vertex in enumerate(polygon.vertices):
+            canonical = index.weld(vertex, [])
+            index[canonical].append((p, v))
+    
+    return {point: uses for point, uses in index.items()
+            if len({p for p, _ in uses}) > 1}
+
+
+def find_shared_endpoints(segments: List[Segment], tolerance: float = 1e-6
+                          ) -> List[Tuple[int, int]]:
+    """
+    Find every pair of segments that share an endpoint.
+    
+    Bulk version of Segment.shares_endpoint: endpoints are welded in a
+    PointHash, so the cost is O(n) plus the number of pairs reported
+    instead of O(n^2) pairwise comparisons.
+    
+    Args:
+        segments: Segments to compare.
+        tolerance: Per-axis distance at which endpoints are the same.
+    
+    Returns:
+        Sorted list of index pairs (i, j) with i < j.
+    """
+    index = PointHash(tolerance)
+    for s, segment in enumerate(segments):
+        for endpoint in (segment.p1, segment.p2):
+            canonical = index.weld(endpoint, set())
+            index[canonical].add(s)
+    
+    pairs = set()
+    for _, users in index.items():
+        ordered = sorted(users)
+        for a in range(len(ordered)):
+            for b in range(a + 1, len(ordered)):
+                pairs.add((ordered[a], ordered[b]))
+    return sorted(pairs)
+
+
+def weld_polygons(polygons: List[Polygon], tolerance: float = 1e-6
+                  ) -> List[Polygon]:
+    """
+    Snap nearly-equal vertices of several polygons to shared Point objects.
+    
+    Useful before merging pieces: shared corners become identical, so
+    edges along a common border match exactly. Consecutive vertices that
+    collapse together are kept once.
+    
+    Args:
+        polygons: Polygons to weld.
+        tolerance: Per-axis distance at which vertices are the same.
+    
+    Returns:
+        New Polygon objects using canonical vertices, one per input polygon.
+    
+    Raises:
+        ValueError: If welding collapses a polygon to fewer than 3 distinct
+                    vertices, e.g. one smaller than the tolerance.
+    """
+    index = PointHash(tolerance)
+    welded = []
+    for k, polygon in enumerate(polygons):
+        vertices = []
+        for vertex in polygon.vertices:
+            canonical = index.weld(vertex)
+            if not vertices or vertices[-1] is not canonical:
+                vertices.append(canonical)
+        if len(vertices) > 1 and vertices[0] is vertices[-1]:
+            vertices.pop()
+        if len(vertices) < 3:
+            raise ValueError(f"Welding collapses polygon {k} to {len(vertices)} vertices")
+        welded.append(Polygon(vertices))
+    return welded
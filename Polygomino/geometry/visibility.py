@@ -0,0 +1,257 @@
+"""
+Ray casting, laser paths and visibility polygons over indexed edges.
+"""
+
+from __future__ import annotations
+import bisect
+import math
+from typing import List, Optional, Tuple, Union
+from .point import Point
+from .polygon import Polygon
+from .edge_index import EdgeBVH
+from .multipolygon import PolygonWithHoles, MultiPolygon
+
+
+# Hits closer together than this are merged in a visibility polygon
+MIN_VERTEX_GAP = 1e-9
+
+
+class _SweepEdge:
+    """An edge seen from the viewpoint, oriented counterclockwise around it."""
+    
+    __slots__ = ('ax', 'ay', 'ex', 'ey', 'cross')
+    
+    def __init__(self, ax: float, ay: float, ex: float, ey: float):
+        # Start relative to the viewpoint, direction, and their cross product
+        self.ax, self.ay = ax, ay
+        self.ex, self.ey = ex, ey
+        self.cross = ax * ey - ay * ex
+    
+    def depth(self, dx: float, dy: float) -> Tuple[float, float]:
+        """
+        Sort key of the edge along the ray from the viewpoint through (dx, dy).
+        
+        The first value is the distance to the edge in units of the ray's
+        length. Edges meeting the ray at the same point are ordered by
+        how steeply they turn towards the viewpoint just past the ray.
+        """
+        across = dx * self.ey - dy * self.ex
+        if across <= 0:
+            # Only rounding puts a parallel or passed edge on the ray
+            return math.inf, 0.0
+        return self.cross / across, (dx * self.ex + dy * self.ey) / across
+
+
+def visibility_from(index: EdgeBVH, point: Point) -> Polygon:
+    """
+    Compute the region visible from a point among indexed edges.
+    
+    A ray from the point sweeps once around it. Edge endpoints, sorted by
+    angle, are the events; the edges the ray currently crosses are kept
+    sorted by distance along it, which does not change between events as
+    long as edges do not cross. Wherever an event changes the nearest
+    edge, the hits of the old and the new nearest edge on that ray are
+    vertices of the visible region. The status is searched by bisection,
+    so the polygon takes O(n log n) comparisons for n edges.
+    
+    Args:
+        index: Edge index enclosing the point.
+        point: The viewpoint.
+    
+    Returns:
+        A star-shaped Polygon of the visible region.
+    
+    Raises:
+        ValueError: If the edges do not enclose the point.
+    """
+    px, py = point.x, point.y
+    initial = []
+    events = []
+    for segment in index.segments:
+        ax, ay = segment.p1.x - px, segment.p1.y - py
+        bx, by = segment.p2.x - px, segment.p2.y - py
+        turn = ax * by - ay * bx
+        if turn == 0:
+            # Seen edge-on; its neighbours decide what it hides
+            continue
+        if turn < 0:
+            ax, ay, bx, by = bx, by, ax, ay
+        edge = _SweepEdge(ax, ay, bx - ax, by - ay)
+        
+        # The sweep starts on the ray pointing towards -x
+        start = math.atan2(ay, ax)
+        end = math.atan2(by, bx)
+        if start == math.pi:
+            start = -math.pi
+        if end == -math.pi:
+            end = math.pi
+        if start == end:
+            continue
+        if start > end:
+            initial.append(edge)
+        events.append((end, 0, bx, by, edge))
+        events.append((start, 1, ax, ay, edge))
+    if not events:
+        raise ValueError("The edges do not enclose the point")
+    
+    events.sort(key=lambda event: (event[0], event[1]))
+    status = sorted(initial, key=lambda edge: edge.depth(-1.0, 0.0))
+    if not status and events[0][0] > -math.pi:
+        raise ValueError("The edges do not enclose the point")
+    
+    hits = []
+    k = 0
+    while k < len(events):
+        # Events on one ray form a run; the ray passes through the first
+        angle, _, dx, dy, _ = events[k]
+        run = k + 1
+        while run < len(events):
+            _, _, x, y, _ = events[run]
+            if x * dy - y * dx != 0 or x * dx + y * dy <= 0:
+                break
+            run += 1
+        
+        before = status[0] if status else None
+        key = lambda edge: edge.depth(dx, dy)
+        for _, kind, _, _, edge in events[k:run]:
+            if kind == 0:
+                position = bisect.bisect_left(status, key(edge), key=key)
+                if position < len(status) and status[position] is edge:
+                    del status[position]
+                elif edge in status:
+                    status.remove(edge)
+        for _, kind, _, _, edge in events[k:run]:
+            if kind == 1:
+                status.insert(bisect.bisect_left(status, key(edge), key=key), edge)
+        if not status and angle < math.pi:
+            # Only the last ray, which is also the first, may end every edge
+            raise ValueError("The edges do not enclose the point")
+        
+        after = status[0] if status else None
+        if after is not before:
+            for edge in (before, after):
+                if edge is not None:
+                    t = edge.depth(dx, dy)[0]
+                    hits.append((px + t * dx, py + t * dy))
+        k = run
+    
+    vertices = []
+    for x, y in hits:
+        if not vertices or (abs(x - vertices[-1].x) > MIN_VERTEX_GAP or
+                            abs(y - vertices[-1].y) > MIN_VERTEX_GAP):
+            vertices.append(Point(x, y))
+    if len(vertices) > 1 and (abs(vertices[0].x - vertices[-1].x) <= MIN_VERTEX_GAP and
+                              abs(vertices[0].y - vertices[-1].y) <= MIN_VERTEX_GAP):
+        vertices.pop()
+    return Polygon(vertices)
+
+
+class RayCaster:
+    """
+    Ray casting and visibility against a fixed set of shapes.
+    
+    All edges of all shapes go into one EdgeBVH, so a ray only tests the
+    edges whose boxes it passes near rather than all n. Typical use is a
+    room polygon plus obstacle polygons or holes.
+    """
+    
+    def __init__(self, shapes: List[Union[Polygon, PolygonWithHoles, MultiPolygon]]):
+        """
+        Index the edges of the shapes.
+        
+        Args:
+            shapes: Polygons, polygons with holes or multipolygons.
+        
+        Raises:
+            ValueError: If the shapes have no edges.
+        """
+        self.shapes = list(shapes)
+        edges = []
+        self.owners: List[Tuple[int, int]] = []
+        for k, shape in enumerate(self.shapes):
+            for j, edge in enumerate(shape.get_edges()):
+                edges.append(edge)
+                self.owners.append((k, j))
+        self.index = EdgeBVH(edges)
+    
+    def cast(self, origin: Point, direction: Point,
+             max_distance: float = math.inf) -> Optional[Tuple[int, int, Point]]:
+        """
+        Find the first edge hit by a ray.
+        
+        A ray starting on an edge does not hit that edge at its origin.
+        
+        Args:
+            origin: Start of the ray.
+            direction: Direction of the ray; need not be a unit vector.
+            max_distance: Ignore hits farther than this from the origin.
+        
+        Returns:
+            Tuple (shape index, edge index in that shape's get_edges(),
+            hit point), or None if nothing is hit.
+        """
+        length = math.hypot(direction.x, direction.y)
+        if length == 0:
+            return None
+        edge, t = self.index.raycast(origin, direction, max_distance / length)
+        if edge < 0:
+            return None
+        shape, shape_edge = self.owners[edge]
+        return shape, shape_edge, Point(origin.x + t * direction.x,
+                                        origin.y + t * direction.y)
+    
+    def trace(self, origin: Point, direction: Point, max_bounces: int = 8,
+              max_distance: float = math.inf) -> List[Point]:
+        """
+        Follow a laser that reflects off every edge it hits.
+        
+        Args:
+            origin: Start of the laser.
+            direction: Initial direction.
+            max_bounces: Stop after this many reflections.
+            max_distance: Total path length after which the laser stops.
+        
+        Returns:
+            The path as a list of points: the origin, each hit point and,
+            if the laser escapes or runs out of length, its end point.
+        """
+        path = [origin]
+        remaining = max_distance
+        for _ in range(max_bounces + 1):
+            length = math.hypot(direction.x, direction.y)
+            if length == 0:
+                break
+            edge, t = self.index.raycast(origin, direction, remaining / length)
+            if edge < 0:
+                if remaining != math.inf:
+                    path.append(Point(origin.x + direction.x * remaining / length,
+                                      origin.y + direction.y * remaining / length))
+                break
+            
+            hit = Point(origin.x + t * direction.x, origin.y + t * direction.y)
+            path.append(hit)
+            remaining -= t * length
+            
+            # Mirror the direction about the edge
+            segment = self.index.segments[edge]
+            ex, ey = segment.p2.x - segment.p1.x, segment.p2.y - segment.p1.y
+            scale = 2 * (direction.x * ex + direction.y * ey) / (ex * ex + ey * ey)
+            direction = Point(scale * ex - direction.x, scale * ey - direction.y)
+            origin = hit
+        return path
+    
+    def visibility_polygon(self, point: Point) -> Polygon:
+        """
+        Compute the region visible from a point.
+        
+        Args:
+            point: The viewpoint, enclosed by the edges (e.g. inside the
+                   room and outside every obstacle).
+        
+        Returns:
+            A star-shaped Polygon of the visible region.
+        
+        Raises:
+            ValueError: If the edges do not enclose the point.
+        """
+        return visibility_from(self.index, point)
@@ -0,0 +1,145 @@
+"""
+Benchmark boolean polygon operations on generator shapes.
+
+For each generator shape and vertex count this script combines pairs of
+polygons, the second shifted against the first, and reports:
+- milliseconds per union, intersection and difference
+- the number of result vertices and holes
+
+Every result is cross-checked by classifying random points against both
+inputs and the result, and the exact result (exact=True) of every
+operation, xor included, must pass MultiPolygon.validation_errors().
+"""
+
+import random
+import sys
+import os
+import time
+
+# Add parent directory to path for geometry imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from geometry import Point, Polygon, boolean_operation
+from geometry.boolean import OPERATIONS
+from scripts.benchmark_decomposition import GENERATORS, generate_simple_shapes
+
+
+# Operations timed by the benchmark, in column order
+BENCHMARK_OPERATIONS = ['union', 'intersection', 'difference']
+
+
+def count_mismatches(first: Polygon, second: Polygon, operation: str,
+                     result, points: list) -> int:
+    """
+    Count points classified differently by the result and the inputs.
+    
+    Points on the boundary of either input are skipped.
+    
+    Returns:
+        Number of points where the result disagrees with the operation
+        applied to the inputs.
+    """
+    keep = OPERATIONS[operation]
+    mismatches = 0
+    for point in points:
+        in_first = first.point_location(point, 0)
+        in_second = second.point_location(point, 0)
+        if 'BOUNDARY' in (in_first, in_second):
+            continue
+        expected = keep(in_first == 'INSIDE', in_second == 'INSIDE')
+        if (result.point_location(point, 0) == 'INSIDE') != expected:
+            mismatches += 1
+    return mismatches
+
+
+def benchmark_generator(name: str, num_vertices: int, num_shapes: int,
+                        num_pairs: int, num_points: int) -> dict:
+    """
+    Benchmark boolean operations for one generator and vertex count.
+    
+    Returns:
+        Dictionary of timing, size and agreement statistics.
+    """
+    shapes = generate_simple_shapes(GENERATORS[name], num_vertices, num_shapes)
+    if not shapes:
+        return None
+    
+    pairs = []
+    for _ in range(num_pairs):
+        first, second = random.choice(shapes), random.choice(shapes)
+        dx, dy = random.randint(-60, 60), random.randint(-60, 60)
+        moved = Polygon([Point(v.x + dx, v.y + dy) for v in second.vertices])
+        pairs.append((first, moved))
+    
+    stats = {
+        'name': name,
+        'avg_vertices': sum(p.num_vertices for p in shapes) / len(shapes),
+        'mismatches': 0,
+        'invalid': 0,
+    }
+    for operation in BENCHMARK_OPERATIONS:
+        start = time.perf_counter()
+        results = [boolean_operation(a, b, operation) for a, b in pairs]
+        stats[operation + '_ms'] = (time.perf_counter() - start) * 1e3 / len(pairs)
+        stats[operation + '_vertices'] = (
+            sum(r.num_vertices for r in results) / len(results))
+        stats[operation + '_holes'] = (
+            sum(len(p.holes) for r in results for p in r) / len(results))
+        
+        for (first, second), result in zip(pairs, results):
+            points = [Point(random.randint(-160, 160) + 0.5,
+                            random.randint(-160, 160) + 0.5)
+                      for _ in range(num_points)]
+            stats['mismatches'] += count_mismatches(first, second, operation,
+                                                    result, points)
+    
+    # Validity covers xor as well, whose members touch most often
+    for first, second in pairs:
+        for operation in OPERATIONS:
+            if boolean_operation(first, second, operation, exact=True).validation_errors():
+                stats['invalid'] += 1
+    return stats
+
+
+def main():
+    """Main entry point for the boolean operation benchmark."""
+    random.seed(12345)
+    vertex_counts = [10, 25, 50, 100]
+    
+    print("Boolean operation benchmark (times per operation, result vertices)")
+    print("-" * 78)
+    print(f"{'shape':<9}{'verts':>7}"
+          + "".join(f"{operation:>20}" for operation in BENCHMARK_OPERATIONS)
+          + f"{'holes':>7}")
+    print("-" * 78)
+    
+    mismatches = invalid = 0
+    for num_vertices in vertex_counts:
+        for name in GENERATORS:
+            stats = benchmark_generator(name, num_vertices, num_shapes=10,
+                                        num_pairs=10, num_points=100)
+            if stats is None:
+                print(f"{name:<9}{num_vertices:>7}  (no simple shapes generated)")
+                continue
+            mismatches += stats['mismatches']
+            invalid += stats['invalid']
+            print(f"{name:<9}{stats['avg_vertices']:>7.1f}"
+                  + "".join(f"{stats[operation + '_ms']:>11.1f}ms"
+                            f"{stats[operation + '_vertices']:>7.0f}"
+                            for operation in BENCHMARK_OPERATIONS)
+                  + f"{stats['difference_holes']:>7.1f}")
+    
+    print("-" * 78)
+    if mismatches:
+        print(f"⚠️ {mismatches} point(s) classified differently by a result "
+              f"and its inputs")
+    if invalid:
+        print(f"⚠️ {invalid} exact result(s) failed validation_errors()")
+    if mismatches or invalid:
+        sys.exit(1)
+    print("✅ Every result agrees with its inputs on all sampled points, "
+          "and every exact result is valid")
+
+
+if __name__ == "__main__":
+    main()
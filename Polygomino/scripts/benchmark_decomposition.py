@@ -0,0 +1,176 @@
+"""
+Benchmark convex-decomposition queries against the raw edge-scan queries.
+
+For each generator shape this script builds the Hertel-Mehlhorn convex
+decomposition and compares:
+- point containment: Polygon._scan_point_location vs the decomposition
+- polygon-vs-polygon intersection: Polygon._scan_intersects vs Polygon.intersects
+
+Results from both paths are cross-checked while timing.
+"""
+
+import random
+import sys
+import os
+import time
+
+# Add parent directory to path for geometry imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from geometry import Point, Polygon
+from scripts.generate_polygons import (
+    generate_jagged_polygon,
+    generate_comb_polygon,
+    generate_blob_polygon,
+    generate_angular_polygon,
+    generate_star_polygon,
+    generate_convex_polygon,
+)
+
+
+# Generators keyed by name; star takes the number of star points
+GENERATORS = {
+    'jagged': generate_jagged_polygon,
+    'comb': generate_comb_polygon,
+    'blob': generate_blob_polygon,
+    'angular': generate_angular_polygon,
+    'star': lambda n: generate_star_polygon(max(3, n // 2)),
+    'convex': generate_convex_polygon,
+}
+
+
+def generate_simple_shapes(generator, num_vertices: int, count: int,
+                           max_attempts: int = 2000) -> list:
+    """
+    Generate simple polygons from one generator.
+    
+    Args:
+        generator: Function taking a vertex count and returning a Polygon.
+        num_vertices: Target number of vertices.
+        count: Number of polygons wanted.
+        max_attempts: Give up after this many generator calls.
+    
+    Returns:
+        List of simple Polygon objects (may be shorter than count).
+    """
+    shapes = []
+    for _ in range(max_attempts):
+        if len(shapes) >= count:
+            break
+        polygon = generator(num_vertices)
+        if polygon.is_simple():
+            shapes.append(polygon)
+    return shapes
+
+
+def time_per_call(func, args_list: list) -> tuple:
+    """
+    Time a function over a list of argument tuples.
+    
+    Returns:
+        Tuple (microseconds per call, list of results).
+    """
+    start = time.perf_counter()
+    results = [func(*args) for args in args_list]
+    elapsed = time.perf_counter() - start
+    return elapsed * 1e6 / max(1, len(args_list)), results
+
+
+def benchmark_generator(name: str, num_vertices: int, num_shapes: int,
+                        num_points: int, num_pairs: int) -> dict:
+    """
+    Benchmark raw and decomposed queries for one generator and vertex count.
+    
+    Returns:
+        Dictionary of timing and agreement statistics.
+    """
+    shapes = generate_simple_shapes(GENERATORS[name], num_vertices, num_shapes)
+    if not shapes:
+        return None
+    
+    # Build decompositions up front (this is the cached, one-off cost)
+    start = time.perf_counter()
+    for polygon in shapes:
+        polygon.convex_decomposition()
+    build_ms = (time.perf_counter() - start) * 1e3 / len(shapes)
+    
+    point_queries = []
+    for polygon in shapes:
+        for _ in range(num_points):
+            point = Point(random.randint(-100, 100), random.randint(-100, 100))
+            point_queries.append((polygon, point))
+    
+    raw_point_us, raw_locations = time_per_call(
+        lambda poly, pt: poly._scan_point_location(pt), point_queries)
+    fast_point_us, fast_locations = time_per_call(
+        lambda poly, pt: poly.convex_decomposition().point_location(pt),
+        point_queries)
+    point_mismatches = sum(1 for a, b in zip(raw_locations, fast_locations)
+                           if a != b)
+    
+    pair_queries = []
+    for _ in range(num_pairs):
+        first, second = random.choice(shapes), random.choice(shapes)
+        dx, dy = random.randint(-120, 120), random.randint(-120, 120)
+        moved = Polygon([Point(v.x + dx, v.y + dy) for v in second.vertices])
+        moved.convex_decomposition()
+        pair_queries.append((first, moved))
+    
+    raw_pair_us, raw_hits = time_per_call(
+        lambda a, b: a._scan_intersects(b), pair_queries)
+    fast_pair_us, fast_hits = time_per_call(
+        lambda a, b: a.intersects(b), pair_queries)
+    pair_mismatches = sum(1 for a, b in zip(raw_hits, fast_hits) if a != b)
+    
+    return {
+        'name': name,
+        'shapes': len(shapes),
+        'avg_vertices': sum(p.num_vertices for p in shapes) / len(shapes),
+        'avg_parts': sum(len(p.convex_parts()) for p in shapes) / len(shapes),
+        'build_ms': build_ms,
+        'raw_point_us': raw_point_us,
+        'fast_point_us': fast_point_us,
+        'point_mismatches': point_mismatches,
+        'raw_pair_us': raw_pair_us,
+        'fast_pair_us': fast_pair_us,
+        'pair_mismatches': pair_mismatches,
+    }
+
+
+def main():
+    """Main entry point for the decomposition benchmark."""
+    random.seed(12345)
+    vertex_counts = [10, 25, 50]
+    
+    print("Convex decomposition benchmark (times per query)")
+    print("-" * 100)
+    print(f"{'shape':<9}{'verts':>7}{'parts':>7}{'build ms':>10}"
+          f"{'point raw':>12}{'point dec':>12}{'speedup':>9}"
+          f"{'pair raw':>12}{'pair dec':>12}{'speedup':>9}")
+    print("-" * 100)
+    
+    mismatches = 0
+    for num_vertices in vertex_counts:
+        for name in GENERATORS:
+            stats = benchmark_generator(name, num_vertices, num_shapes=20,
+                                        num_points=200, num_pairs=300)
+            if stats is None:
+                print(f"{name:<9}{num_vertices:>7}  (no simple shapes generated)")
+                continue
+            mismatches += stats['point_mismatches'] + stats['pair_mismatches']
+            print(f"{name:<9}{stats['avg_vertices']:>7.1f}{stats['avg_parts']:>7.1f}"
+                  f"{stats['build_ms']:>10.2f}"
+                  f"{stats['raw_point_us']:>10.1f}us{stats['fast_point_us']:>10.1f}us"
+                  f"{stats['raw_point_us'] / stats['fast_point_us']:>8.1f}x"
+                  f"{stats['raw_pair_us']:>10.1f}us{stats['fast_pair_us']:>10.1f}us"
+                  f"{stats['raw_pair_us'] / stats['fast_pair_us']:>8.1f}x")
+    
+    print("-" * 100)
+    if mismatches:
+        print(f"⚠️ {mismatches} result(s) differ between raw and decomposed queries")
+        sys.exit(1)
+    print("✅ Raw and decomposed queries agree on every test")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+"""
+Benchmark queries on simplified polygons against the original polygons.
+
+For each generator shape this script simplifies the polygons with
+Polygon.simplify and compares point_location and is_simple timings
+before and after:
+- exact: repeated and collinear vertices removed (boundary unchanged)
+- lossy: Douglas-Peucker with a 1 unit tolerance
+
+Exact simplification must give identical results; for the lossy variant
+the share of test points whose classification changes is reported.
+"""
+
+import random
+import sys
+import os
+
+# Add parent directory to path for geometry imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from geometry import Point
+from scripts.benchmark_decomposition import (
+    GENERATORS,
+    generate_simple_shapes,
+    time_per_call,
+)
+
+
+# Timings keep the best of this many runs to reduce noise
+REPEATS = 3
+
+# Simplification variants: name -> (tolerance, method)
+VARIANTS = {
+    'exact': (0.0, 'douglas_peucker'),
+    'lossy': (1.0, 'douglas_peucker'),
+}
+
+
+def best_time_per_call(func, args_list: list) -> tuple:
+    """
+    Time a function over a list of argument tuples, keeping the best run.
+    
+    Returns:
+        Tuple (microseconds per call, list of results).
+    """
+    runs = [time_per_call(func, args_list) for _ in range(REPEATS)]
+    return min(run[0] for run in runs), runs[0][1]
+
+
+def benchmark_generator(name: str, num_vertices: int, num_shapes: int,
+                        num_points: int, tolerance: float, method: str) -> dict:
+    """
+    Benchmark queries on original and simplified polygons for one generator.
+    
+    Returns:
+        Dictionary of vertex counts, timings and agreement statistics.
+    """
+    shapes = generate_simple_shapes(GENERATORS[name], num_vertices, num_shapes)
+    if not shapes:
+        return None
+    simplified = [polygon.simplify(tolerance, method)[0] for polygon in shapes]
+    
+    point_queries = []
+    for original, reduced in zip(shapes, simplified):
+        for _ in range(num_points):
+            point = Point(random.randint(-100, 100), random.randint(-100, 100))
+            point_queries.append((original, reduced, point))
+    
+    raw_point_us, raw_locations = best_time_per_call(
+        lambda poly, _, pt: poly.point_location(pt), point_queries)
+    fast_point_us, fast_locations = best_time_per_call(
+        lambda _, poly, pt: poly.point_location(pt), point_queries)
+    changed = sum(1 for a, b in zip(raw_locations, fast_locations) if a != b)
+    
+    raw_simple_us, _ = best_time_per_call(
+        lambda poly: poly.is_simple(), [(p,) for p in shapes])
+    fast_simple_us, still_simple = best_time_per_call(
+        lambda poly: poly.is_simple(), [(p,) for p in simplified])
+    
+    return {
+        'name': name,
+        'vertices': sum(p.num_vertices for p in shapes) / len(shapes),
+        'simplified': sum(p.num_vertices for p in simplified) / len(shapes),
+        'raw_point_us': raw_point_us,
+        'fast_point_us': fast_point_us,
+        'changed': changed / len(point_queries),
+        'raw_simple_us': raw_simple_us,
+        'fast_simple_us': fast_simple_us,
+        'not_simple': still_simple.count(False),
+    }
+
+
+def main():
+    """Main entry point for the simplification benchmark."""
+    random.seed(12345)
+    vertex_counts = [25, 50]
+    
+    failures = 0
+    for variant, (tolerance, method) in VARIANTS.items():
+        print(f"\nSimplification benchmark: {variant} "
+              f"({method}, tolerance {tolerance})")
+        print("-" * 104)
+        print(f"{'shape':<9}{'verts':>7}{'kept':>7}"
+              f"{'locate raw':>12}{'locate simp':>13}{'speedup':>9}"
+              f"{'simple raw':>12}{'simple simp':>13}{'speedup':>9}"
+              f"{'changed':>9}{'broken':>8}")
+        print("-" * 104)
+        
+        for num_vertices in vertex_counts:
+            for name in GENERATORS:
+                stats = benchmark_generator(name, num_vertices, num_shapes=20,
+                                            num_points=200, tolerance=tolerance,
+                                            method=method)
+                if stats is None:
+                    print(f"{name:<9}{num_vertices:>7}  (no simple shapes generated)")
+                    continue
+                if tolerance == 0 and (stats['changed'] or stats['not_simple']):
+                    failures += 1
+                print(f"{name:<9}{stats['vertices']:>7.1f}{stats['simplified']:>7.1f}"
+                      f"{stats['raw_point_us']:>10.1f}us{stats['fast_point_us']:>11.1f}us"
+                      f"{stats['raw_point_us'] / stats['fast_point_us']:>8.1f}x"
+                      f"{stats['raw_simple_us']:>10.1f}us{stats['fast_simple_us']:>11.1f}us"
+                      f"{stats['raw_simple_us'] / stats['fast_simple_us']:>8.1f}x"
+                      f"{stats['changed']:>8.1%}{stats['not_simple']:>8}")
+        print("-" * 104)
+    
+    if failures:
+        print(f"⚠️ Exact simplification changed results for {failures} generator(s)")
+        sys.exit(1)
+    print("✅ Exact simplification preserves every query result")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""
+Find the polygons of a dataset most similar in shape to a given one.
+
+Every polygon is described by rotation-, scale- and translation-invariant
+shape descriptors (turning function, Fourier descriptors of the boundary
+and Hu moment invariants, see geometry/descriptors.py), reduced to its
+principal components and stored in a KD-tree. The first run computes the
+descriptors into a SQLite sidecar (polygons.json.shapes.sqlite, see
+game/shape_index.py); later runs only read the stored vectors, and a
+query searches the tree instead of comparing the polygon with every
+other one.
+
+Usage:
+    python scripts/find_similar.py ID [dataset] [--count N]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+# Add parent directory to path for geometry imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from game.shape_index import open_shape_index
+
+
+def main():
+    """Main entry point for the similar polygon search."""
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    parent_dir = os.path.dirname(script_dir)
+    
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('id', type=int, help="id of the polygon to match")
+    parser.add_argument('dataset', nargs='?',
+                        default=os.path.join(parent_dir, 'polygons.json'),
+                        help="polygon dataset (default: polygons.json)")
+    parser.add_argument('--count', type=int, default=20,
+                        help="number of similar polygons to list")
+    args = parser.parse_args()
+    if args.count <= 0:
+        parser.error("--count must be positive")
+    
+    if not os.path.exists(args.dataset):
+        print(f"Error: Could not find {args.dataset}")
+        print("Run scripts/generate_polygons.py first to create the dataset.")
+        sys.exit(1)
+    
+    start = time.perf_counter()
+    index = open_shape_index(args.dataset)
+    opened = time.perf_counter() - start
+    if args.id not in index.positions:
+        print(f"Error: No polygon with id {args.id} in {args.dataset}")
+        sys.exit(1)
+    
+    start = time.perf_counter()
+    results = index.similar(args.id, args.count)
+    elapsed = time.perf_counter() - start
+    
+    print(f"Polygons most similar to polygon {args.id}")
+    print("-" * 30)
+    print(f"{'rank':>5}{'id':>10}{'distance':>15}")
+    for rank, (polygon_id, distance) in enumerate(results, 1):
+        print(f"{rank:>5}{polygon_id:>10}{distance:>15.3f}")
+    print("-" * 30)
+    print(f"Opened the index of {len(index)} polygons in {opened:.2f}s, "
+          f"query took {elapsed * 1e3:.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,509 @@
+"""
+Differential fuzzing of the accelerated geometry paths against the reference ones.
+
+Every accelerated engine must give exactly the answers of the plain O(n)
+and O(n^2) scans it replaces. This script generates seeded random cases
+from the generator shapes plus degenerate ones (extra collinear vertices,
+vertices pushed onto other edges, coordinates clamped to the dataset
+box), runs the reference and every available backend on each case, and
+reports throughput per backend. The first mismatch of each backend is
+shrunk to a minimal repro by greedily dropping vertices, points and
+segments and moving coordinates towards the origin while it still fails.
+
+Checks:
+- point_location: Polygon._scan_point_location vs the convex/dispatching
+  Polygon.point_location, the convex decomposition, ring locators of
+  PolygonWithHoles and the classify_grid raster, at tolerances from 0 to
+  5 on simple and self-crossing rings
+- is_simple: Polygon._scan_is_simple vs Polygon.is_simple and the
+  Bentley-Ottmann sweep
+- segments: all-pairs Segment.intersects (and, in proper mode,
+  intersects(proper=True) or overlaps) vs find_intersections
+- contains: Polygon._scan_point_location vs Polygon.contains_point, on
+  simple and self-crossing rings
+- intersects: Polygon._scan_intersects vs Polygon.intersects
+
+Usage:
+    python scripts/fuzz_geometry.py [--seed N] [--cases N] [--check NAME]
+        [--no-shrink]
+"""
+
+import argparse
+import random
+import sys
+import os
+import time
+
+# Add parent directory to path for geometry imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from geometry import (Point, Polygon, Segment, ConvexDecomposition,
+                      PolygonWithHoles, classify_grid, find_intersections)
+from scripts.generate_polygons import (
+    COORD_MIN,
+    COORD_MAX,
+    generate_jagged_polygon,
+    generate_comb_polygon,
+    generate_blob_polygon,
+    generate_angular_polygon,
+    generate_star_polygon,
+    generate_convex_polygon,
+    find_integer_point_on_edge,
+)
+
+
+def add_collinear_vertices(polygon: Polygon) -> Polygon:
+    """Insert extra vertices at integer points in the middle of some edges."""
+    vertices = []
+    for edge in polygon.get_edges():
+        vertices.append(edge.p1)
+        if random.random() < 0.5:
+            point = find_integer_point_on_edge(edge)
+            if point is not None and Segment._ccw(edge.p1, edge.p2, point) == 0:
+                vertices.append(point)
+    return Polygon(vertices)
+
+
+def touch_vertex_to_edge(polygon: Polygon) -> Polygon:
+    """Move one vertex onto an integer point of a non-adjacent edge."""
+    n = polygon.num_vertices
+    vertices = list(polygon.vertices)
+    i = random.randrange(n)
+    edges = [e for k, e in enumerate(polygon.get_edges())
+             if k != i and (k + 1) % n != i and (i + 1) % n != k]
+    if edges:
+        point = find_integer_point_on_edge(random.choice(edges))
+        if point is not None:
+            vertices[i] = point
+    return Polygon(vertices)
+
+
+def reverse_vertex_run(polygon: Polygon) -> Polygon:
+    """Reverse a run of vertices, which usually makes edges cross."""
+    vertices = list(polygon.vertices)
+    i, j = sorted(random.sample(range(len(vertices) + 1), 2))
+    vertices[i:j] = vertices[i:j][::-1]
+    return Polygon(vertices)
+
+
+def generate_clamped_polygon(num_vertices: int) -> Polygon:
+    """Generate a convex polygon that overflows the box, clamped back into it."""
+    center = Point(random.randint(-60, 60), random.randint(-60, 60))
+    polygon = generate_convex_polygon(num_vertices, center, radius=random.randint(90, 160))
+    return Polygon([Point(max(COORD_MIN, min(COORD_MAX, v.x)),
+                          max(COORD_MIN, min(COORD_MAX, v.y)))
+                    for v in polygon.vertices])
+
+
+# Generators keyed by name; star takes the number of star points
+GENERATORS = {
+    'jagged': generate_jagged_polygon,
+    'comb': generate_comb_polygon,
+    'blob': generate_blob_polygon,
+    'angular': generate_angular_polygon,
+    'star': lambda n: generate_star_polygon(max(3, n // 2)),
+    'convex': generate_convex_polygon,
+    'collinear': lambda n: add_collinear_vertices(
+        random.choice([generate_convex_polygon, generate_comb_polygon,
+                       generate_angular_polygon])(n)),
+    'touching': lambda n: touch_vertex_to_edge(generate_jagged_polygon(n)),
+    'clamped': generate_clamped_polygon,
+    'crossing': lambda n: reverse_vertex_run(
+        random.choice([generate_convex_polygon, generate_jagged_polygon])(n)),
+}
+
+
+def random_ring(simple: bool = True, max_attempts: int = 100) -> list:
+    """
+    Generate a ring of integer vertices from a random generator.
+    
+    Args:
+        simple: Only return simple rings.
+        max_attempts: Generator calls before falling back to a triangle.
+    
+    Returns:
+        List of (x, y) tuples.
+    """
+    for _ in range(max_attempts):
+        name = random.choice(list(GENERATORS))
+        polygon = GENERATORS[name](random.randint(6, 30))
+        ring = [(int(round(v.x)), int(round(v.y))) for v in polygon.vertices]
+        if not simple or to_polygon(ring)._scan_is_simple():
+            return ring
+    return [(0, 0), (10, 0), (0, 10)]
+
+
+def to_polygon(ring: list) -> Polygon:
+    """Build a fresh Polygon (with empty caches) from (x, y) tuples."""
+    return Polygon([Point(x, y) for x, y in ring])
+
+
+def probe_points(ring: list, count: int) -> list:
+    """
+    Pick points that stress a point locator, plus random ones.
+    
+    Includes the vertices and their eight neighbours, integer points on
+    edges, points level with each vertex (where the crossing ray passes
+    through it) and random points in the padded bounding box.
+    """
+    polygon = to_polygon(ring)
+    points = set()
+    for x, y in ring:
+        points.update((x + dx, y + dy) for dx in (-1, 0, 1) for dy in (-1, 0, 1))
+        points.add((x - random.randint(2, 40), y))
+    for edge in polygon.get_edges():
+        point = find_integer_point_on_edge(edge)
+        if point is not None:
+            points.add((point.x, point.y))
+    min_x, min_y, max_x, max_y = polygon.bounding_box()
+    for _ in range(count):
+        points.add((random.randint(int(min_x) - 5, int(max_x) + 5),
+                    random.randint(int(min_y) - 5, int(max_y) + 5)))
+    points = sorted(points)
+    random.shuffle(points)
+    return points
+
+
+def random_segments(count: int, extent: int) -> list:
+    """Generate segments with small coordinates, so many touch or overlap."""
+    segments = []
+    for _ in range(count):
+        a = (random.randint(-extent, extent), random.randint(-extent, extent))
+        if random.random() < 0.3:
+            # Collinear with a previous segment, possibly overlapping it
+            if segments:
+                (x1, y1), (x2, y2) = random.choice(segments)
+                k = random.randint(-2, 2)
+                a = (x1 + k * (x2 - x1), y1 + k * (y2 - y1))
+                segments.append((a, (a[0] + x2 - x1, a[1] + y2 - y1)))
+                continue
+        b = (random.randint(-extent, extent), random.randint(-extent, extent))
+        segments.append((a, b))
+    return segments
+
+
+def _as_segments(pairs: list) -> list:
+    return [Segment(Point(*a), Point(*b)) for a, b in pairs]
+
+
+def _reference_pairs(pairs: list, proper: bool) -> list:
+    """All-pairs reference for find_intersections."""
+    segments = _as_segments(pairs)
+    result = []
+    for i in range(len(segments)):
+        for j in range(i + 1, len(segments)):
+            a, b = segments[i], segments[j]
+            hit = (a.intersects(b, proper=True) or a.overlaps(b)) if proper else a.intersects(b)
+            if hit:
+                result.append((i, j))
+    return result
+
+
+def _locate_all(locator, points: list, tolerance: float) -> list:
+    """Classify points with one locator, built once for all of them."""
+    return [locator.point_location(Point(x, y), tolerance) for x, y in points]
+
+
+def _raster_locations(ring: list, points: list, tolerance: float) -> list:
+    """Classify points from one classify_grid raster of their bounding box."""
+    xs = [x for x, _ in points]
+    ys = [y for _, y in points]
+    min_x, min_y = min(xs), min(ys)
+    rows = classify_grid(to_polygon(ring), min_x, min_y, max(xs), max(ys), tolerance)
+    return [rows[y - min_y][x - min_x] for x, y in points]
+
+
+def _step_towards_zero(value: int) -> int:
+    return value - (value > 0) + (value < 0)
+
+
+def _coordinate_variants(coordinates: list):
+    """Yield copies of a list of (x, y) tuples with one coordinate nearer 0."""
+    for i, (x, y) in enumerate(coordinates):
+        for moved in ((_step_towards_zero(x), y), (x, _step_towards_zero(y))):
+            if moved != (x, y):
+                yield coordinates[:i] + [moved] + coordinates[i + 1:]
+
+
+def _ring_variants(ring: list):
+    """Yield smaller rings: one vertex fewer, or one coordinate nearer 0."""
+    if len(ring) > 3:
+        for i in range(len(ring)):
+            yield ring[:i] + ring[i + 1:]
+    yield from _coordinate_variants(ring)
+
+
+def _halved(coordinates: list) -> list:
+    return [(int(x / 2), int(y / 2)) for x, y in coordinates]
+
+
+def _translated(coordinates: list, dx: int, dy: int) -> list:
+    return [(x + dx, y + dy) for x, y in coordinates]
+
+
+def _point_case_variants(case: tuple):
+    ring, points, tolerance = case
+    if len(points) > 1:
+        for point in points:
+            yield ring, [point], tolerance
+    # Move the first point to the origin, then shrink the scale
+    dx, dy = -points[0][0], -points[0][1]
+    yield _translated(ring, dx, dy), _translated(points, dx, dy), tolerance
+    yield _halved(ring), _halved(points), tolerance
+    for smaller in _ring_variants(ring):
+        yield smaller, points, tolerance
+    for moved in _coordinate_variants(points):
+        yield ring, moved, tolerance
+
+
+def _segment_case_variants(case: tuple):
+    pairs, proper = case
+    flat = [end for pair in pairs for end in pair]
+    if len(pairs) > 2:
+        for i in range(len(pairs)):
+            yield pairs[:i] + pairs[i + 1:], proper
+    yield list(zip(_halved(flat)[::2], _halved(flat)[1::2])), proper
+    for moved in _coordinate_variants(flat):
+        yield list(zip(moved[::2], moved[1::2])), proper
+
+
+def _pair_case_variants(case: tuple):
+    first, second = case
+    dx, dy = -first[0][0], -first[0][1]
+    yield _translated(first, dx, dy), _translated(second, dx, dy)
+    yield _halved(first), _halved(second)
+    for smaller in _ring_variants(first):
+        yield smaller, second
+    for smaller in _ring_variants(second):
+        yield first, smaller
+
+
+def _make_point_case() -> tuple:
+    ring = random_ring(simple=random.random() < 0.7)
+    return ring, probe_points(ring, 40), random.choice([0.5, 0.5, 0, 1, 2, 5])
+
+
+def _make_contains_case() -> tuple:
+    ring = random_ring(simple=random.random() < 0.5)
+    return ring, probe_points(ring, 40)
+
+
+def _contains_case_variants(case: tuple):
+    ring, points = case
+    for smaller_ring, smaller_points, _ in _point_case_variants((ring, points, 0.5)):
+        yield smaller_ring, smaller_points
+
+
+def _make_pair_case() -> tuple:
+    first, second = random_ring(), random_ring()
+    dx, dy = random.randint(-150, 150), random.randint(-150, 150)
+    return first, [(x + dx, y + dy) for x, y in second]
+
+
+def _simple_ring(ring: list) -> bool:
+    return len(ring) >= 3 and to_polygon(ring)._scan_is_simple()
+
+
+# Each check has a case generator, the reference, the backends, the
+# number of queries a case stands for, the shrinking steps, the cases
+# that are meaningful (shrinking must not leave them) and a repro printer
+CHECKS = {
+    'point_location': {
+        'make': _make_point_case,
+        'reference': lambda ring, points, tol: [
+            to_polygon(ring)._scan_point_location(Point(*p), tol) for p in points],
+        'backends': {
+            'dispatch': lambda ring, points, tol: _locate_all(
+                to_polygon(ring), points, tol),
+            'decomposition': lambda ring, points, tol: _locate_all(
+                ConvexDecomposition(to_polygon(ring)), points, tol),
+            'rings': lambda ring, points, tol: _locate_all(
+                PolygonWithHoles(to_polygon(ring), locators=True), points, tol),
+            'raster': _raster_locations,
+        },
+        'size': lambda case: len(case[1]),
+        'variants': _point_case_variants,
+        'valid': lambda case: bool(case[1]) and len(case[0]) >= 3,
+        'repro': lambda case: [f"polygon = Polygon.from_list({[list(v) for v in case[0]]})",
+                               f"points = {case[1]}", f"tolerance = {case[2]}"],
+    },
+    'is_simple': {
+        'make': lambda: (random_ring(simple=False),),
+        'reference': lambda ring: to_polygon(ring)._scan_is_simple(),
+        'backends': {
+            'dispatch': lambda ring: to_polygon(ring).is_simple(),
+            'sweep': lambda ring: not find_intersections(to_polygon(ring).get_edges(),
+                                                         proper=True),
+        },
+        'size': lambda case: 1,
+        'variants': lambda case: ((ring,) for ring in _ring_variants(case[0])),
+        'valid': lambda case: len(case[0]) >= 3,
+        'repro': lambda case: [f"polygon = Polygon.from_list({[list(v) for v in case[0]]})"],
+    },
+    'contains': {
+        'make': _make_contains_case,
+        'reference': lambda ring, points: [
+            to_polygon(ring)._scan_point_location(Point(*p)) in ('INSIDE', 'BOUNDARY')
+            for p in points],
+        'backends': {
+            'dispatch': lambda ring, points: [
+                polygon.contains_point(Point(*p))
+                for polygon in [to_polygon(ring)] for p in points],
+        },
+        'size': lambda case: len(case[1]),
+        'variants': _contains_case_variants,
+        'valid': lambda case: bool(case[1]) and len(case[0]) >= 3,
+        'repro': lambda case: [f"polygon = Polygon.from_list({[list(v) for v in case[0]]})",
+                               f"points = {case[1]}"],
+    },
+    'segments': {
+        'make': lambda: (random_segments(random.randint(5, 40), random.choice([4, 12, 100])),
+                         random.random() < 0.5),
+        'reference': _reference_pairs,
+        'backends': {
+            'sweep': lambda pairs, proper: find_intersections(_as_segments(pairs), proper),
+        },
+        'size': lambda case: len(case[0]) * (len(case[0]) - 1) // 2,
+        'variants': _segment_case_variants,
+        'valid': lambda case: len(case[0]) >= 2,
+        'repro': lambda case: [f"segments = {case[0]}", f"proper = {case[1]}"],
+    },
+    'intersects': {
+        'make': _make_pair_case,
+        'reference': lambda first, second: to_polygon(first)._scan_intersects(
+            to_polygon(second)),
+        'backends': {
+            'decomposition': lambda first, second: to_polygon(first).intersects(
+                to_polygon(second)),
+        },
+        'size': lambda case: 1,
+        'variants': _pair_case_variants,
+        'valid': lambda case: _simple_ring(case[0]) and _simple_ring(case[1]),
+        'repro': lambda case: [f"first = Polygon.from_list({[list(v) for v in case[0]]})",
+                               f"second = Polygon.from_list({[list(v) for v in case[1]]})"],
+    },
+}
+
+
+def run_backend(backend, case: tuple):
+    """Run a backend on a case; None if it does not apply (ValueError)."""
+    try:
+        return backend(*case)
+    except ValueError:
+        return None
+
+
+def fails(check: dict, backend, case: tuple) -> bool:
+    """Check whether a backend disagrees with the reference on a case."""
+    if not check['valid'](case):
+        return False
+    result = run_backend(backend, case)
+    return result is not None and result != check['reference'](*case)
+
+
+def shrink(check: dict, backend, case: tuple, max_steps: int = 10000) -> tuple:
+    """
+    Greedily simplify a failing case while the backend still disagrees.
+    
+    Args:
+        check: The check definition from CHECKS.
+        backend: The failing backend.
+        case: A case on which it disagrees with the reference.
+        max_steps: Give up after this many accepted simplifications.
+    
+    Returns:
+        A case no single simplification step can reduce further.
+    """
+    for _ in range(max_steps):
+        for candidate in check['variants'](case):
+            if fails(check, backend, candidate):
+                case = candidate
+                break
+        else:
+            break
+    return case
+
+
+def fuzz_check(name: str, num_cases: int, shrink_failures: bool) -> dict:
+    """
+    Run one check on random cases.
+    
+    Returns:
+        Dictionary with per-backend 'queries', 'seconds', 'skipped',
+        'mismatches' and 'repro', and the reference's 'queries'/'seconds'.
+    """
+    check = CHECKS[name]
+    cases = [check['make']() for _ in range(num_cases)]
+    cases = [case for case in cases if check['valid'](case)]
+    
+    queries = sum(check['size'](case) for case in cases)
+    start = time.perf_counter()
+    expected = [check['reference'](*case) for case in cases]
+    stats = {'reference': {'queries': queries, 'seconds': time.perf_counter() - start}}
+    
+    for backend_name, backend in check['backends'].items():
+        entry = {'queries': 0, 'seconds': 0.0, 'skipped': 0, 'mismatches': 0, 'repro': None}
+        for case, reference in zip(cases, expected):
+            start = time.perf_counter()
+            result = run_backend(backend, case)
+            entry['seconds'] += time.perf_counter() - start
+            if result is None:
+                entry['skipped'] += 1
+                continue
+            entry['queries'] += check['size'](case)
+            if result != reference:
+                entry['mismatches'] += 1
+                if entry['repro'] is None:
+                    entry['repro'] = shrink(check, backend, case) if shrink_failures else case
+        stats[backend_name] = entry
+    return stats
+
+
+def main():
+    """Main entry point for the differential fuzzer."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--seed', type=int, default=12345, help="random seed")
+    parser.add_argument('--cases', type=int, default=300,
+                        help="random cases per check (default: 300)")
+    parser.add_argument('--check', action='append', choices=list(CHECKS),
+                        help="run only this check (repeatable)")
+    parser.add_argument('--no-shrink', action='store_true',
+                        help="report mismatching cases without shrinking them")
+    args = parser.parse_args()
+    
+    random.seed(args.seed)
+    print(f"Differential geometry fuzzing (seed {args.seed}, {args.cases} cases per check)")
+    print("-" * 82)
+    print(f"{'check':<16}{'backend':<15}{'queries':>10}{'us/query':>11}"
+          f"{'speedup':>10}{'skipped':>9}{'mismatches':>11}")
+    print("-" * 82)
+    
+    failures = []
+    for name in args.check or CHECKS:
+        stats = fuzz_check(name, args.cases, not args.no_shrink)
+        reference = stats.pop('reference')
+        reference_us = reference['seconds'] * 1e6 / max(1, reference['queries'])
+        print(f"{name:<16}{'reference':<15}{reference['queries']:>10}{reference_us:>11.2f}")
+        for backend_name, entry in stats.items():
+            us = entry['seconds'] * 1e6 / max(1, entry['queries'])
+            print(f"{'':<16}{backend_name:<15}{entry['queries']:>10}{us:>11.2f}"
+                  f"{reference_us / us if us else 0:>9.1f}x{entry['skipped']:>9}"
+                  f"{entry['mismatches']:>11}")
+            if entry['repro'] is not None:
+                failures.append((name, backend_name, entry['repro']))
+    print("-" * 82)
+    
+    if failures:
+        for name, backend_name, case in failures:
+            check = CHECKS[name]
+            print(f"\n❌ {name} / {backend_name}, minimal repro:")
+            for line in check['repro'](case):
+                print(f"    {line}")
+            print(f"    reference: {check['reference'](*case)}")
+            print(f"    {backend_name}: {run_backend(check['backends'][backend_name], case)}")
+        sys.exit(1)
+    print("✅ Every backend agrees with the reference on every case")
+
+
+if __name__ == "__main__":
+    main()
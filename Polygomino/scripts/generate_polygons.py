@@ -6,6 +6,7 @@ with 3 to 25 vertices, along with random test points classified as
 INSIDE, OUTSIDE, or BOUNDARY.
 """
 
+import argparse
 import json
 import random
 import math
@@ -16,6 +17,7 @@ import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from geometry import Point, Polygon, Segment
+from geometry.sampling import PoissonDiskGrid, poisson_disk_sample
 
 
 # Coordinate range for all polygons
@@ -541,7 +543,229 @@ def generate_outside_point(polygon: Polygon, max_attempts: int = 50) -> Point:
     return None
 
 
-def generate_test_points_for_polygon(polygon: Polygon, max_points: int = 10) -> list:
+# Candidates sampled per wanted spread test point in each region
+SPREAD_CANDIDATE_FACTOR = 4
+
+
+def generate_spread_test_points(polygon: Polygon, num_points: int,
+                                spread: float) -> list:
+    """
+    Generate test points at least `spread` apart with Poisson-disk sampling.
+    
+    The boundary, interior and exterior band are sampled in turn, each
+    kept clear of the points already chosen, and the wanted number of
+    points is picked at random from each sample. Any subset of a
+    Poisson-disk sample keeps its spacing, so all points stay spread.
+    Each sample stops at SPREAD_CANDIDATE_FACTOR times the wanted count,
+    so a small spread does not fill the whole region.
+    
+    Args:
+        polygon: The polygon to generate points for.
+        num_points: Number of points wanted; fewer are returned if the
+                    spacing leaves no room.
+        spread: Minimum distance between any two test points.
+    
+    Returns:
+        List of dictionaries with integer point coordinates and location.
+    """
+    remaining = num_points - 1
+    targets = [('BOUNDARY', 1), ('INSIDE', remaining // 2),
+               ('OUTSIDE', remaining - remaining // 2)]
+    
+    chosen = []
+    test_points = []
+    for location, count in targets:
+        grid = PoissonDiskGrid(spread, chosen)
+        samples = poisson_disk_sample(polygon, spread, location, grid=grid,
+                                      bounds=(COORD_MIN, COORD_MIN, COORD_MAX, COORD_MAX),
+                                      integer=True,
+                                      limit=SPREAD_CANDIDATE_FACTOR * count)
+        for point in random.sample(samples, min(count, len(samples))):
+            chosen.append(point)
+            test_points.append({
+                'x': int(point.x),
+                'y': int(point.y),
+                'location': location
+            })
+    
+    random.shuffle(test_points)
+    return test_points
+
+
+# Widest gap between two crossings of a row or column that counts as narrow
+NARROW_GAP_WIDTH = 4
+
+# Lattice points sampled from each side of each edge
+EDGE_OFFSET_SAMPLES = 3
+
+
+def _extended_gcd(a: int, b: int) -> tuple:
+    """Get (g, s, t) with s * a + t * b == g == gcd(a, b)."""
+    if b == 0:
+        return (abs(a), 1 if a >= 0 else -1, 0)
+    g, s, t = _extended_gcd(b, a % b)
+    return (g, t, s - (a // b) * t)
+
+
+def edge_lattice_points(edge: Segment, offset: int = 0) -> list:
+    """
+    Enumerate lattice points on an integer edge or on a line beside it.
+    
+    For an edge with direction (dx, dy) = g * (a, b), the lattice points
+    on its line are p1 + k * (a, b), and the parallel lines through
+    lattice points have cross((a, b), point - p1) = c for every integer c.
+    The lines c = +1 and c = -1 hold the lattice points nearest to the
+    edge without being on it; one point of each is found with the
+    extended Euclidean algorithm, so no candidate is rejected.
+    
+    Args:
+        edge: A segment with integer endpoints.
+        offset: The line to enumerate: 0 for the edge itself, +1 or -1
+                for the nearest line on the left or right.
+    
+    Returns:
+        List of (x, y) tuples whose projection lies within the edge,
+        or an empty list if the endpoints are not integers.
+    """
+    x1, y1, x2, y2 = edge.p1.x, edge.p1.y, edge.p2.x, edge.p2.y
+    if any(c != int(c) for c in (x1, y1, x2, y2)) or (x1, y1) == (x2, y2):
+        return []
+    x1, y1, x2, y2 = int(x1), int(y1), int(x2), int(y2)
+    g, _, _ = _extended_gcd(x2 - x1, y2 - y1)
+    a, b = (x2 - x1) // g, (y2 - y1) // g
+    
+    # a * v - b * u == 1, so (u, v) is a step onto the line c = +1
+    _, s, t = _extended_gcd(a, b)
+    u, v = -t * offset, s * offset
+    
+    # Shift along the edge so the projection runs over [0, g]
+    shift = -((u * a + v * b) // (a * a + b * b))
+    points = []
+    for k in range(shift, shift + g + 1):
+        x, y = x1 + u + k * a, y1 + v + k * b
+        projection = (x - x1) * a + (y - y1) * b
+        if 0 <= projection <= g * (a * a + b * b):
+            points.append((x, y))
+    return points
+
+
+def _scanline_crossings(vertices: list, level: int) -> list:
+    """
+    Get the sorted x values where a horizontal line crosses a ring.
+    
+    Uses the half-open crossing rule of Polygon.point_location, so a line
+    through a vertex counts it once, or not at all at a local extreme.
+    """
+    crossings = []
+    n = len(vertices)
+    for i in range(n):
+        (x1, y1), (x2, y2) = vertices[i], vertices[(i + 1) % n]
+        if (y1 > level) != (y2 > level):
+            crossings.append(x1 + (level - y1) * (x2 - x1) / (y2 - y1))
+    crossings.sort()
+    return crossings
+
+
+def _narrow_gap_points(vertices: list, low: int, high: int) -> list:
+    """
+    Find lattice points between two close crossings of a scanline.
+    
+    These are the points in the thin teeth and slots of a comb, inside or
+    outside, where a classifier has the least room for error.
+    """
+    points = []
+    for level in range(low, high + 1):
+        crossings = _scanline_crossings(vertices, level)
+        for left, right in zip(crossings, crossings[1:]):
+            if right - left <= NARROW_GAP_WIDTH:
+                points.extend((x, level) for x in range(math.floor(left) + 1,
+                                                        math.ceil(right)))
+    return points
+
+
+def generate_hard_test_points(polygon: Polygon, num_points: int) -> list:
+    """
+    Generate test points on the cases that stress point classifiers.
+    
+    Candidates are enumerated directly from the edge list with lattice
+    arithmetic rather than found by rejection sampling:
+    - lattice points on an edge, and on the nearest lattice lines either
+      side of it (one unit off an axis-aligned edge)
+    - points level with a vertex and left of it, so the rightward ray of
+      ray casting passes exactly through the vertex
+    - points in narrow gaps between crossings of a row or column, such as
+      comb teeth and the slots between them
+    - the eight lattice neighbours of each vertex
+    Each candidate is labelled with polygon.point_location. Points are
+    drawn from the kinds in turn, with at least one BOUNDARY point.
+    
+    Args:
+        polygon: The polygon to generate points for.
+        num_points: Number of points wanted; fewer are returned if there
+                    are not enough distinct candidates.
+    
+    Returns:
+        List of dictionaries with integer point coordinates and location.
+    """
+    vertices = [(v.x, v.y) for v in polygon.vertices]
+    edges = polygon.get_edges()
+    min_x, min_y, max_x, max_y = (int(c) for c in polygon.bounding_box())
+    
+    on_edge = []
+    beside_edge = []
+    for edge in edges:
+        on_edge.extend(edge_lattice_points(edge))
+        for side in (1, -1):
+            line = edge_lattice_points(edge, side)
+            beside_edge.extend(random.sample(line, min(EDGE_OFFSET_SAMPLES, len(line))))
+    
+    level_with_vertex = []
+    for x, y in vertices:
+        if x != int(x) or y != int(y):
+            continue
+        # Just left of the vertex, and in each span the ray enters on its way
+        crossings = [c for c in _scanline_crossings(vertices, y) if c < x]
+        stops = [min_x - 1] + [math.floor(c) for c in crossings] + [x - 1]
+        level_with_vertex.extend((stop, int(y)) for stop in stops)
+    
+    swapped = [(y, x) for x, y in vertices]
+    narrow_gaps = (_narrow_gap_points(vertices, min_y, max_y) +
+                   [(x, y) for y, x in _narrow_gap_points(swapped, min_x, max_x)])
+    
+    near_vertex = [(int(x) + dx, int(y) + dy) for x, y in vertices
+                   for dx in (-1, 0, 1) for dy in (-1, 0, 1) if dx or dy]
+    
+    def in_range(point: tuple) -> bool:
+        return COORD_MIN <= point[0] <= COORD_MAX and COORD_MIN <= point[1] <= COORD_MAX
+    
+    pools = []
+    for pool in (beside_edge, level_with_vertex, narrow_gaps, near_vertex):
+        pool = [p for p in dict.fromkeys(pool) if in_range(p)]
+        random.shuffle(pool)
+        pools.append(pool)
+    
+    chosen = {}
+    boundary = [p for p in dict.fromkeys(on_edge) if in_range(p)]
+    if boundary:
+        chosen[random.choice(boundary)] = 'BOUNDARY'
+    
+    # Round-robin over the kinds until enough points or all are used up
+    while len(chosen) < num_points and any(pools):
+        for pool in pools:
+            while pool and len(chosen) < num_points:
+                x, y = pool.pop()
+                if (x, y) not in chosen:
+                    chosen[(x, y)] = polygon.point_location(Point(x, y))
+                    break
+    
+    test_points = [{'x': x, 'y': y, 'location': location}
+                   for (x, y), location in chosen.items()]
+    random.shuffle(test_points)
+    return test_points
+
+
+def generate_test_points_for_polygon(polygon: Polygon, max_points: int = 10,
+                                     spread: float = None, hard: bool = False) -> list:
     """
     Generate random test points for a polygon with balanced INSIDE/OUTSIDE.
     Guarantees at least one boundary point.
@@ -549,6 +773,11 @@ def generate_test_points_for_polygon(polygon: Polygon, max_points: int = 10) ->
     Args:
         polygon: The polygon to generate points for.
         max_points: Maximum number of points to generate.
+        spread: If set, keep points at least this far apart (see
+                generate_spread_test_points); otherwise points are sampled
+                independently and may clump or repeat.
+        hard: If True, pick the points from enumerated hard cases near the
+              boundary instead (see generate_hard_test_points).
     
     Returns:
         List of dictionaries with integer point coordinates and location.
@@ -556,6 +785,11 @@ def generate_test_points_for_polygon(polygon: Polygon, max_points: int = 10) ->
     # Random number of points (at least 3 for variety, up to max_points)
     num_points = random.randint(3, max_points)
     
+    if hard:
+        return generate_hard_test_points(polygon, num_points)
+    if spread is not None:
+        return generate_spread_test_points(polygon, num_points, spread)
+    
     test_points = []
     
     # First, guarantee at least one boundary point (could rarely be a vertex)
@@ -644,6 +878,26 @@ def generate_test_points_for_polygon(polygon: Polygon, max_points: int = 10) ->
     return test_points
 
 
+def simplify_polygon(polygon: Polygon, tolerance: float) -> Polygon:
+    """
+    Reduce the vertex count of a generated polygon while keeping it simple.
+    
+    Args:
+        polygon: The simple polygon to simplify.
+        tolerance: Douglas-Peucker distance tolerance; 0 only removes
+                   collinear and repeated vertices.
+    
+    Returns:
+        The simplified polygon. Falls back to exact collinear removal if
+        the lossy result is not simple.
+    """
+    exact, _ = polygon.simplify()
+    if tolerance <= 0:
+        return exact
+    simplified, _ = exact.simplify(tolerance)
+    return simplified if simplified.is_simple() else exact
+
+
 def polygon_to_dict(polygon: Polygon) -> list:
     """
     Convert a polygon to a list of vertex dictionaries.
@@ -661,7 +915,10 @@ def generate_polygon_dataset(num_polygons: int = 100,
                               min_vertices: int = 3,
                               max_vertices: int = 25,
                               max_points_per_polygon: int = 10,
-                              output_file: str = "polygons.json") -> None:
+                              output_file: str = "polygons.json",
+                              simplify_tolerance: float = None,
+                              spread: float = None,
+                              hard: bool = False) -> None:
     """
     Generate a dataset of simple polygons with test points and save to JSON.
     
@@ -671,6 +928,15 @@ def generate_polygon_dataset(num_polygons: int = 100,
         max_vertices: Maximum vertices per polygon.
         max_points_per_polygon: Maximum test points per polygon.
         output_file: Path to output JSON file.
+        simplify_tolerance: If set, simplify each polygon before generating
+                            its test points (see Polygon.simplify). 0 only
+                            removes collinear vertices; a positive value
+                            also applies Douglas-Peucker, keeping the exact
+                            result if the lossy one is not simple.
+        spread: If set, minimum distance between the test points of each
+                polygon, placed with Poisson-disk sampling.
+        hard: If True, generate hard-case test points near the boundary
+              (see generate_hard_test_points).
     """
     print(f"Generating {num_polygons} simple polygons with test points...")
     
@@ -679,7 +945,10 @@ def generate_polygon_dataset(num_polygons: int = 100,
             'num_polygons': num_polygons,
             'min_vertices': min_vertices,
             'max_vertices': max_vertices,
-            'max_points_per_polygon': max_points_per_polygon
+            'max_points_per_polygon': max_points_per_polygon,
+            'simplify_tolerance': simplify_tolerance,
+            'spread': spread,
+            'hard_cases': hard
         },
         'polygons': []
     }
@@ -690,7 +959,10 @@ def generate_polygon_dataset(num_polygons: int = 100,
     for i in range(num_polygons):
         num_vertices = random.randint(min_vertices, max_vertices)
         polygon = generate_random_simple_polygon(num_vertices)
-        test_points = generate_test_points_for_polygon(polygon, max_points_per_polygon)
+        if simplify_tolerance is not None:
+            polygon = simplify_polygon(polygon, simplify_tolerance)
+        test_points = generate_test_points_for_polygon(polygon, max_points_per_polygon,
+                                                       spread, hard)
         
         polygon_data = {
             'id': i + 1,
@@ -732,6 +1004,24 @@ def generate_polygon_dataset(num_polygons: int = 100,
 
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    points = parser.add_mutually_exclusive_group()
+    points.add_argument('--spread', type=float, default=None,
+                        help="minimum distance between the test points of a "
+                             "polygon (Poisson-disk sampling)")
+    points.add_argument('--hard', action='store_true',
+                        help="generate hard-case test points (edge-adjacent "
+                             "lattice points, rays through vertices, narrow gaps)")
+    parser.add_argument('--simplify', type=float, default=None, metavar='TOL',
+                        help="simplify each polygon before generating its test "
+                             "points: 0 removes collinear vertices only, a "
+                             "positive value also applies Douglas-Peucker")
+    args = parser.parse_args()
+    if args.spread is not None and args.spread <= 0:
+        parser.error("--spread must be positive")
+    if args.simplify is not None and args.simplify < 0:
+        parser.error("--simplify must not be negative")
+    
     # Set random seed for reproducibility (optional)
     # random.seed(42)
     
@@ -745,5 +1035,8 @@ if __name__ == "__main__":
         min_vertices=3,
         max_vertices=25,
         max_points_per_polygon=10,
-        output_file=output_path
+        output_file=output_path,
+        simplify_tolerance=args.simplify,
+        spread=args.spread,
+        hard=args.hard
     )
@@ -0,0 +1,112 @@
+"""
+Query a polygon dataset by its per-polygon stats.
+
+The first run computes vertex count, area, perimeter, convexity, holes and
+test-point counts for every polygon and stores them in a SQLite sidecar
+(polygons.json.stats.sqlite, see game/stats_index.py). Later queries read
+only that file, so filtering a large dataset takes milliseconds instead
+of a full parse and geometry pass.
+
+Ranges are written LOW:HIGH, inclusive, and either end may be left out.
+
+Usage:
+    python scripts/query_polygons.py [dataset] [--vertices 15:20]
+        [--area 5000:] [--perimeter LOW:HIGH] [--holes LOW:HIGH]
+        [--points LOW:HIGH] [--inside LOW:HIGH] [--outside LOW:HIGH]
+        [--boundary LOW:HIGH] [--convex | --non-convex]
+        [--sort COLUMN] [--desc] [--limit N] [--count]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+# Add parent directory to path for geometry imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from game.stats_index import RANGE_COLUMNS, open_stats_index, query_stats
+
+
+def parse_range(text: str) -> tuple:
+    """
+    Parse an inclusive LOW:HIGH range with optional ends.
+    
+    Args:
+        text: Range such as '15:20', '5000:' or ':300'; a single number
+              selects that exact value.
+    
+    Returns:
+        Tuple (low, high) of floats or None.
+    
+    Raises:
+        argparse.ArgumentTypeError: If the range is malformed.
+    """
+    low, separator, high = text.partition(':')
+    if not separator:
+        high = low
+    try:
+        return (float(low) if low else None, float(high) if high else None)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid range: {text}")
+
+
+def main():
+    """Main entry point for the dataset query tool."""
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    parent_dir = os.path.dirname(script_dir)
+    
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('dataset', nargs='?',
+                        default=os.path.join(parent_dir, 'polygons.json'),
+                        help="polygon dataset (default: polygons.json)")
+    for name in RANGE_COLUMNS:
+        parser.add_argument(f'--{name}', type=parse_range, metavar='LOW:HIGH',
+                            help=f"{name} range")
+    convexity = parser.add_mutually_exclusive_group()
+    convexity.add_argument('--convex', dest='convex', action='store_const', const=True,
+                           help="only convex polygons")
+    convexity.add_argument('--non-convex', dest='convex', action='store_const', const=False,
+                           help="only non-convex polygons")
+    parser.add_argument('--sort', default='position',
+                        choices=['position', 'id'] + RANGE_COLUMNS,
+                        help="column to sort by (default: dataset order)")
+    parser.add_argument('--desc', action='store_true', help="sort descending")
+    parser.add_argument('--limit', type=int, default=None, help="maximum rows")
+    parser.add_argument('--count', action='store_true',
+                        help="print only the number of matches")
+    args = parser.parse_args()
+    
+    if not os.path.exists(args.dataset):
+        print(f"Error: Could not find {args.dataset}")
+        print("Run scripts/generate_polygons.py first to create the dataset.")
+        sys.exit(1)
+    
+    start = time.perf_counter()
+    connection = open_stats_index(args.dataset)
+    opened = time.perf_counter() - start
+    
+    ranges = {name: getattr(args, name) for name in RANGE_COLUMNS
+              if getattr(args, name) is not None}
+    start = time.perf_counter()
+    rows = list(query_stats(connection, ranges, args.convex, args.sort,
+                            args.desc, args.limit))
+    elapsed = time.perf_counter() - start
+    connection.close()
+    
+    if not args.count:
+        print(f"{'id':>7}{'verts':>7}{'area':>11}{'perimeter':>11}{'convex':>8}"
+              f"{'holes':>7}{'in':>5}{'out':>5}{'edge':>6}")
+        print("-" * 67)
+        for row in rows:
+            print(f"{row['id']:>7}{row['vertices']:>7}{row['area']:>11.1f}"
+                  f"{row['perimeter']:>11.1f}{'yes' if row['convex'] else 'no':>8}"
+                  f"{row['holes']:>7}{row['inside']:>5}{row['outside']:>5}"
+                  f"{row['boundary']:>6}")
+        print("-" * 67)
+    print(f"{len(rows)} matching polygons (index opened in {opened * 1e3:.1f}ms, "
+          f"query took {elapsed * 1e3:.1f}ms)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,243 @@
+"""
+Render dataset previews without opening a window.
+
+Every polygon and its test points are drawn onto offscreen pygame
+surfaces, either as one PNG per polygon or packed into sprite sheet
+pages. Work is split into batches rendered by a pool of processes; each
+worker reads its polygons straight from the dataset through the offset
+index of game/polygon_dataset.py, so only indices cross process
+boundaries.
+
+An index.json next to the images maps polygon ids to their file (and,
+for sprite sheets, their rectangle), for use by a web gallery.
+
+Usage:
+    python scripts/render_thumbnails.py [dataset] [--output DIR]
+        [--size PIXELS] [--sheet] [--columns N] [--rows N]
+        [--workers N] [--labels]
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import sys
+import time
+
+# Add parent directory to path for geometry imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pygame
+
+from game.polygon_dataset import LazyPolygonDataset, load_polygon_offsets
+from game.polygon_viewer import (COLOR_VERTEX_OUTLINE, get_test_point_color,
+                                 get_thumbnail_transform, render_thumbnail)
+
+
+# Polygons per task when writing one file per polygon
+BATCH_SIZE = 256
+
+# Test point markers scale with the thumbnail but stay visible
+MIN_POINT_RADIUS = 2
+
+# State of each worker process, set up by init_worker
+_worker = {}
+
+
+def render_preview(surface: pygame.Surface, entry: dict,
+                   font: pygame.font.Font = None):
+    """
+    Draw a polygon and its test points filling a whole surface.
+    
+    Args:
+        surface: Opaque surface (or sprite sheet subsurface) to draw on.
+        entry: Polygon entry as returned by LazyPolygonDataset.
+        font: Font for an id label, or None for no label.
+    """
+    label = None
+    if font is not None:
+        label = font.render(str(entry['id']), True, COLOR_VERTEX_OUTLINE)
+    render_thumbnail(surface, entry['polygon'], label)
+    
+    width, height = surface.get_size()
+    scale, offset_x, offset_y = get_thumbnail_transform(width, height)
+    radius = max(MIN_POINT_RADIUS, round(min(width, height) / 48))
+    for test_point in entry['test_points']:
+        point = test_point['point']
+        center = (int((point.x + 100) * scale + offset_x),
+                  int((point.y + 100) * scale + offset_y))
+        pygame.draw.circle(surface, COLOR_VERTEX_OUTLINE, center, radius + 1)
+        pygame.draw.circle(surface, get_test_point_color(test_point['location']),
+                           center, radius)
+
+
+def init_worker(dataset_path: str, size: int, labels: bool):
+    """Open the dataset and create the drawing resources of a worker process."""
+    _worker['dataset'] = LazyPolygonDataset(dataset_path, cache_size=1)
+    _worker['size'] = size
+    _worker['font'] = None
+    if labels:
+        pygame.font.init()
+        _worker['font'] = pygame.font.Font(None, max(12, size // 6))
+
+
+def render_files(task: tuple) -> list:
+    """
+    Render a batch of polygons to one PNG file each.
+    
+    Args:
+        task: Tuple (output directory, start index, end index).
+    
+    Returns:
+        index.json entries for the batch.
+    """
+    output_dir, start, end = task
+    dataset, size = _worker['dataset'], _worker['size']
+    surface = pygame.Surface((size, size))
+    
+    entries = []
+    for index in range(start, end):
+        entry = dataset[index]
+        render_preview(surface, entry, _worker['font'])
+        filename = f"polygon_{entry['id']:06d}.png"
+        pygame.image.save(surface, os.path.join(output_dir, filename))
+        entries.append({'id': entry['id'], 'file': filename})
+    return entries
+
+
+def render_sheet(task: tuple) -> list:
+    """
+    Render one sprite sheet page, filled row by row.
+    
+    Args:
+        task: Tuple (output directory, page number, start index, end index,
+              columns, rows).
+    
+    Returns:
+        index.json entries with each polygon's rectangle on the page.
+    """
+    output_dir, page, start, end, columns, rows = task
+    dataset, size = _worker['dataset'], _worker['size']
+    used_rows = min(rows, (end - start + columns - 1) // columns)
+    sheet = pygame.Surface((columns * size, used_rows * size))
+    sheet.fill((0, 0, 0))
+    filename = f"sheet_{page:04d}.png"
+    
+    entries = []
+    for slot, index in enumerate(range(start, end)):
+        entry = dataset[index]
+        rect = pygame.Rect((slot % columns) * size, (slot // columns) * size,
+                           size, size)
+        render_preview(sheet.subsurface(rect), entry, _worker['font'])
+        entries.append({'id': entry['id'], 'file': filename, 'rect': list(rect)})
+    
+    pygame.image.save(sheet, os.path.join(output_dir, filename))
+    return entries
+
+
+def render_dataset(dataset_path: str, output_dir: str, size: int = 96,
+                   sheet: bool = False, columns: int = 32, rows: int = 32,
+                   workers: int = None, labels: bool = False,
+                   verbose: bool = True) -> dict:
+    """
+    Render previews of every polygon in a dataset.
+    
+    Args:
+        dataset_path: Path to the JSON dataset.
+        output_dir: Directory for the images and index.json (created if needed).
+        size: Width and height of each preview in pixels.
+        sheet: If True, pack previews into sprite sheet pages of
+               columns x rows; otherwise write one PNG per polygon.
+        columns: Previews per sprite sheet row.
+        rows: Rows per sprite sheet page.
+        workers: Number of processes (default: CPU count).
+        labels: If True, draw each polygon's id in its preview.
+        verbose: If True, print progress.
+    
+    Returns:
+        The index written to index.json.
+    
+    Raises:
+        ValueError: If size, columns or rows is not positive.
+    """
+    if size <= 0 or columns <= 0 or rows <= 0:
+        raise ValueError("size, columns and rows must be positive")
+    
+    # Build the offset index once, before the workers read it
+    count = len(load_polygon_offsets(dataset_path))
+    os.makedirs(output_dir, exist_ok=True)
+    
+    if sheet:
+        per_page = columns * rows
+        tasks = [(output_dir, page, start, min(start + per_page, count),
+                  columns, rows)
+                 for page, start in enumerate(range(0, count, per_page))]
+        render = render_sheet
+    else:
+        tasks = [(output_dir, start, min(start + BATCH_SIZE, count))
+                 for start in range(0, count, BATCH_SIZE)]
+        render = render_files
+    
+    start_time = time.time()
+    entries = []
+    with multiprocessing.Pool(workers, initializer=init_worker,
+                              initargs=(dataset_path, size, labels)) as pool:
+        for batch in pool.imap_unordered(render, tasks):
+            entries.extend(batch)
+            if verbose:
+                print(f"  Rendered {len(entries)}/{count} polygons", end='\r')
+    elapsed = time.time() - start_time
+    
+    entries.sort(key=lambda e: e['id'])
+    index = {
+        'dataset': os.path.abspath(dataset_path),
+        'size': size,
+        'mode': 'sheet' if sheet else 'files',
+        'polygons': entries,
+    }
+    with open(os.path.join(output_dir, 'index.json'), 'w') as f:
+        json.dump(index, f)
+    
+    if verbose:
+        print(f"\n✅ Rendered {count} polygons to {output_dir} in {elapsed:.1f}s "
+              f"({count / max(elapsed, 1e-9):.0f} per second)")
+    return index
+
+
+def main():
+    """Main entry point for the thumbnail renderer."""
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    parent_dir = os.path.dirname(script_dir)
+    
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('dataset', nargs='?',
+                        default=os.path.join(parent_dir, 'polygons.json'),
+                        help="polygon dataset (default: polygons.json)")
+    parser.add_argument('--output', default=os.path.join(parent_dir, 'thumbnails'),
+                        help="output directory (default: thumbnails/)")
+    parser.add_argument('--size', type=int, default=96,
+                        help="preview width and height in pixels")
+    parser.add_argument('--sheet', action='store_true',
+                        help="pack previews into sprite sheet pages")
+    parser.add_argument('--columns', type=int, default=32,
+                        help="previews per sprite sheet row")
+    parser.add_argument('--rows', type=int, default=32,
+                        help="rows per sprite sheet page")
+    parser.add_argument('--workers', type=int, default=None,
+                        help="worker processes (default: CPU count)")
+    parser.add_argument('--labels', action='store_true',
+                        help="draw polygon ids on the previews")
+    args = parser.parse_args()
+    
+    if not os.path.exists(args.dataset):
+        print(f"Error: Could not find {args.dataset}")
+        print("Run scripts/generate_polygons.py first to create the dataset.")
+        sys.exit(1)
+    
+    render_dataset(args.dataset, args.output, size=args.size, sheet=args.sheet,
+                   columns=args.columns, rows=args.rows, workers=args.workers,
+                   labels=args.labels)
+
+
+if __name__ == "__main__":
+    main()
@@ -3,6 +3,8 @@ Validate the polygon JSON dataset.
 
 This script reads the polygon dataset and verifies that:
 - Each polygon is simple (no self-intersecting edges)
+- Holes, if any, are simple, lie inside the outer boundary, outside each
+  other, and rings do not cross or share an edge
 - Each test point has the correct location classification
 - Each polygon has at least one edge point
 """
@@ -14,7 +16,7 @@ import os
 # Add parent directory to path for geometry imports
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from geometry import Polygon, Point
+from geometry import Polygon, PolygonWithHoles, Point, find_intersections
 
 
 def validate_polygon(polygon_data: dict, verbose: bool = True) -> dict:
@@ -51,14 +53,18 @@ def validate_polygon(polygon_data: dict, verbose: bool = True) -> dict:
         coords = [[v['x'], v['y']] for v in vertices]
         polygon = Polygon.from_list(coords)
         
-        # Check for overlapping edges
+        # Holes are optional lists of vertices like the outer boundary
+        holes = [Polygon.from_list([[v['x'], v['y']] for v in hole])
+                 for hole in polygon_data.get('holes', [])]
+        region = PolygonWithHoles(polygon, holes) if holes else polygon
+        
+        # Check for overlapping edges; the sweep reports every touching pair
         edges = polygon.get_edges()
         has_overlaps = False
-        for i in range(len(edges)):
-            for j in range(i + 1, len(edges)):
-                if edges[i].overlaps(edges[j]):
-                    result['errors'].append(f"Edges {i} and {j} overlap (lie on top of each other)")
-                    has_overlaps = True
+        for i, j in find_intersections(edges):
+            if edges[i].overlaps(edges[j]):
+                result['errors'].append(f"Edges {i} and {j} overlap (lie on top of each other)")
+                has_overlaps = True
         
         if has_overlaps:
             result['valid'] = False
@@ -68,6 +74,14 @@ def validate_polygon(polygon_data: dict, verbose: bool = True) -> dict:
             result['errors'].append("Polygon is not simple (has self-intersecting or overlapping edges)")
             result['valid'] = False
         
+        # Check the holes: simple, nested in the outer ring, rings disjoint
+        # (the outer ring's own simplicity was reported above)
+        if holes:
+            for error in region.validation_errors():
+                if error != "Outer ring is not simple":
+                    result['errors'].append(error)
+                    result['valid'] = False
+        
         # Validate test points
         test_points = polygon_data.get('test_points', [])
         
@@ -85,7 +99,7 @@ def validate_polygon(polygon_data: dict, verbose: bool = True) -> dict:
         for i, tp in enumerate(test_points):
             point = Point(tp['x'], tp['y'])
             expected_location = tp['location']
-            actual_location = polygon.point_location(point)
+            actual_location = region.point_location(point)
             
             if expected_location != actual_location:
                 misclassified += 1
@@ -96,9 +110,10 @@ def validate_polygon(polygon_data: dict, verbose: bool = True) -> dict:
         
         # Add polygon info
         result['num_vertices'] = len(vertices)
+        result['num_holes'] = len(holes)
         result['num_test_points'] = len(test_points)
-        result['area'] = polygon.area()
-        result['is_convex'] = polygon.is_convex()
+        result['area'] = region.area()
+        result['is_convex'] = not holes and polygon.is_convex()
         
     except Exception as e:
         result['errors'].append(f"Error validating polygon: {str(e)}")